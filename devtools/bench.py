@@ -0,0 +1,294 @@
+"""
+Benchmark suite covering all media modes and pipeline stages.
+
+Renders a deterministic synthetic corpus (images of several sizes and color modes, long text,
+audio and video from ffmpeg lavfi sources, raw data and an MP7 signature) and measures latency
+percentiles, throughput, peak RSS and per-stage times (see `stage_timings`) for each benchmark
+case. Every case runs in a fresh worker process, so peak RSS is attributable to the case
+(`tool_rss` is the peak RSS of external tools like ffmpeg). Only the corpus files of the
+cases selected with `--filter` are rendered.
+
+Results are saved as JSON with `--output` and compared against a stored result with
+`--baseline`. Cases that are slower (median latency) than the threshold or produce different
+codes are reported and make the run exit with status 1.
+
+Usage:
+    python -m devtools.bench [--repeat N] [--filter TEXT] [--corpus DIR] [--output FILE]
+                             [--baseline FILE] [--threshold PERCENT]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
+from multiprocessing import get_context
+from pathlib import Path
+
+import numpy as np
+
+import iscc_sdk as idk
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+#: Words for deterministic synthetic text
+WORDS = (
+    "the of and to in is that for it as was with be by on not he this are or his from at which "
+    "but have an they you were her she there one all we their has been would will more if no "
+    "when what so said can who them some could him into its then two these time may only new "
+    "data code image audio video text content media signature similarity identifier standard"
+)
+
+#: Synthetic images (format, color mode, size)
+IMAGES = [
+    ("jpg", "RGB", 256),
+    ("jpg", "RGB", 1024),
+    ("jpg", "RGB", 4096),
+    ("jpg", "L", 1024),
+    ("jpg", "CMYK", 1024),
+    ("png", "RGBA", 1024),
+    ("png", "P", 1024),
+    ("webp", "RGB", 2048),
+    ("tif", "RGB", 2048),
+]
+
+#: Benchmark cases (name, function, corpus file, options)
+CASES = [
+    *[
+        (f"image-{fmt}-{mode.lower()}-{size}", "code_image", f"image-{mode}-{size}.{fmt}", {})
+        for fmt, mode, size in IMAGES
+    ],
+    ("image-jpg-rgb-4096-fast", "code_image", "image-RGB-4096.jpg", {"image_fast_decode": True}),
+    ("image-tif-rgb-2048-fast", "code_image", "image-RGB-2048.tif", {"image_fast_decode": True}),
+    ("text-100k", "code_text", "text-100k.txt", {}),
+    ("text-2m", "code_text", "text-2m.txt", {}),
+    ("audio-60s", "code_audio", "audio-60s.mp3", {}),
+    ("video-360p-30s", "code_video", "video-360p-30s.mp4", {}),
+    ("video-720p-10s", "code_video", "video-720p-10s.mp4", {}),
+    ("mp7-360p-30s", "read_mp7_signature", "video-360p-30s.mp7sig", {}),
+    ("ipfs-64m", "ipfs_cidv1", "data-64m.bin", {}),
+    ("ipfs-64m-parallel", "ipfs_cidv1", "data-64m.bin", {"workers": os.cpu_count()}),
+    ("sum-64m", "code_sum", "data-64m.bin", {}),
+    ("iscc-image", "code_iscc", "image-RGB-1024.jpg", {}),
+    ("iscc-text", "code_iscc", "text-100k.txt", {}),
+    ("iscc-audio", "code_iscc", "audio-60s.mp3", {}),
+    ("iscc-video", "code_iscc", "video-360p-30s.mp4", {}),
+]
+
+
+def make_image(fp, mode, size, seed):
+    # type: (Path, str, int, int) -> None
+    """Render a deterministic image with smooth color waves and noise."""
+    from PIL import Image
+
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:size, 0:size].astype(np.float32) / size
+    channels = []
+    for _ in range(3):
+        fx, fy, phase = rng.uniform(0.5, 6, 2).tolist() + [rng.uniform(0, 2 * np.pi)]
+        channels.append(0.5 + 0.4 * np.sin(2 * np.pi * (fx * x + fy * y) + phase))
+    pixels = np.stack(channels, axis=-1) + rng.normal(0, 0.05, (size, size, 3)).astype(np.float32)
+    img = Image.fromarray((np.clip(pixels, 0, 1) * 255).astype(np.uint8), "RGB")
+    if mode == "RGBA":
+        img.putalpha(Image.fromarray((x * 255).astype(np.uint8), "L"))
+    elif mode == "P":
+        img = img.convert("P", palette=Image.Palette.ADAPTIVE)
+    else:
+        img = img.convert(mode)
+    img.save(fp)
+
+
+def make_text(fp, nchars, seed):
+    # type: (Path, int, int) -> None
+    """Write deterministic pseudo text with sentences and paragraphs."""
+    rng = np.random.default_rng(seed)
+    vocabulary = WORDS.split()
+    parts, size = [], 0
+    while size < nchars:
+        words = [vocabulary[i] for i in rng.integers(0, len(vocabulary), rng.integers(5, 20))]
+        sentence = " ".join(words).capitalize() + (".\n\n" if rng.random() < 0.1 else ". ")
+        parts.append(sentence)
+        size += len(sentence)
+    fp.write_text("".join(parts)[:nchars], encoding="utf-8")
+
+
+def make_corpus(folder, names=None):
+    # type: (Path, set[str]|None) -> None
+    """Render files of the synthetic benchmark corpus (default: all, existing files are kept)."""
+    folder.mkdir(parents=True, exist_ok=True)
+    if names is not None and "video-360p-30s.mp7sig" in names:
+        names = names | {"video-360p-30s.mp4"}  # Signature is extracted from the video
+
+    def render(name, func, *args):
+        # type: (str, Callable, Any) -> None
+        fp = folder / name
+        if (names is None or name in names) and not fp.exists():
+            print(f"Rendering {name} ...")
+            tmp = fp.with_name(f"tmp-{name}")
+            func(tmp, *args)
+            tmp.replace(fp)
+
+    for seed, (fmt, mode, size) in enumerate(IMAGES):
+        render(f"image-{mode}-{size}.{fmt}", make_image, mode, size, seed)
+    render("text-100k.txt", make_text, 100_000, 1)
+    render("text-2m.txt", make_text, 2_000_000, 2)
+    render("data-64m.bin", lambda fp: fp.write_bytes(np.random.default_rng(3).bytes(64 << 20)))
+
+    audio = ["-f", "lavfi", "-i", "sine=frequency=440:duration=60"]
+    audio += ["-f", "lavfi", "-i", "anoisesrc=seed=4:amplitude=0.1:duration=60"]
+    audio += ["-filter_complex", "amix=inputs=2", "-c:a", "libmp3lame", "-f", "mp3"]
+    render("audio-60s.mp3", lambda fp: idk.run_ffmpeg(["-y"] + audio + [fp]))
+    for res, duration in (("640x360", 30), ("1280x720", 10)):
+        video = ["-f", "lavfi", "-i", f"testsrc2=size={res}:rate=25:duration={duration}"]
+        video += ["-vf", "hue=H=2*PI*t/5", "-c:v", "libx264", "-preset", "veryfast", "-f", "mp4"]
+        name = f"video-{res.split('x')[1]}p-{duration}s.mp4"
+        render(name, lambda fp, args=video: idk.run_ffmpeg(["-y"] + args + [fp]))
+    render(
+        "video-360p-30s.mp7sig",
+        lambda fp: fp.write_bytes(idk.video_mp7sig_extract(folder / "video-360p-30s.mp4")),
+    )
+
+
+def digest(result):
+    # type: (Any) -> str
+    """Short comparable digest of a benchmark result."""
+    if isinstance(result, str):
+        return result
+    if hasattr(result, "iscc"):
+        return result.iscc
+    return hashlib.sha256(repr(result).encode("utf-8")).hexdigest()[:16]
+
+
+def peak_rss():
+    # type: () -> tuple[float|None, float|None]
+    """Peak RSS in MB of this process and of its terminated child processes."""
+    if resource is None:
+        return None, None
+    scale = 1 / 1024**2 if sys.platform == "darwin" else 1 / 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale
+    # Linux keeps the high-water mark of the parent process across exec in `ru_maxrss`
+    if os.path.exists("/proc/self/status"):
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    own = int(line.split()[1]) / 1024
+    return round(own, 1), round(children, 1)
+
+
+def run_case(func_name, fp, options, repeat):
+    # type: (str, str, dict, int) -> dict
+    """Run a benchmark case (in a fresh worker process)."""
+    func = getattr(idk, func_name)
+    arg = Path(fp).read_bytes() if func_name == "read_mp7_signature" else fp
+    try:
+        result = func(arg, **options)  # warmup (imports, caches, tool installation)
+        latencies, stages = [], {}  # type: list[float], dict[str, float]
+        for _ in range(repeat):
+            with idk.stage_timings() as timings:
+                start = time.perf_counter()
+                result = func(arg, **options)
+                latencies.append(time.perf_counter() - start)
+            for name, duration in timings.items():
+                stages[name] = stages.get(name, 0.0) + duration / repeat
+    except Exception:
+        return dict(error=traceback.format_exc(limit=-1).strip().splitlines()[-1])
+    rss, tool_rss = peak_rss()
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99]).tolist()
+    mb = os.path.getsize(fp) / 1024**2
+    return dict(
+        digest=digest(result),
+        size_mb=round(mb, 3),
+        p50=p50,
+        p90=p90,
+        p99=p99,
+        max=max(latencies),
+        mb_per_s=mb / float(np.mean(latencies)),
+        rss_mb=rss,
+        tool_rss_mb=tool_rss,
+        stages=stages,
+    )
+
+
+def compare(results, baseline, threshold):
+    # type: (dict, dict, float) -> list[str]
+    """Compare results against baseline and return regressions."""
+    regressions = []
+    print(f"\n{'case':<24} {'base p50':>9} {'p50':>9} {'change':>8}  status")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None or "error" in base or "error" in result:
+            continue
+        change = (result["p50"] / base["p50"] - 1) * 100
+        status = "ok"
+        if result["digest"] != base["digest"]:
+            status = f"CHANGED {base['digest']} -> {result['digest']}"
+        elif change > threshold:
+            status = "SLOWER"
+        if status != "ok":
+            regressions.append(f"{name}: {status}")
+        print(f"{name:<24} {base['p50']:9.4f} {result['p50']:9.4f} {change:+7.1f}%  {status}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repeat", type=int, default=5, help="Measured runs per case")
+    parser.add_argument("--filter", default="", help="Only run cases containing this text")
+    parser.add_argument("--corpus", type=Path, help="Corpus folder (default: temporary)")
+    parser.add_argument("--output", type=Path, help="Save results as JSON")
+    parser.add_argument("--baseline", type=Path, help="Compare with saved results")
+    parser.add_argument("--threshold", type=float, default=20, help="Allowed slowdown in %")
+    args = parser.parse_args()
+
+    cases = [case for case in CASES if args.filter in case[0]]
+    with tempfile.TemporaryDirectory() as tempdir:
+        corpus = args.corpus or Path(tempdir)
+        make_corpus(corpus, {filename for _, _, filename, _ in cases})
+
+        results = {}
+        print(f"{'case':<24} {'p50':>9} {'p90':>9} {'MB/s':>9} {'rss':>7} {'tools':>7}  stages")
+        for name, func_name, filename, options in cases:
+            with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as executor:
+                fp = (corpus / filename).as_posix()
+                result = executor.submit(run_case, func_name, fp, options, args.repeat).result()
+            results[name] = result
+            if "error" in result:
+                print(f"{name:<24} ERROR {result['error']}")
+                continue
+            stages = " ".join(f"{k}={v:.3f}" for k, v in sorted(result["stages"].items()))
+            print(
+                f"{name:<24} {result['p50']:9.4f} {result['p90']:9.4f} {result['mb_per_s']:9.1f}"
+                f" {result['rss_mb'] or 0:7.0f} {result['tool_rss_mb'] or 0:7.0f}  {stages}"
+            )
+
+    if args.output:
+        info = dict(
+            sdk=idk.__version__,
+            python=platform.python_version(),
+            platform=platform.platform(),
+            cpus=os.cpu_count(),
+            created=datetime.now(UTC).isoformat(timespec="seconds"),
+        )
+        data = dict(info=info, results=results)
+        args.output.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("\nRegressions:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
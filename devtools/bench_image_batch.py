@@ -0,0 +1,97 @@
+"""
+Benchmark batched Image-Code generation for many small images.
+
+Renders a deterministic set of small images (like thumbnails or icons) and compares generating
+Image-Codes one by one with `code_image` against `code_image_batch`. Images are hashed as
+in-memory Pillow images and as files in a temporary folder.
+
+Usage:
+    python -m devtools.bench_image_batch [--count N] [--size PIXELS] [--bits BITS] [--repeat N]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import iscc_lib as il
+import numpy as np
+from PIL import Image
+
+import iscc_sdk as idk
+
+
+def make_images(count, size):
+    # type: (int, int) -> list[Image.Image]
+    """Render deterministic small RGB images with smooth color waves and noise."""
+    rng = np.random.default_rng(count)
+    y, x = np.mgrid[0:size, 0:size].astype(np.float32) / size
+    images = []
+    for _ in range(count):
+        phase = rng.uniform(0, 6, 3)
+        pixels = np.stack([np.sin(6 * x + p) * np.cos(4 * y - p) for p in phase], axis=-1)
+        pixels = (pixels + 1) * 100 + rng.normal(0, 10, (size, size, 3))
+        images.append(Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8), "RGB"))
+    return images
+
+
+def single_objects(images, bits):
+    # type: (list[Image.Image], int) -> list[str]
+    """Image-Codes of in-memory images one by one."""
+    return [il.gen_image_code_v0(idk.image_normalize(img), bits=bits)["iscc"] for img in images]
+
+
+def single_files(paths, bits):
+    # type: (list[Path], int) -> list[str]
+    """Image-Codes of image files one by one."""
+    opts = dict(extract_meta=False, create_thumb=False, bits=bits)
+    return [idk.code_image(fp, **opts).iscc for fp in paths]
+
+
+def batch(items, bits):
+    # type: (list, int) -> list[str]
+    """Image-Codes with `code_image_batch`."""
+    return [meta.iscc for meta in idk.code_image_batch(items, bits=bits)]
+
+
+def timed(func, items, bits, repeat):
+    # type: (Callable, list, int, int) -> tuple[float, list[str]]
+    """Best wall time in seconds and result."""
+    best, result = float("inf"), []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(items, bits)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--count", type=int, default=2000, help="Number of images")
+    parser.add_argument("--size", type=int, default=64, help="Image size in pixels")
+    parser.add_argument("--bits", type=int, default=64, help="Bit-length of Image-Codes")
+    parser.add_argument("--repeat", type=int, default=3, help="Measured runs (best is reported)")
+    args = parser.parse_args()
+
+    images = make_images(args.count, args.size)
+    with tempfile.TemporaryDirectory() as tempdir:
+        paths = []
+        for i, img in enumerate(images):
+            paths.append(Path(tempdir) / f"image-{i:05d}.png")
+            img.save(paths[-1])
+
+        print(f"{'input':<8} {'single s':>9} {'batch s':>9} {'speedup':>8} {'images/s':>10}  same")
+        for name, single, items in (
+            ("objects", single_objects, images),
+            ("files", single_files, paths),
+        ):
+            t_single, expected = timed(single, items, args.bits, args.repeat)
+            t_batch, result = timed(batch, items, args.bits, args.repeat)
+            print(
+                f"{name:<8} {t_single:9.3f} {t_batch:9.3f} {t_single / t_batch:8.2f}"
+                f" {args.count / t_batch:10,.0f}  {result == expected}"
+            )
+
+
+if __name__ == "__main__":
+    main()
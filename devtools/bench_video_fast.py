@@ -0,0 +1,89 @@
+"""
+Benchmark fast video decode mode against default decoding.
+
+Reports wall time and speedup of Video-Code generation with `video_fast_decode` and of
+thumbnail extraction with `video_keyframe_thumbnail`, plus the Hamming distance between the
+default and the fast Video-Code (64 bit) for each video. Without arguments a synthetic 4K test
+video is rendered (long-GOP H.264 with B-frames and deblocking, like typical distribution
+content).
+
+Usage:
+    python -m devtools.bench_video_fast [--duration SECONDS] [VIDEOFILE ...]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import iscc_lib as il
+
+import iscc_sdk as idk
+
+
+def make_video(fp, duration):
+    # type: (Path, int) -> None
+    """Render a synthetic 4K test video with moving content and periodic color changes."""
+    args = ["-y", "-f", "lavfi", "-i", f"testsrc2=size=3840x2160:rate=25:duration={duration}"]
+    args += ["-f", "lavfi", "-i", "mandelbrot=size=3840x2160:rate=25", "-t", str(duration)]
+    args += ["-filter_complex", "[0:v][1:v]blend=all_mode=average,hue=H=2*PI*t/6"]
+    args += ["-c:v", "libx264", "-preset", "veryfast", fp]
+    idk.run_ffmpeg(args)
+
+
+def distance(a, b):
+    # type: (str, str) -> int
+    """Hamming distance between the bodies of two ISCC codes."""
+    body_a, body_b = il.iscc_decode(a)[-1], il.iscc_decode(b)[-1]
+    return (int.from_bytes(body_a, "big") ^ int.from_bytes(body_b, "big")).bit_count()
+
+
+def timed(func, *args, **kwargs):
+    # type: (Callable, Any, Any) -> tuple[float, Any]
+    """Call function and return wall time and result."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def bench(fp):
+    # type: (str|Path) -> None
+    """Compare default and fast decoding for a single video."""
+    options = dict(extract_meta=False, create_thumb=False, video_single_pass=False)
+    idk.sdk_opts.video_fast_decode = False
+    idk.sdk_opts.video_keyframe_thumbnail = False
+    t_default, default = timed(idk.code_video, fp, **options)
+    t_thumb, _ = timed(idk.video_thumbnail, fp)
+    idk.sdk_opts.video_fast_decode = True
+    idk.sdk_opts.video_keyframe_thumbnail = True
+    t_fast, fast = timed(idk.code_video, fp, **options)
+    t_thumb_key, _ = timed(idk.video_thumbnail, fp)
+
+    name = Path(fp).name
+    dist = distance(default.iscc, fast.iscc)
+    print(f"{name:<24} {t_default:8.2f} {t_fast:8.2f} {t_default / t_fast:8.2f} {dist:5d}", end="")
+    print(f" {t_thumb:8.2f} {t_thumb_key:8.2f}  {default.iscc} {fast.iscc}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("videos", nargs="*", help="Video files (default: synthetic 4K video)")
+    parser.add_argument("--duration", type=int, default=10, help="Synthetic video duration")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        videos = args.videos
+        if not videos:
+            fp = Path(tempdir, "bench-4k.mp4")
+            print(f"Rendering {args.duration}s synthetic 4K test video ...")
+            make_video(fp, args.duration)
+            videos = [fp]
+
+        print(f"{'video':<24} {'default':>8} {'fast':>8} {'speedup':>8} {'bits':>5}", end="")
+        print(f" {'thumb':>8} {'thumbkey':>8}  codes")
+        for fp in videos:
+            bench(fp)
+
+
+if __name__ == "__main__":
+    main()
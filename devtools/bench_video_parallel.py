@@ -0,0 +1,74 @@
+"""
+Benchmark segment-parallel MP7 signature extraction against sequential extraction.
+
+Generates a synthetic test video (or uses a given one) and reports wall time, speedup and
+result deviation for increasing numbers of ffmpeg workers.
+
+Usage:
+    python -m devtools.bench_video_parallel [--duration SECONDS] [--workers N] [VIDEOFILE]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import iscc_lib as il
+import numpy as np
+
+import iscc_sdk as idk
+
+
+def make_video(fp, duration):
+    # type: (Path, int) -> None
+    """Render a synthetic 720p test video with moving content and periodic scene changes."""
+    src = f"testsrc2=size=1280x720:rate=25:duration={duration}"
+    args = ["-y", "-f", "lavfi", "-i", src, "-vf", "hue=H=2*PI*t/10", "-c:v", "libx264", fp]
+    idk.run_ffmpeg(args)
+
+
+def compare(seq, par):
+    # type: (idk.FrameSignatures, idk.FrameSignatures) -> tuple[int, float]
+    """Return frame count difference and mean ratio of differing vector elements."""
+    n = min(len(seq), len(par))
+    return len(par) - len(seq), float(np.mean(seq.vectors[:n] != par.vectors[:n]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("video", nargs="?", help="Video file (default: synthetic test video)")
+    parser.add_argument("--duration", type=int, default=600, help="Synthetic video duration")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Max workers")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        fp = args.video
+        if fp is None:
+            fp = Path(tempdir, "bench.mp4")
+            print(f"Rendering {args.duration}s synthetic test video ...")
+            make_video(fp, args.duration)
+
+        start = time.perf_counter()
+        seq = idk.decode_mp7_signature(idk.video_mp7sig_extract(fp))
+        seq_time = time.perf_counter() - start
+        seq_code = il.gen_video_code_v0(seq.vectors.tolist())["iscc"]
+        print(f"{'workers':>8} {'seconds':>8} {'speedup':>8} {'frames':>7} {'diff':>8}  code")
+        print(f"{'seq':>8} {seq_time:8.2f} {1:8.2f} {0:7d} {0:8.5f}  {seq_code}")
+
+        workers = 2
+        while workers <= args.workers:
+            start = time.perf_counter()
+            par, _ = idk.video_frames_extract_parallel(fp, workers=workers)
+            par_time = time.perf_counter() - start
+            par_code = il.gen_video_code_v0(par.vectors.tolist())["iscc"]
+            nframes, diff = compare(seq, par)
+            speedup = seq_time / par_time
+            print(
+                f"{workers:8d} {par_time:8.2f} {speedup:8.2f} {nframes:7d} {diff:8.5f}  {par_code}"
+            )
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,218 @@
-"""ISCC - Software Development Kit."""
+"""
+ISCC - Software Development Kit.
 
+The public API is exposed as a flat namespace (e.g. `idk.code_iscc`). Submodules are imported on
+first access of one of their names (PEP 562), so `import iscc_sdk` stays fast and heavy media
+libraries are only loaded by the processing functions that need them.
+"""
+
+import importlib
 import os
-from importlib import metadata
 from platformdirs import PlatformDirs
 
 
-__version__ = metadata.version("iscc-sdk")
 APP_NAME = "iscc-sdk"
 APP_AUTHOR = "iscc"
 dirs = PlatformDirs(appname=APP_NAME, appauthor=APP_AUTHOR)
 os.makedirs(dirs.user_data_dir, exist_ok=True)
 os.environ["LOGURU_AUTOINIT"] = "False"
 
-import pillow_avif
-
-# Import full api to toplevel
-from iscc_sdk.monkeys import *
-from iscc_sdk.compat import *
-from iscc_sdk.options import *
-from iscc_sdk.tools import *
-from iscc_sdk.mediatype import *
-from iscc_sdk.container import *
-from iscc_sdk.image import *
-from iscc_sdk.svg import *
-from iscc_sdk.main import *
-from iscc_sdk.text import *
-from iscc_sdk.ipfs import *
-from iscc_sdk.audio import *
-from iscc_sdk.video import *
-from iscc_sdk.mp7 import *
-from iscc_sdk.exceptions import *
-from iscc_sdk.metadata import *
-from iscc_sdk.pdf import *
-from iscc_sdk.epub import *
-from iscc_sdk.docx_ import *
-from iscc_sdk.thumbnail import *
-from iscc_sdk.utils import *
+# Public API by submodule (imported on first access)
+_lazy = {
+    "compat": ("BICUBIC", "LANCZOS"),
+    "options": (
+        "SdkOptions",
+        "SdkOptionsSnapshot",
+        "core_opts",
+        "opts_get",
+        "opts_scope",
+        "opts_scoped",
+        "sdk_opts",
+    ),
+    "tools": (
+        "ProcessGroup",
+        "install",
+        "run_ffmpeg",
+        "run_ffmpeg_pipes",
+        "run_ffprobe",
+        "run_fpcalc",
+    ),
+    "mediatype": (
+        "SUPPORTED_EXTENSIONS",
+        "SUPPORTED_MEDIATYPES",
+        "mediatype_and_mode",
+        "mediatype_clean",
+        "mediatype_from_data",
+        "mediatype_from_name",
+        "mediatype_guess",
+        "mediatype_normalize",
+        "mediatype_supported",
+        "mediatype_to_mode",
+    ),
+    "asset": ("Asset", "asset_open"),
+    "stages": ("stage", "stage_hook_add", "stage_hook_remove", "stage_timings"),
+    "pool": (
+        "batch_executor_get",
+        "executor_get",
+        "executor_set",
+        "executor_shutdown",
+        "executor_submit",
+    ),
+    "cache": (
+        "asset_datahash",
+        "cache_clear",
+        "cache_get",
+        "cache_key",
+        "cache_put",
+        "cache_stats",
+        "feature_clear",
+        "feature_memo",
+        "feature_stats",
+    ),
+    "container": ("process_container", "register_container_processor"),
+    "image": (
+        "image_decode",
+        "image_exif_transpose",
+        "image_fill_transparency",
+        "image_meta_delete",
+        "image_meta_embed",
+        "image_meta_extract",
+        "image_normalize",
+        "image_normalize_bytes",
+        "image_open",
+        "image_strip_metadata",
+        "image_thumbnail",
+        "image_to_data_url",
+        "image_trim_border",
+    ),
+    "svg": (
+        "svg_meta_delete",
+        "svg_meta_embed",
+        "svg_meta_extract",
+        "svg_rasterize",
+        "svg_thumbnail",
+    ),
+    "main": (
+        "code_audio",
+        "code_content",
+        "code_data",
+        "code_image",
+        "code_image_batch",
+        "code_image_semantic",
+        "code_instance",
+        "code_iscc",
+        "code_iscc_batch",
+        "code_meta",
+        "code_sum",
+        "code_text",
+        "code_text_semantic",
+        "code_video",
+    ),
+    "aio": (
+        "acode_audio",
+        "acode_content",
+        "acode_data",
+        "acode_image",
+        "acode_image_semantic",
+        "acode_instance",
+        "acode_iscc",
+        "acode_meta",
+        "acode_sum",
+        "acode_text",
+        "acode_text_semantic",
+        "acode_video",
+        "arun_ffmpeg",
+        "arun_ffprobe",
+        "arun_fpcalc",
+    ),
+    "text": (
+        "text_chunks",
+        "text_extract",
+        "text_features",
+        "text_meta_embed",
+        "text_meta_extract",
+        "text_name_from_uri",
+        "text_parse",
+        "text_sanitize",
+        "text_thumbnail",
+    ),
+    "ipfs": ("IpfsHasher", "ipfs_cidv1", "ipfs_cidv1_base16"),
+    "audio": (
+        "audio_features_extract",
+        "audio_meta_embed",
+        "audio_meta_extract",
+        "audio_thumbnail",
+    ),
+    "video": (
+        "video_compute_granular",
+        "video_extract",
+        "video_features_extract",
+        "video_frames_extract_parallel",
+        "video_meta_embed",
+        "video_meta_extract",
+        "video_mp7sig_extract",
+        "video_mp7sig_extract_scenes",
+        "video_parse_scenes",
+        "video_thumbnail",
+    ),
+    "mp7": ("Frame", "FrameSignatures", "decode_mp7_signature", "read_mp7_signature"),
+    "exceptions": (
+        "IsccError",
+        "IsccExtractionError",
+        "IsccThumbExtractionError",
+        "IsccUnsupportedMediatype",
+        "EnvironmentError",
+    ),
+    "metadata": ("IsccMeta", "embed_metadata", "extract_metadata"),
+    "pdf": ("pdf_meta_embed", "pdf_text_extract", "pdf_thumbnail"),
+    "epub": ("epub_cover", "epub_meta_embed", "epub_thumbnail"),
+    "docx_": ("docx_meta_embed",),
+    "_thumbnail": ("thumbnail",),
+    "utils": ("DownloadFile", "TempFile", "is_installed", "is_url", "timer"),
+}
+
+_exports = {name: module for module, names in _lazy.items() for name in names}
+
+# Names that leaked into the namespace by star-imports (deprecated, not part of the public API)
+_deprecated = {
+    "Epub2": "monkeys",
+    "ebookmeta": "monkeys",
+    "pillow_avif": "compat",
+    "set_author_list": "monkeys",
+    "set_description": "monkeys",
+    "set_metadata": "monkeys",
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    # type: (str) -> Any
+    """Import public API and submodules on first access."""
+    module = _exports.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    elif name == "__version__":
+        from importlib import metadata
+
+        value = metadata.version("iscc-sdk")
+    elif name in _lazy or name in ("cli", "monkeys"):
+        return importlib.import_module(f"{__name__}.{name}")
+    elif name in _deprecated:
+        import warnings
+
+        warnings.warn(
+            f"{__name__}.{name} is deprecated and will be removed in a future version",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return getattr(importlib.import_module(f"{__name__}.{_deprecated[name]}"), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    # type: () -> list[str]
+    return sorted(set(globals()) | set(_exports))
@@ -0,0 +1,29 @@
+"""*Generate thumbnails for media assets*"""
+
+import iscc_sdk as idk
+
+__all__ = [
+    "thumbnail",
+]
+
+# Thumbnailer names by perceptual mode (resolved on use to keep media libraries lazy)
+THUMBNAILERS = {
+    "image": "image_thumbnail",
+    "video": "video_thumbnail",
+    "text": "text_thumbnail",
+    "audio": "audio_thumbnail",
+}
+
+
+def thumbnail(fp):
+    # type: (str|Path|idk.Asset) -> Image.Image|None
+    """
+    Create a thumbnail for a media asset.
+
+    :param fp: Filepath to media file or `Asset` processing context.
+    :return: Thumbnail image as PIL Image object
+    """
+    asset = idk.asset_open(fp)
+    thumbnailer = THUMBNAILERS.get(str(asset.mode))
+    if thumbnailer:
+        return getattr(idk, thumbnailer)(asset)
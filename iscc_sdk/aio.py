@@ -0,0 +1,186 @@
+"""
+*Asyncio API*
+
+Async counterparts of the `code_*` functions and external tool runners for use with asyncio.
+
+The `acode_*` functions run the processing pipeline on the shared worker pool (see
+`executor_get`, sized with the `pool_workers` option) so that many concurrent jobs can be awaited
+from one event loop with a bounded number of threads. When an `acode_*` call is cancelled, all
+external tool processes (ffmpeg, ffprobe, fpcalc) started by the call are killed.
+
+!!! note
+    Cancellation does not interrupt in-flight Python work of an `acode_*` call (like hashing or
+    image processing). It runs to completion on the worker pool and keeps its pool slot until
+    then - only the result is discarded. Only `arun_ffmpeg`, `arun_ffprobe` and `arun_fpcalc`
+    run their tool as non-blocking asyncio subprocess without a worker thread.
+
+!!! example
+    ```python
+    import asyncio
+    import iscc_sdk as idk
+
+
+    async def main(paths):
+        results = await asyncio.gather(*(idk.acode_iscc(fp) for fp in paths))
+        for result in results:
+            print(result.iscc)
+
+
+    asyncio.run(main(["image.jpg", "video.mp4"]))
+    ```
+"""
+
+import asyncio
+import subprocess  # nosec B404 - running external tools (ffmpeg, fpcalc, ipfs) is core SDK scope
+from contextlib import suppress
+from contextvars import copy_context
+from functools import partial
+
+import iscc_sdk as idk
+from iscc_sdk import tools
+
+__all__ = [
+    "acode_audio",
+    "acode_content",
+    "acode_data",
+    "acode_image",
+    "acode_image_semantic",
+    "acode_instance",
+    "acode_iscc",
+    "acode_meta",
+    "acode_sum",
+    "acode_text",
+    "acode_text_semantic",
+    "acode_video",
+    "arun_ffmpeg",
+    "arun_ffprobe",
+    "arun_fpcalc",
+]
+
+
+async def acode_iscc(fp, name=None, description=None, meta=None, **options):
+    # type: (str|Path, str|None, str|None, str|dict|None, Any) -> idk.IsccMeta
+    """Async version of `code_iscc`."""
+    return await _run_sync(idk.code_iscc, fp, name, description, meta, **options)
+
+
+async def acode_meta(fp, name=None, description=None, meta=None, **options):
+    # type: (str|Path, str|None, str|None, str|dict|None, Any) -> idk.IsccMeta
+    """Async version of `code_meta`."""
+    return await _run_sync(idk.code_meta, fp, name, description, meta, **options)
+
+
+async def acode_content(fp, **options):
+    # type: (str|Path, Any) -> idk.IsccMeta
+    """Async version of `code_content`."""
+    return await _run_sync(idk.code_content, fp, **options)
+
+
+async def acode_text(fp, text=None, **options):
+    # type: (str|Path, str|None, Any) -> idk.IsccMeta
+    """Async version of `code_text`."""
+    return await _run_sync(idk.code_text, fp, text, **options)
+
+
+async def acode_text_semantic(fp, text=None, **options):  # pragma: no cover
+    # type: (str|Path, str|None, Any) -> idk.IsccMeta
+    """Async version of `code_text_semantic`."""
+    return await _run_sync(idk.code_text_semantic, fp, text, **options)
+
+
+async def acode_image(fp, **options):
+    # type: (str|Path, Any) -> idk.IsccMeta
+    """Async version of `code_image`."""
+    return await _run_sync(idk.code_image, fp, **options)
+
+
+async def acode_image_semantic(fp, **options):  # pragma: no cover
+    # type: (str|Path, Any) -> idk.IsccMeta
+    """Async version of `code_image_semantic`."""
+    return await _run_sync(idk.code_image_semantic, fp, **options)
+
+
+async def acode_audio(fp, **options):
+    # type: (str|Path, Any) -> idk.IsccMeta
+    """Async version of `code_audio`."""
+    return await _run_sync(idk.code_audio, fp, **options)
+
+
+async def acode_video(fp, **options):
+    # type: (str|Path, Any) -> idk.IsccMeta
+    """Async version of `code_video`."""
+    return await _run_sync(idk.code_video, fp, **options)
+
+
+async def acode_data(fp, **options):
+    # type: (str|Path, Any) -> idk.IsccMeta
+    """Async version of `code_data`."""
+    return await _run_sync(idk.code_data, fp, **options)
+
+
+async def acode_instance(fp, **options):
+    # type: (str|Path, Any) -> idk.IsccMeta
+    """Async version of `code_instance`."""
+    return await _run_sync(idk.code_instance, fp, **options)
+
+
+async def acode_sum(fp, **options):
+    # type: (str|Path, Any) -> idk.IsccMeta
+    """Async version of `code_sum`."""
+    return await _run_sync(idk.code_sum, fp, **options)
+
+
+async def arun_ffmpeg(args):
+    # type: (list[str|Path]) -> subprocess.CompletedProcess
+    """Async version of `run_ffmpeg`. Kills ffmpeg if cancelled."""
+    return await _arun(tools.ffmpeg_bin, tools.ffmpeg_install, args)
+
+
+async def arun_ffprobe(args):  # pragma: no cover
+    # type: (list[str|Path]) -> subprocess.CompletedProcess
+    """Async version of `run_ffprobe`. Kills ffprobe if cancelled."""
+    return await _arun(tools.ffprobe_bin, tools.ffprobe_install, args)
+
+
+async def arun_fpcalc(args):  # pragma: no cover
+    # type: (list[str|Path]) -> subprocess.CompletedProcess
+    """Async version of `run_fpcalc`. Kills fpcalc if cancelled."""
+    return await _arun(tools.fpcalc_bin, tools.fpcalc_install, args)
+
+
+async def _run_sync(func, *args, **kwargs):
+    # type: (Callable, Any, Any) -> Any
+    """Run blocking function on the shared worker pool and kill its tool processes on cancel."""
+    loop = asyncio.get_running_loop()
+    group = idk.ProcessGroup()
+    call = partial(copy_context().run, group.run, func, *args, **kwargs)
+    future = loop.run_in_executor(idk.executor_get(), call)
+    try:
+        return await future
+    except asyncio.CancelledError:
+        group.kill()
+        raise
+
+
+async def _arun(binary, install, args):
+    # type: (Callable[[], str], Callable[[], str], list[str|Path]) -> subprocess.CompletedProcess
+    """Run external tool as asyncio subprocess with captured output (raises on failure)."""
+    if not tools.is_installed(binary()):  # pragma: no cover
+        await asyncio.get_running_loop().run_in_executor(None, install)
+    cmd = [binary()] + [str(a) for a in args]
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await proc.communicate()
+    except BaseException:
+        with suppress(ProcessLookupError):
+            proc.kill()
+        await asyncio.shield(proc.wait())
+        raise
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stdout, stderr)
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
@@ -0,0 +1,152 @@
+"""*Per-asset processing context*."""
+
+import os
+import threading
+from functools import cached_property
+from pathlib import Path
+
+import iscc_sdk as idk
+
+__all__ = [
+    "Asset",
+    "asset_open",
+]
+
+
+class Asset:
+    """
+    Processing context for a single media asset.
+
+    Probes the file once and caches the results (header bytes, file status, mediatype and
+    processing mode) so that all processing stages of one asset can share them. Expensive
+    intermediate results (like a parsed document) are shared between stages via `Asset.memo`.
+    An `Asset` can be passed to any function that accepts a filepath (it implements
+    `os.PathLike`).
+
+    !!! example
+        ```python
+        import iscc_sdk as idk
+
+        asset = idk.asset_open("image.jpg")
+        meta = idk.image_meta_extract(asset)
+        thumb = idk.image_thumbnail(asset)
+        ```
+    """
+
+    def __init__(self, fp, file_name=None):
+        # type: (str|Path, str|None) -> None
+        """
+        :param fp: Filepath to media file.
+        :param file_name: Custom filename for MIME type guessing (overrides actual filename).
+        """
+        self.path = Path(fp)
+        self.file_name = file_name or self.path.name
+        self._head = None  # type: bytes|None
+        self._stat = None  # type: os.stat_result|None
+        self._mode = None  # type: str|None
+        self.cache = {}  # type: dict[str, Any]
+        self._lock = threading.Lock()
+        self._locks = {}  # type: dict[str, threading.Lock]
+
+    def __fspath__(self):
+        # type: () -> str
+        return os.fspath(self.path)
+
+    def __repr__(self):
+        # type: () -> str
+        return f"Asset({self.path.as_posix()!r})"
+
+    def _probe(self):
+        # type: () -> None
+        """Read header bytes and file status with a single open."""
+        with open(self.path, "rb") as infile:
+            self._stat = os.fstat(infile.fileno())
+            self._head = infile.read(4096)
+
+    @property
+    def head(self):
+        # type: () -> bytes
+        """First 4096 bytes of the file (used for content sniffing)."""
+        if self._head is None:
+            self._probe()
+        return self._head  # type: ignore[return-value]
+
+    @property
+    def stat(self):
+        # type: () -> os.stat_result
+        """File status as returned by `os.stat`."""
+        if self._stat is None:
+            self._probe()
+        return self._stat  # type: ignore[return-value]
+
+    @cached_property
+    def mediatype(self):
+        # type: () -> str
+        """Mediatype detected from header bytes and filename."""
+        return idk.mediatype_guess(self.head, file_name=self.file_name)
+
+    @property
+    def mode(self):
+        # type: () -> str
+        """
+        Perceptual processing mode of the asset.
+
+        :raise IsccUnsupportedMediatype: if no matching processing mode was found.
+        """
+        if self._mode is None:
+            try:
+                self._mode = idk.mediatype_to_mode(self.mediatype)
+            except idk.IsccUnsupportedMediatype:
+                raise idk.IsccUnsupportedMediatype(
+                    f"Unsupported mediatype {self.mediatype} for {self.path.name}"
+                )
+        return self._mode
+
+    def memo(self, key, func, *args, **kwargs):
+        # type: (str, Callable, Any, Any) -> Any
+        """
+        Compute `func(*args, **kwargs)` once per asset and `key` and cache the result.
+
+        Concurrent callers with the same `key` wait for the first computation to finish.
+
+        :param key: Cache key for the result
+        :param func: Function that computes the result
+        :return: Cached or computed result
+        """
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self.cache:
+                self.cache[key] = func(*args, **kwargs)
+            return self.cache[key]
+
+    def release(self, key):
+        # type: (str) -> None
+        """
+        Drop a cached result (closing it if it has a `close` method, like decoded images).
+
+        :param key: Cache key of the result
+        """
+        with self._lock:
+            value = self.cache.pop(key, None)
+        if hasattr(value, "close"):
+            value.close()
+
+
+def asset_open(fp, file_name=None):
+    # type: (str|Path|Asset, str|None) -> Asset
+    """
+    Get a processing context for a media asset.
+
+    Returns `fp` unchanged if it already is an `Asset` (with a matching `file_name`), so that
+    processing functions can share probing results when called with the same context.
+
+    :param fp: Filepath or `Asset`
+    :param file_name: Custom filename for MIME type guessing (overrides actual filename).
+    :return: Processing context for the asset
+    """
+    if isinstance(fp, Asset):
+        if file_name is None or file_name == fp.file_name:
+            return fp
+        return Asset(fp.path, file_name=file_name)
+    return Asset(fp, file_name=file_name)
@@ -10,6 +10,7 @@ from loguru import logger as log
 from PIL import Image, ImageEnhance
 
 import iscc_sdk as idk
+from iscc_sdk import compat  # noqa: F401 - Pillow plugins and limits
 
 __all__ = [
     "audio_features_extract",
@@ -52,7 +53,7 @@ def audio_thumbnail(fp):
     tempdir = Path(tempfile.mkdtemp())
     tempimg = tempdir / "cover.jpg"
     cmd = ["-i", fp, "-an", "-vcodec", "copy", tempimg]
-    size = idk.sdk_opts.image_thumbnail_size
+    size = idk.opts_get().image_thumbnail_size
     try:
         idk.run_ffmpeg(cmd)
         img = Image.open(tempimg)
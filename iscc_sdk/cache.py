@@ -0,0 +1,352 @@
+"""
+*Persistent result cache and feature store*
+
+Opt-in local cache for `code_iscc` results (enable with the `cache` option). Results are stored
+in a SQLite database keyed by file identity (file name, device, inode, size and modification
+time - plus a full content hash with the `cache_datahash` option), the effective SDK options,
+the call arguments and the SDK version. A renamed or changed file, changed options or a new SDK
+version is a cache miss (the file name may determine the Meta-Code). Least recently used results
+are evicted once the stored results exceed `cache_max_size` bytes.
+
+The cache can be shared by multiple threads and processes (e.g. the workers of
+`code_iscc_batch`). Lookups are plain reads that do not block each other. Hit/miss statistics
+and access times of lookups are recorded in batches (best effort). Side effects of processing
+(like stored MP7 signature files) are not repeated for cached results.
+
+The opt-in feature store (enable with the `feature_store` option) keeps expensive intermediate
+features (MP7 frame signatures and scenes, chromaprint fingerprints, cleaned text and normalized
+image pixels) keyed by the datahash of the asset and the options they depend on. Content-Codes
+can then be re-derived (e.g. with other `bits`) without decoding the media file again. Like
+cached results, stored features do not repeat processing side effects.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from blake3 import blake3
+from loguru import logger as log
+
+import iscc_sdk as idk
+
+__all__ = [
+    "asset_datahash",
+    "cache_clear",
+    "cache_get",
+    "cache_key",
+    "cache_put",
+    "cache_stats",
+    "feature_clear",
+    "feature_memo",
+    "feature_stats",
+]
+
+#: Options that do not affect processing results
+CACHE_IGNORED_OPTIONS = {
+    "add_timings",
+    "cache",
+    "cache_path",
+    "cache_max_size",
+    "cache_datahash",
+    "feature_store",
+    "feature_store_path",
+    "feature_store_max_size",
+    "pool_workers",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed);
+CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+INSERT OR IGNORE INTO stats VALUES ('size', 0), ('hits', 0), ('misses', 0);
+"""
+
+#: Number of lookups after which a process records its pending hit/miss statistics
+STATS_BATCH_SIZE = 32
+
+_local = threading.local()
+_stats_lock = threading.Lock()
+_stats_pending = {}  # type: dict[tuple[int, str], dict]
+
+
+def cache_key(fp, opts=None, *args):
+    # type: (str|Path|idk.Asset, idk.SdkOptions|None, Any) -> str
+    """
+    Compute cache key for processing a file with the given options and arguments.
+
+    :param fp: Filepath or `Asset` processing context
+    :param opts: Effective SDK options (default: current options)
+    :param args: Additional JSON serializable arguments that affect the result
+    :return: Cache key (hex)
+    """
+    asset = idk.asset_open(fp)
+    opts = opts or idk.opts_get()
+    st = asset.stat
+    # File names determine the mediatype and the Meta-Code name (if not embedded in the file)
+    names = [asset.path.name, asset.file_name]
+    identity = [*names, st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns]
+    if opts.cache_datahash:
+        identity.append(asset_datahash(asset))
+    settings = opts.model_dump(exclude=CACHE_IGNORED_OPTIONS)
+    material = json.dumps([identity, settings, args, idk.__version__], sort_keys=True, default=str)
+    return blake3(material.encode("utf-8")).hexdigest()
+
+
+def cache_get(key, opts=None):
+    # type: (str, idk.SdkOptions|None) -> idk.IsccMeta|None
+    """
+    Get cached result and record cache hit or miss.
+
+    :param key: Cache key (see `cache_key`)
+    :param opts: SDK options with cache settings (default: current options)
+    :return: Cached result or None
+    """
+    data = _db_get(_cache_path(opts or idk.opts_get()), key)
+    if data is None:
+        return None
+    return idk.IsccMeta.model_construct(**json.loads(data))
+
+
+def cache_put(key, result, opts=None):
+    # type: (str, idk.IsccMeta, idk.SdkOptions|None) -> None
+    """
+    Store result and evict least recently used results if the cache exceeds its maximum size.
+
+    :param key: Cache key (see `cache_key`)
+    :param result: Result to store
+    :param opts: SDK options with cache settings (default: current options)
+    """
+    opts = opts or idk.opts_get()
+    data = json.dumps(result.dict(), separators=(",", ":")).encode("utf-8")
+    _db_put(_cache_path(opts), key, data, opts.cache_max_size)
+
+
+def cache_stats(opts=None):
+    # type: (idk.SdkOptions|None) -> dict[str, int]
+    """
+    Get cache statistics (accumulated over all processes using the cache).
+
+    :param opts: SDK options with cache settings (default: current options)
+    :return: Dict with number of `entries`, stored `size` in bytes, `hits` and `misses`
+    """
+    return _db_stats(_cache_path(opts or idk.opts_get()))
+
+
+def cache_clear(opts=None):
+    # type: (idk.SdkOptions|None) -> None
+    """
+    Remove all cached results and reset statistics.
+
+    :param opts: SDK options with cache settings (default: current options)
+    """
+    _db_clear(_cache_path(opts or idk.opts_get()))
+
+
+def feature_memo(fp, kind, func, settings=None, opts=None):
+    # type: (str|Path|idk.Asset, str, Callable[[], Any], Any, idk.SdkOptions|None) -> Any
+    """
+    Get intermediate feature of an asset from the feature store or compute and store it.
+
+    Features are keyed by the datahash of the asset, the feature `kind`, the `settings` that the
+    feature depends on and the SDK version. Without the `feature_store` option `func` is called.
+
+    :param fp: Filepath or `Asset` processing context
+    :param kind: Feature kind (e.g. "video", "audio", "text" or "image")
+    :param func: Function that computes the feature (returns bytes or JSON serializable value)
+    :param settings: JSON serializable settings the feature depends on
+    :param opts: SDK options with feature store settings (default: current options)
+    :return: Stored or computed feature
+    """
+    opts = opts or idk.opts_get()
+    if not opts.feature_store:
+        return func()
+    asset = idk.asset_open(fp)
+    material = json.dumps([kind, asset_datahash(asset), settings, idk.__version__], default=str)
+    key = blake3(material.encode("utf-8")).hexdigest()
+    path = _feature_store_path(opts)
+    data = _db_get(path, key)
+    if data is not None:
+        return data[1:] if data[:1] == b"b" else json.loads(data[1:])
+    value = func()
+    if isinstance(value, bytes):
+        data = b"b" + value
+    else:
+        data = b"j" + json.dumps(value, separators=(",", ":")).encode("utf-8")
+    _db_put(path, key, data, opts.feature_store_max_size)
+    return value
+
+
+def feature_stats(opts=None):
+    # type: (idk.SdkOptions|None) -> dict[str, int]
+    """
+    Get feature store statistics (accumulated over all processes using the store).
+
+    :param opts: SDK options with feature store settings (default: current options)
+    :return: Dict with number of `entries`, stored `size` in bytes, `hits` and `misses`
+    """
+    return _db_stats(_feature_store_path(opts or idk.opts_get()))
+
+
+def feature_clear(opts=None):
+    # type: (idk.SdkOptions|None) -> None
+    """
+    Remove all stored features and reset statistics.
+
+    :param opts: SDK options with feature store settings (default: current options)
+    """
+    _db_clear(_feature_store_path(opts or idk.opts_get()))
+
+
+def asset_datahash(fp):
+    # type: (str|Path|idk.Asset) -> str
+    """
+    Get datahash (blake3 multihash as used by Instance-Code) of the asset.
+
+    Taken from the ISCC-CODE Sum of the asset (`code_sum`) so the file is read only once.
+
+    :param fp: Filepath or `Asset` processing context
+    :return: Hex encoded datahash
+    """
+    asset = idk.asset_open(fp)
+    if "datahash" not in asset.cache:
+        idk.code_sum(asset)
+    return asset.cache["datahash"]
+
+
+def _cache_path(opts):
+    # type: (idk.SdkOptions) -> str
+    """Path of the cache database."""
+    return opts.cache_path or os.path.join(idk.dirs.user_data_dir, "cache.sqlite")
+
+
+def _feature_store_path(opts):
+    # type: (idk.SdkOptions) -> str
+    """Path of the feature store database."""
+    return opts.feature_store_path or os.path.join(idk.dirs.user_data_dir, "features.sqlite")
+
+
+def _db_get(path, key):
+    # type: (str, str) -> bytes|None
+    """Get entry from database (plain read) and record hit or miss in a batch."""
+    row = _connect(path).execute("SELECT data FROM results WHERE key = ?", (key,)).fetchone()
+    with _stats_lock:
+        pending = _stats_pending.setdefault(
+            (os.getpid(), path), dict(hits=0, misses=0, accessed={})
+        )
+        if row is None:
+            pending["misses"] += 1
+        else:
+            pending["hits"] += 1
+            pending["accessed"][key] = time.time()
+        full = pending["hits"] + pending["misses"] >= STATS_BATCH_SIZE
+    if full:
+        try:
+            with _transaction(path) as conn:
+                _stats_flush(conn, path)
+        except sqlite3.Error as e:  # pragma: no cover
+            log.debug(f"Failed to record cache statistics: {e}")
+    return None if row is None else row[0]
+
+
+def _stats_flush(conn, path):
+    # type: (sqlite3.Connection, str) -> None
+    """Record pending hit/miss statistics and access times of this process (in a transaction)."""
+    with _stats_lock:
+        pending = _stats_pending.pop((os.getpid(), path), None)
+    if pending is None:
+        return
+    conn.execute("UPDATE stats SET value = value + ? WHERE name = 'hits'", (pending["hits"],))
+    conn.execute("UPDATE stats SET value = value + ? WHERE name = 'misses'", (pending["misses"],))
+    conn.executemany(
+        "UPDATE results SET accessed = ? WHERE key = ?",
+        [(accessed, key) for key, accessed in pending["accessed"].items()],
+    )
+
+
+def _db_put(path, key, data, max_size):
+    # type: (str, str, bytes, int) -> None
+    """Store entry in database and evict least recently used entries above `max_size` bytes."""
+    with _transaction(path) as conn:
+        _stats_flush(conn, path)
+        row = conn.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+        delta = len(data) - (row[0] if row else 0)
+        conn.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+            (key, data, len(data), time.time()),
+        )
+        conn.execute("UPDATE stats SET value = value + ? WHERE name = 'size'", (delta,))
+        total = conn.execute("SELECT value FROM stats WHERE name = 'size'").fetchone()[0]
+        if total <= max_size:
+            return
+        # Recount before evicting (the size counter may drift from the stored entries)
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        while total > max_size:
+            rows = conn.execute(
+                "SELECT key, size FROM results ORDER BY accessed LIMIT 100"
+            ).fetchall()
+            if not rows:  # pragma: no cover
+                break
+            for old_key, size in rows:
+                if total <= max_size:
+                    break
+                conn.execute("DELETE FROM results WHERE key = ?", (old_key,))
+                total -= size
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        conn.execute("UPDATE stats SET value = ? WHERE name = 'size'", (total,))
+
+
+def _db_stats(path):
+    # type: (str) -> dict[str, int]
+    """Get database statistics (including pending statistics of this process)."""
+    with _transaction(path) as conn:
+        _stats_flush(conn, path)
+        stats = dict(conn.execute("SELECT name, value FROM stats").fetchall())
+        stats["entries"] = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+    return stats
+
+
+def _db_clear(path):
+    # type: (str) -> None
+    """Remove all entries from database and reset statistics."""
+    with _stats_lock:
+        _stats_pending.pop((os.getpid(), path), None)
+    with _transaction(path) as conn:
+        conn.execute("DELETE FROM results")
+        conn.execute("UPDATE stats SET value = 0")
+
+
+def _connect(path):
+    # type: (str) -> sqlite3.Connection
+    """Get database connection for the current thread and process (created on first use)."""
+    key = (os.getpid(), path)
+    connections = _local.__dict__.setdefault("connections", {})
+    conn = connections.get(key)
+    if conn is None:
+        conn = sqlite3.connect(path, timeout=60, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        connections[key] = conn
+    return conn
+
+
+@contextmanager
+def _transaction(path):
+    # type: (str) -> Iterator[sqlite3.Connection]
+    """Run statements in a write transaction."""
+    conn = _connect(path)
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
@@ -1,5 +1,4 @@
 import os
-from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 import iscc_lib as il
@@ -83,14 +82,6 @@ def iter_unprocessed(path, root_path=None):
             yield file_path, file_size
 
 
-def process_file(fp: Path):
-    idk.sdk_opts.video_store_mp7sig = True
-    try:
-        return fp, idk.code_iscc(fp.as_posix())
-    except Exception as e:
-        return fp, e
-
-
 @app.command()
 def create(file: str):
     """Create ISCC-CODE for a local FILE or URL."""
@@ -127,14 +118,7 @@ def batch(folder: Path, workers: int = os.cpu_count() or 1):  # pragma: no cover
         typer.echo(f"Invalid folder {folder}")
         raise typer.Exit(1)
 
-    file_paths = []
-    file_sizes = []
-    for path, size in iter_unprocessed(folder):
-        file_paths.append(path)
-        file_sizes.append(size)
-
-    file_sizes_dict = {path: size for path, size in zip(file_paths, file_sizes)}
-    total_size = sum(file_sizes)
+    file_sizes = dict(iter_unprocessed(folder))
     progress = Progress(
         TextColumn("[bold blue]Processing {task.fields[dirname]}", justify="right"),
         BarColumn(),
@@ -149,19 +133,19 @@ def batch(folder: Path, workers: int = os.cpu_count() or 1):  # pragma: no cover
     )
 
     with progress:
-        task_id = progress.add_task("Processing", dirname=folder.name, total=total_size)
-        with ProcessPoolExecutor(max_workers=workers) as executor:
-            futures = [executor.submit(process_file, fp) for fp in file_paths]
-            for future in as_completed(futures):
-                fp, iscc_meta = future.result()
-                if isinstance(iscc_meta, idk.IsccMeta):
-                    out_path = Path(fp.as_posix() + ".iscc.json")
-                    with out_path.open(mode="wt", encoding="utf-8") as outf:
-                        outf.write(iscc_meta.json(indent=2))
-                    log.info(f"Finished {fp.name}")
-                else:
-                    log.error(f"Failed {fp.name}: {iscc_meta}")
-                progress.update(task_id, advance=file_sizes_dict[fp], refresh=True)
+        task_id = progress.add_task(
+            "Processing", dirname=folder.name, total=sum(file_sizes.values())
+        )
+        results = idk.code_iscc_batch(file_sizes, workers=workers, video_store_mp7sig=True)
+        for fp, iscc_meta in results:
+            if isinstance(iscc_meta, idk.IsccMeta):
+                out_path = Path(fp.as_posix() + ".iscc.json")
+                with out_path.open(mode="wt", encoding="utf-8") as outf:
+                    outf.write(iscc_meta.json(indent=2))
+                log.info(f"Finished {fp.name}")
+            else:
+                log.error(f"Failed {fp.name}: {iscc_meta}")
+            progress.update(task_id, advance=file_sizes[fp], refresh=True)
 
 
 @app.command()
@@ -1,6 +1,8 @@
-"""Compatibility helpers."""
+"""Compatibility helpers and Pillow setup (image format plugins and decoder limits)."""
 
-from PIL import Image
+import pillow_avif  # noqa: F401 - registers AVIF support
+from PIL import Image, PngImagePlugin
+from pillow_heif import register_heif_opener
 
 __all__ = [
     "BICUBIC",
@@ -9,3 +11,10 @@ __all__ = [
 
 LANCZOS = Image.Resampling.LANCZOS
 BICUBIC = Image.Resampling.BICUBIC
+
+register_heif_opener()
+
+# Photoshop-exported PNGs often embed large zTXt chunks (e.g. tiff:37724
+# layer data) that decompress past PIL's 1 MB default. Allow up to 4 MB so
+# such covers don't fail thumbnail extraction.
+PngImagePlugin.MAX_TEXT_CHUNK = 4 * 1024 * 1024
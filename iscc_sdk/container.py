@@ -1,7 +1,7 @@
 """*Container format processing module*."""
 
+import importlib
 from collections.abc import Callable
-from pathlib import Path
 
 import iscc_sdk as idk
 
@@ -13,6 +13,11 @@ __all__ = [
 # Registry for container processors
 _CONTAINER_PROCESSORS: dict[str, Callable] = {}
 
+# Modules of built-in processors (they register themselves when imported)
+_CONTAINER_MODULES = {
+    "application/epub+zip": "iscc_sdk.epub",
+}
+
 
 def register_container_processor(mediatype: str, processor: Callable):
     """Register a processor function for a specific container mediatype."""
@@ -20,18 +25,19 @@ def register_container_processor(mediatype: str, processor: Callable):
 
 
 def process_container(fp, **options):
-    # type: (str|Path, Any) -> Optional[List[idk.IsccMeta]]
+    # type: (str|Path|idk.Asset, Any) -> Optional[List[idk.IsccMeta]]
     """
     Process embedded elements in a container file.
 
-    :param fp: Filepath to container file
+    :param fp: Filepath to container file or `Asset` processing context
     :param options: Processing options
     :return: List of IsccMeta objects for embedded elements or None
     """
-    fp = Path(fp)
-    mediatype, _ = idk.mediatype_and_mode(fp)
+    asset = idk.asset_open(fp)
 
-    processor = _CONTAINER_PROCESSORS.get(mediatype)
+    if asset.mediatype in _CONTAINER_MODULES:
+        importlib.import_module(_CONTAINER_MODULES[asset.mediatype])
+    processor = _CONTAINER_PROCESSORS.get(asset.mediatype)
     if processor:
-        return processor(fp, **options)
+        return processor(asset, **options)
     return None
@@ -14,6 +14,7 @@ from loguru import logger as log
 from PIL import Image, ImageEnhance
 
 import iscc_sdk as idk
+from iscc_sdk import compat, monkeys  # noqa: F401 - Pillow plugins and ebookmeta patches
 from iscc_sdk.mediatype import _has_svg_root
 
 __all__ = [
@@ -43,7 +44,7 @@ def epub_thumbnail(fp):
             tmp_path.unlink(missing_ok=True)
     else:
         img = Image.open(io.BytesIO(data))
-    size = idk.sdk_opts.image_thumbnail_size
+    size = idk.opts_get().image_thumbnail_size
     img.thumbnail((size, size), resample=idk.LANCZOS)
     return ImageEnhance.Sharpness(img.convert("RGB")).enhance(1.4)
 
@@ -195,12 +196,14 @@ def epub_process_container(fp, **options):
         # Extract images from EPUB
         images = epub_extract_images(fp, temp_dir)
 
-        # Process each image
-        for img_path in images:
+        # Generate ISCC for each image on the shared worker pool (results in original order)
+        img_options = {**options, "cache": False}  # Extracted temp files are never unchanged
+        futures = [
+            idk.executor_submit(idk.code_iscc, img_path, **img_options) for img_path in images
+        ]
+        for img_path, future in zip(images, futures):
             try:
-                # Generate ISCC for each image
-                img_meta = idk.code_iscc(img_path, **options)
-                parts.append(img_meta.dict())
+                parts.append(future.result().dict())
             except Exception as e:  # pragma: no cover
                 log.warning(f"Failed to process embedded image {img_path.name}: {e}")
 
@@ -220,7 +223,7 @@ def epub_extract_images(fp, output_dir):
     fp = Path(fp)
     output_dir = Path(output_dir)
     extracted_images = []
-    min_size = idk.sdk_opts.min_image_size
+    min_size = idk.opts_get().min_image_size
 
     with zipfile.ZipFile(fp, "r") as archive:
         # Identify image files in the archive
@@ -9,18 +9,21 @@ from pathlib import Path
 
 import exiv2
 from loguru import logger as log
-from PIL import Image, ImageChops, ImageEnhance, ImageOps, PngImagePlugin
-from pillow_heif import register_heif_opener
+from PIL import Image, ImageChops, ImageEnhance, ImageOps
 
 import iscc_sdk as idk
+from iscc_sdk import compat  # noqa: F401 - Pillow plugins and limits
 
 __all__ = [
+    "image_decode",
     "image_exif_transpose",
     "image_fill_transparency",
     "image_meta_delete",
     "image_meta_embed",
     "image_meta_extract",
     "image_normalize",
+    "image_normalize_bytes",
+    "image_open",
     "image_strip_metadata",
     "image_thumbnail",
     "image_to_data_url",
@@ -28,16 +31,103 @@ __all__ = [
 ]
 
 
-register_heif_opener()
-_exiv2_lock = threading.Lock()
+_local = threading.local()  # Reused thumbnail encoding buffer per thread
+_xmp_lock = threading.Lock()  # The XMP toolkit is not thread-safe (see `_exiv2_init`)
 
+#: Encoder arguments that omit embedded metadata from encoded thumbnails
+_NO_METADATA = {"exif": b"", "icc_profile": None, "xmp": b"", "comment": b""}
 
-Image.MAX_IMAGE_PIXELS = idk.sdk_opts.image_max_pixels
+#: XMP namespaces of embedded metadata (prefix, uri)
+XMP_NAMESPACES = {
+    "iscc": "http://purl.org/iscc/schema/",
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "plus": "http://ns.useplus.org/",
+    "xmpRights": "http://ns.adobe.com/xap/1.0/rights/",
+}
+
+#: Minimum side length of images decoded for Image-Code normalization with fast decode
+IMAGE_DECODE_SIZE = 512
+
+
+def image_open(fp, size=None):
+    # type: (str|Path, int|None) -> Image.Image
+    """
+    Open image for processing, decoding close to `size` with the `image_fast_decode` option.
+
+    With fast decode the image is decoded at the lowest resolution that keeps both sides at least
+    `size` pixels: JPEG DCT scaling and embedded HEIF thumbnails (via `Image.draft`), reduced
+    resolution pages of pyramidal TIFFs and box reduction (`Image.reduce`) after decoding other
+    formats. Normalization steps then run on the reduced image.
+
+    :param fp: Filepath to image file
+    :param size: Minimum size of both sides of the decoded image (None = full resolution)
+    :return: Pillow Image Object
+    """
+    return _image_open(fp, size)
 
-# Photoshop-exported PNGs often embed large zTXt chunks (e.g. tiff:37724
-# layer data) that decompress past PIL's 1 MB default. Allow up to 4 MB so
-# such covers don't fail thumbnail extraction.
-PngImagePlugin.MAX_TEXT_CHUNK = 4 * 1024 * 1024
+
+def image_decode(fp):
+    # type: (str|Path|idk.Asset) -> Image.Image
+    """
+    Get the decoded raster image of an asset (decoded once per `Asset`).
+
+    The decoded image is shared by thumbnail creation and Image-Code normalization for the same
+    asset and must not be modified in place. With the `image_fast_decode`
+    option it is decoded close to the largest size needed by these stages (see `image_open`).
+    Release the pixel buffer with `Asset.release("image")` after processing.
+
+    :param fp: Filepath to image file or `Asset` processing context.
+    :return: Loaded Pillow Image Object
+    """
+    asset = idk.asset_open(fp)
+    return asset.memo("image", _image_decode, asset)
+
+
+def _image_decode(asset):
+    # type: (idk.Asset) -> Image.Image
+    """Decode image and record its decoded size on the asset."""
+    size = max(IMAGE_DECODE_SIZE, idk.opts_get().image_thumbnail_size * 2)
+    img = _image_open(asset.path, size)
+    asset.cache["image_decoded_size"] = img.size
+    img.load()  # Shared between threads (loading is not thread-safe)
+    return img
+
+
+def _image_open(fp, size):
+    # type: (str|Path, int|None) -> Image.Image
+    """Open image (see `image_open`)."""
+    img = Image.open(fp)
+    if not size or not idk.opts_get().image_fast_decode:
+        return img
+    if min(img.size) < size * 2:
+        return img
+    img.draft(img.mode, (size, size))
+    if getattr(img, "n_frames", 1) > 1 and img.format == "TIFF":
+        _tiff_level_seek(img, size)
+    factor = min(img.size) // size
+    if factor >= 2:
+        try:
+            reduced = img.reduce(factor)
+        except ValueError:  # Modes without reduce support (like P)
+            log.debug(f"Image reduce not supported for mode {img.mode}")
+        else:
+            img = reduced  # Keeps image info (like EXIF orientation)
+    log.debug(f"Image decoded at {img.size[0]}x{img.size[1]} for size {size}")
+    return img
+
+
+def _tiff_level_seek(img, size):
+    # type: (Image.Image, int) -> None
+    """Seek to the smallest page of a pyramidal TIFF that is a scaled copy of at least `size`."""
+    width, height = img.size
+    best = (0, width * height)
+    for frame in range(1, img.n_frames):
+        img.seek(frame)
+        w, h = img.size
+        same_aspect = abs(w * height - h * width) <= max(width, height)
+        if same_aspect and min(w, h) >= size and w * h < best[1]:
+            best = (frame, w * h)
+    img.seek(best[0])
 
 
 def image_normalize(img):
@@ -48,29 +138,46 @@ def image_normalize(img):
     :param img: Pillow Image Object
     :return: Normalized and flattened image as 1024-pixel array (from 32x32 gray pixels)
     """
+    im = _image_normalized(img)
+
+    # A flattened sequence of grayscale pixel values (1024 pixels)
+    pixels = im.get_flattened_data() if hasattr(im, "get_flattened_data") else im.getdata()
+
+    return pixels
+
+
+def image_normalize_bytes(img):
+    # type: (Image.Image) -> bytes
+    """
+    Normalize image for hash calculation as raw bytes (avoids a per-pixel Python sequence).
+
+    :param img: Pillow Image Object
+    :return: Normalized image as 1024 bytes (from 32x32 gray pixels)
+    """
+    return _image_normalized(img).tobytes()
+
+
+def _image_normalized(img):
+    # type: (Image.Image) -> Image.Image
+    """Normalize image to 32x32 grayscale pixels according to SDK options."""
 
     # Transpose image according to EXIF Orientation tag
-    if idk.sdk_opts.image_exif_transpose:
+    if idk.opts_get().image_exif_transpose:
         img = image_exif_transpose(img)
 
     # Add white background to image if it has alpha transparency
-    if idk.sdk_opts.image_fill_transparency:
+    if idk.opts_get().image_fill_transparency:
         img = image_fill_transparency(img)
 
     # Trim uniform colored (empty) border if there is one
-    if idk.sdk_opts.image_trim_border:
+    if idk.opts_get().image_trim_border:
         img = image_trim_border(img)
 
     # Convert to grayscale
     img = img.convert("L")
 
     # Resize to 32x32
-    im = img.resize((32, 32), idk.BICUBIC)
-
-    # A flattened sequence of grayscale pixel values (1024 pixels)
-    pixels = im.get_flattened_data() if hasattr(im, "get_flattened_data") else im.getdata()
-
-    return pixels
+    return img.resize((32, 32), idk.BICUBIC)
 
 
 def image_exif_transpose(img):
@@ -152,127 +259,124 @@ def image_trim_border(img):
 
 
 def image_meta_extract(fp, file_name=None):
-    # type: (str|Path, Optional[str]) -> dict
+    # type: (str|Path|idk.Asset, Optional[str]) -> dict
     """
     Extract metadata from image using native exiv2 bindings.
 
-    :param fp: Filepath to image file.
+    :param fp: Filepath to image file or `Asset` processing context.
     :param file_name: Custom filename for MIME type guessing (overrides actual filename).
     :return: Metadata mapped to IsccMeta schema
     """
-    fp = Path(fp)
-    mt, _ = idk.mediatype_and_mode(fp, file_name=file_name)
-    if mt == "image/svg+xml":
+    asset = idk.asset_open(fp, file_name=file_name)
+    fp = asset.path
+    if asset.mediatype == "image/svg+xml":
         return idk.svg_meta_extract(fp)
-    with _exiv2_lock:
-        img_exiv = exiv2.ImageFactory.open(fp.as_posix())
+    img_exiv = exiv2.ImageFactory.open(fp.as_posix())
+    with _xmp_lock:  # Parses the XMP packet
         img_exiv.readMetadata()
 
-        # Read and process all metadata types: EXIF, XMP, IPTC
-        meta_dict = {}
-        meta_dict.update(_process_metadata(img_exiv.exifData()))
-        meta_dict.update(_process_metadata(img_exiv.xmpData(), is_xmp=True))
-        meta_dict.update(_process_metadata(img_exiv.iptcData()))
+    # Read and process all metadata types: EXIF, XMP, IPTC
+    meta_dict = {}
+    meta_dict.update(_process_metadata(img_exiv.exifData()))
+    meta_dict.update(_process_metadata(img_exiv.xmpData(), is_xmp=True))
+    meta_dict.update(_process_metadata(img_exiv.iptcData()))
 
-        # Map metadata to schema fields
-        mapped = {}
-        for tag, mapped_field in IMAGE_META_MAP.items():
-            if mapped_field in mapped:
+    # Map metadata to schema fields
+    mapped = {}
+    for tag, mapped_field in IMAGE_META_MAP.items():
+        if mapped_field in mapped:
+            continue
+        if meta_dict.get(tag):
+            try:
+                mapped[mapped_field] = idk.text_sanitize(meta_dict[tag])
+            except Exception as e:  # pragma: no cover
+                log.error(f"Failed to sanitize {meta_dict[tag]}: {e}")
                 continue
-            if meta_dict.get(tag):
-                try:
-                    mapped[mapped_field] = idk.text_sanitize(meta_dict[tag])
-                except Exception as e:  # pragma: no cover
-                    log.error(f"Failed to sanitize {meta_dict[tag]}: {e}")
-                    continue
 
-        # Add image dimensions
-        mapped["width"], mapped["height"] = img_exiv.pixelWidth(), img_exiv.pixelHeight()
+    # Add image dimensions (full resolution from the image header)
+    mapped["width"] = img_exiv.pixelWidth()
+    mapped["height"] = img_exiv.pixelHeight()
 
-        return mapped
+    return mapped
 
 
 def image_meta_embed(fp, meta):
-    # type: (str|Path, IsccMeta) -> Path
+    # type: (str|Path|idk.Asset, IsccMeta) -> Path
     """
     Embed metadata into a copy of the image file.
 
-    :param fp: Filepath to source image file
+    :param fp: Filepath to source image file or `Asset` processing context
     :param meta: Metadata to embed into image
     :return: Filepath to the new image file with updated metadata
     """
-    fp = Path(fp)
-    mt, _ = idk.mediatype_and_mode(fp)
-    if mt == "image/svg+xml":
+    asset = idk.asset_open(fp)
+    fp = asset.path
+    if asset.mediatype == "image/svg+xml":
         return idk.svg_meta_embed(fp, meta)
 
     # Create temp directory and copy the image
     tempdir = Path(tempfile.mkdtemp())
     imagefile = Path(shutil.copy(fp, tempdir))
 
-    with _exiv2_lock:
-        # Register XMP namespaces before opening image
-        exiv2.XmpProperties.registerNs("http://purl.org/iscc/schema/", "iscc")
-        exiv2.XmpProperties.registerNs("http://purl.org/dc/elements/1.1/", "dc")
-        exiv2.XmpProperties.registerNs("http://ns.useplus.org/", "plus")
-        exiv2.XmpProperties.registerNs("http://ns.adobe.com/xap/1.0/rights/", "xmpRights")
-
-        # Open the copied image with exiv2
-        img_exiv = exiv2.ImageFactory.open(str(imagefile))
+    # Open the copied image with exiv2
+    img_exiv = exiv2.ImageFactory.open(str(imagefile))
+    with _xmp_lock:
         img_exiv.readMetadata()
 
-        # Get metadata collections
-        xmp_data = img_exiv.xmpData()
-
-        # Set simple metadata values
-        if meta.name:
-            xmp_data["Xmp.iscc.name"] = meta.name
-            xmp_data["Xmp.dc.title"] = meta.name
-        if meta.description:
-            xmp_data["Xmp.iscc.description"] = meta.description
-            xmp_data["Xmp.dc.description"] = meta.description
-        if meta.meta:
-            xmp_data["Xmp.iscc.meta"] = meta.meta
-        if meta.license:
-            xmp_data["Xmp.xmpRights.WebStatement"] = meta.license
-        if meta.creator:
-            xmp_data["Xmp.dc.creator"] = meta.creator
-        if meta.rights:
-            xmp_data["Xmp.dc.rights"] = meta.rights
-        if meta.identifier:
-            xmp_data["Xmp.dc.identifier"] = meta.identifier
-
-        # Set complex metadata values
-        if meta.acquire:
-            # Set the Licensor URL
-            # First create a bag value
-            licensor_bag = exiv2.XmpTextValue()
-            licensor_bag.setXmpArrayType(exiv2.XmpValue.XmpArrayType.xaBag)
-            xmp_data["Xmp.plus.Licensor"] = licensor_bag
-
-            # Then set the LicensorURL with the struct path
-            xmp_data["Xmp.plus.Licensor[1]/plus:LicensorURL"] = meta.acquire
-
-        # Write metadata back to the file
+    # Get metadata collections
+    xmp_data = img_exiv.xmpData()
+
+    # Set simple metadata values
+    if meta.name:
+        xmp_data["Xmp.iscc.name"] = meta.name
+        xmp_data["Xmp.dc.title"] = meta.name
+    if meta.description:
+        xmp_data["Xmp.iscc.description"] = meta.description
+        xmp_data["Xmp.dc.description"] = meta.description
+    if meta.meta:
+        xmp_data["Xmp.iscc.meta"] = meta.meta
+    if meta.license:
+        xmp_data["Xmp.xmpRights.WebStatement"] = meta.license
+    if meta.creator:
+        xmp_data["Xmp.dc.creator"] = meta.creator
+    if meta.rights:
+        xmp_data["Xmp.dc.rights"] = meta.rights
+    if meta.identifier:
+        xmp_data["Xmp.dc.identifier"] = meta.identifier
+
+    # Set complex metadata values
+    if meta.acquire:
+        # Set the Licensor URL
+        # First create a bag value
+        licensor_bag = exiv2.XmpTextValue()
+        licensor_bag.setXmpArrayType(exiv2.XmpValue.XmpArrayType.xaBag)
+        xmp_data["Xmp.plus.Licensor"] = licensor_bag
+
+        # Then set the LicensorURL with the struct path
+        xmp_data["Xmp.plus.Licensor[1]/plus:LicensorURL"] = meta.acquire
+
+    # Write metadata back to the file
+    with _xmp_lock:  # Serializes the XMP packet
         img_exiv.writeMetadata()
 
-        log.debug(f"Embedding {meta.dict(exclude_unset=True)} in {imagefile.name}")
-        return imagefile
+    log.debug(f"Embedding {meta.dict(exclude_unset=True)} in {imagefile.name}")
+    return imagefile
 
 
 def image_meta_delete(fp):
-    # type: (str|Path) -> None
+    # type: (str|Path|idk.Asset) -> None
     """
     Delete all metadata from image.
 
-    :param fp: Filepath to image file.
+    :param fp: Filepath to image file or `Asset` processing context.
     """
-    fp = Path(fp)
-    mt, _ = idk.mediatype_and_mode(fp)
-    if mt == "image/svg+xml":
+    asset = idk.asset_open(fp)
+    fp = asset.path
+    if asset.mediatype == "image/svg+xml":
         return idk.svg_meta_delete(fp)
     img_exiv = exiv2.ImageFactory.open(str(fp))
-    img_exiv.readMetadata()
+    with _xmp_lock:
+        img_exiv.readMetadata()
 
     # Clear all metadata
     img_exiv.exifData().clear()
@@ -280,25 +384,26 @@ def image_meta_delete(fp):
     img_exiv.iptcData().clear()
 
     # Write the cleared metadata back to the file
-    img_exiv.writeMetadata()
+    with _xmp_lock:
+        img_exiv.writeMetadata()
 
     log.debug(f"Deleted all metadata from {fp.name}")
 
 
 def image_thumbnail(fp):
-    # type: (str|Path) -> Image.Image
+    # type: (str|Path|idk.Asset) -> Image.Image
     """
     Create a thumbnail for an image.
 
-    :param fp: Filepath to image file.
+    :param fp: Filepath to image file or `Asset` processing context.
     :return: Thumbnail image as PIL Image object
     """
-    fp = Path(fp)
-    mt, _ = idk.mediatype_and_mode(fp)
-    if mt == "image/svg+xml":
+    asset = idk.asset_open(fp)
+    fp = asset.path
+    if asset.mediatype == "image/svg+xml":
         return idk.svg_thumbnail(fp)
-    size = idk.sdk_opts.image_thumbnail_size
-    img = Image.open(fp)
+    size = idk.opts_get().image_thumbnail_size
+    img = image_decode(asset)
 
     # Convert to RGB before resizing
     img = img.convert("RGB")
@@ -315,10 +420,7 @@ def image_strip_metadata(img):
     :param img: PIL Image object to strip metadata from.
     :return: Image.Image
     """
-    data = list(img.get_flattened_data() if hasattr(img, "get_flattened_data") else img.getdata())
-    new_img = Image.new(img.mode, img.size)
-    new_img.putdata(data)
-    return new_img
+    return Image.frombytes(img.mode, img.size, img.tobytes())
 
 
 def image_to_data_url(img):
@@ -326,19 +428,41 @@ def image_to_data_url(img):
     """
     Convert PIL Image object to WebP Data-URL.
 
+    Metadata (EXIF, XMP, ICC profile and comments) is omitted by the encoder, so pixels are
+    encoded directly without stripping metadata from a copy of the image first.
+
     :param img: PIL Image object to encode as WebP Data-URL.
     :return: Data-URL string
     """
-    format_ = idk.sdk_opts.image_thumbnail_format
-    quality = idk.sdk_opts.image_thumbnail_quality
-    img = image_strip_metadata(img)
-    raw = io.BytesIO()
-    img.save(raw, format=format_, quality=quality)
+    opts = idk.opts_get()
+    format_ = opts.image_thumbnail_format
+    raw = getattr(_local, "buffer", None)
+    if raw is None:
+        raw = _local.buffer = io.BytesIO()
     raw.seek(0)
-    enc = base64.b64encode(raw.read()).decode("ascii")
+    raw.truncate()
+    img.save(raw, format=format_, quality=opts.image_thumbnail_quality, **_NO_METADATA)
+    with raw.getbuffer() as data:
+        enc = base64.b64encode(data).decode("ascii")
     return f"data:image/{format_.lower()};base64," + enc
 
 
+def _exiv2_init():
+    # type: () -> None
+    """
+    Prepare exiv2 for use from multiple threads (called once on import).
+
+    Exiv2 initializes its XMP toolkit lazily without locking, and namespaces would be registered
+    during processing. Both are done here. The XMP toolkit itself is not thread-safe without a
+    native lock function (which the bindings can not take from Python), so parsing and
+    serializing XMP packets (`readMetadata`/`writeMetadata`) is serialized by `_xmp_lock`.
+    Opening files and processing the decoded EXIF, IPTC and XMP values runs unlocked.
+    """
+    exiv2.XmpParser.initialize()
+    for prefix, uri in XMP_NAMESPACES.items():
+        exiv2.XmpProperties.registerNs(uri, prefix)
+
+
 def _clean_xmp_value(value):
     # type: (str) -> str
     """
@@ -415,3 +539,5 @@ IMAGE_META_MAP = {
     "Exif.Image.ImageID": "identifier",
     "Exif.Photo.ImageUniqueID": "identifier",
 }
+
+_exiv2_init()
@@ -1,10 +1,16 @@
 """Pure Python IPFS CIDv1 computation (Kubo-compatible)."""
 
 import hashlib
+import mmap
 from base64 import b32encode
+from collections import deque
+from concurrent.futures import wait
 from pathlib import Path
 
+import iscc_sdk as idk
+
 __all__ = [
+    "IpfsHasher",
     "ipfs_cidv1",
     "ipfs_cidv1_base16",
 ]
@@ -12,6 +18,7 @@ __all__ = [
 # Kubo defaults for CIDv1
 CHUNK_SIZE = 262144  # 256 KB fixed-size chunker
 MAX_LINKS = 174  # DefaultLinksPerBlock
+SEGMENT_SIZE = CHUNK_SIZE * 64  # Leaves per task of parallel leaf hashing (16 MB)
 SHA2_256 = 0x12
 DIGEST_LENGTH = 0x20
 CODEC_RAW = 0x55
@@ -20,30 +27,47 @@ UNIXFS_FILE = 2
 UNIXFS_DIRECTORY = 1
 
 
+#: Varints of single byte values (protobuf tags, CID header fields and short lengths)
+_VARINTS = tuple(bytes((n,)) for n in range(0x80))
+
+
 def _varint_encode(n):
     """Encode unsigned integer as LEB128 varint."""
+    if n < 0x80:
+        return _VARINTS[n]
     buf = bytearray()
+    _write_varint(buf, n)
+    return bytes(buf)
+
+
+def _write_varint(buf, n):
+    # type: (bytearray, int) -> None
+    """Append unsigned integer as LEB128 varint to buffer."""
     while n > 0x7F:
         buf.append((n & 0x7F) | 0x80)
         n >>= 7
-    buf.append(n & 0x7F)
-    return bytes(buf)
+    buf.append(n)
 
 
-def _sha256_digest(data):
-    """Compute raw SHA-256 digest."""
-    return hashlib.sha256(data).digest()
+def _varint_size(n):
+    # type: (int) -> int
+    """Number of bytes of the LEB128 varint of an unsigned integer."""
+    return (n.bit_length() + 6) // 7 or 1
 
 
-def _make_multihash(digest):
-    """Prepend sha2-256 multihash header to digest."""
-    return _varint_encode(SHA2_256) + _varint_encode(DIGEST_LENGTH) + digest
+#: CIDv1 header with sha2-256 multihash header per codec
+_CID_PREFIXES = {
+    codec: _varint_encode(1)
+    + _varint_encode(codec)
+    + _varint_encode(SHA2_256)
+    + _varint_encode(DIGEST_LENGTH)
+    for codec in (CODEC_RAW, CODEC_DAG_PB)
+}
 
 
 def _cid_bytes(codec, data):
     """Build CIDv1 binary from codec and data to hash."""
-    digest = _sha256_digest(data)
-    return _varint_encode(1) + _varint_encode(codec) + _make_multihash(digest)
+    return _CID_PREFIXES[codec] + hashlib.sha256(data).digest()
 
 
 def _cid_base32(cid_bytes):
@@ -56,116 +80,224 @@ def _cid_base16(cid_bytes):
     return "f" + cid_bytes.hex()
 
 
-def _encode_varint_field(field_num, value):
-    """Encode a protobuf varint field (wire type 0)."""
-    return _varint_encode(field_num << 3 | 0) + _varint_encode(value)
-
-
-def _encode_bytes_field(field_num, data):
-    """Encode a protobuf length-delimited field (wire type 2)."""
-    return _varint_encode(field_num << 3 | 2) + _varint_encode(len(data)) + data
+# Protobuf field keys (field number << 3 | wire type)
+_UNIXFS_TYPE = 0x08  # Data.Type (varint)
+_UNIXFS_FILESIZE = 0x18  # Data.filesize (varint)
+_UNIXFS_BLOCKSIZE = 0x20  # Data.blocksizes (repeated varint)
+_PBNODE_DATA = 0x0A  # PBNode.Data (bytes)
+_PBNODE_LINK = 0x12  # PBNode.Links (repeated PBLink)
+_PBLINK_HASH = 0x0A  # PBLink.Hash (bytes)
+_PBLINK_NAME = 0x12  # PBLink.Name (string)
+_PBLINK_TSIZE = 0x18  # PBLink.Tsize (varint)
 
 
 def _encode_unixfs_data(type_val, filesize=None, blocksizes=None):
     """Encode UnixFS Data protobuf message."""
-    buf = _encode_varint_field(1, type_val)
+    buf = bytearray((_UNIXFS_TYPE,))
+    _write_varint(buf, type_val)
     if filesize is not None:
-        buf += _encode_varint_field(3, filesize)
-    if blocksizes:
-        for bs in blocksizes:
-            buf += _encode_varint_field(4, bs)
+        buf.append(_UNIXFS_FILESIZE)
+        _write_varint(buf, filesize)
+    for bs in blocksizes or ():
+        buf.append(_UNIXFS_BLOCKSIZE)
+        _write_varint(buf, bs)
     return buf
 
 
-def _encode_pb_link(cid_bytes, tsize, name=""):
-    """Encode a dag-pb PBLink protobuf message.
+def _write_pb_link(buf, cid_bytes, tsize, name=b""):
+    # type: (bytearray, bytes, int, bytes) -> None
+    """Append a dag-pb PBLink as PBNode Links field to buffer.
 
     Kubo always serializes the Name field (even as empty string for file links).
     """
-    buf = _encode_bytes_field(1, cid_bytes)
-    buf += _encode_bytes_field(2, name.encode("utf-8"))
-    buf += _encode_varint_field(3, tsize)
+    size = 3 + len(cid_bytes) + len(name) + _varint_size(len(cid_bytes))
+    size += _varint_size(len(name)) + _varint_size(tsize)
+    buf.append(_PBNODE_LINK)
+    _write_varint(buf, size)
+    buf.append(_PBLINK_HASH)
+    _write_varint(buf, len(cid_bytes))
+    buf += cid_bytes
+    buf.append(_PBLINK_NAME)
+    _write_varint(buf, len(name))
+    buf += name
+    buf.append(_PBLINK_TSIZE)
+    _write_varint(buf, tsize)
+
+
+def _encode_pb_node(links, unixfs_data):
+    """Encode a dag-pb PBNode from (cid_bytes, tsize, name) links (Links before Data per spec)."""
+    buf = bytearray()
+    for cid_bytes, tsize, name in links:
+        _write_pb_link(buf, cid_bytes, tsize, name)
+    buf.append(_PBNODE_DATA)
+    _write_varint(buf, len(unixfs_data))
+    buf += unixfs_data
     return buf
 
 
-def _encode_pb_node(links_bytes, unixfs_data):
-    """Encode a dag-pb PBNode (Links before Data per spec)."""
-    buf = b""
-    for link in links_bytes:
-        buf += _encode_bytes_field(2, link)
-    buf += _encode_bytes_field(1, unixfs_data)
-    return buf
+def _dag_node(batch):
+    """Build file node linking a batch of child tuples, return (cid_bytes, tsize, data_size)."""
+    data_size = tsize = 0
+    for _, child_tsize, child_size in batch:
+        data_size += child_size
+        tsize += child_tsize
+    blocksizes = (child[2] for child in batch)
+    unixfs = _encode_unixfs_data(UNIXFS_FILE, filesize=data_size, blocksizes=blocksizes)
+    node_bytes = _encode_pb_node(((child[0], child[1], b"") for child in batch), unixfs)
+    return _cid_bytes(CODEC_DAG_PB, node_bytes), tsize + len(node_bytes), data_size
 
 
-def _build_balanced_dag(leaves):
-    """Build balanced DAG from leaf tuples, return (cid_bytes, tsize, data_size)."""
-    while len(leaves) > 1:
-        next_level = []
-        for i in range(0, len(leaves), MAX_LINKS):
-            batch = leaves[i : i + MAX_LINKS]
-            data_size = sum(leaf[2] for leaf in batch)
-            blocksizes = [leaf[2] for leaf in batch]
-            unixfs = _encode_unixfs_data(UNIXFS_FILE, filesize=data_size, blocksizes=blocksizes)
-            links = [_encode_pb_link(leaf[0], leaf[1]) for leaf in batch]
-            node_bytes = _encode_pb_node(links, unixfs)
-            cid = _cid_bytes(CODEC_DAG_PB, node_bytes)
-            tsize = len(node_bytes) + sum(leaf[1] for leaf in batch)
-            next_level.append((cid, tsize, data_size))
-        leaves = next_level
-    return leaves[0]
-
-
-def _process_file(fp):
-    """Process file into CID, returning (cid_bytes, tsize, data_size)."""
-    fp = Path(fp)
-    leaves = []
-    with open(fp, "rb") as f:
-        while True:
-            chunk = f.read(CHUNK_SIZE)
-            if not chunk:
-                break
-            cid = _cid_bytes(CODEC_RAW, chunk)
-            leaves.append((cid, len(chunk), len(chunk)))
+def _hash_leaves(mm, start, end):
+    # type: (mmap.mmap, int, int) -> list[tuple[bytes, int, int]]
+    """Hash the leaves of a memory-mapped file segment (runs on the shared worker pool)."""
+    with memoryview(mm) as view:
+        return [
+            _leaf_tuple(view[i : min(i + CHUNK_SIZE, end)]) for i in range(start, end, CHUNK_SIZE)
+        ]
 
-    if not leaves:
-        # Empty file: single empty raw leaf
-        cid = _cid_bytes(CODEC_RAW, b"")
-        return cid, 0, 0
 
-    if len(leaves) == 1:
-        return leaves[0]
+def _leaf_tuple(chunk):
+    # type: (bytes|bytearray|memoryview) -> tuple[bytes, int, int]
+    """Build raw leaf tuple (cid_bytes, tsize, data_size)."""
+    return _cid_bytes(CODEC_RAW, chunk), len(chunk), len(chunk)
 
-    return _build_balanced_dag(leaves)
 
+class IpfsHasher:
+    """Streaming IPFS CIDv1 generator with results identical to `ipfs_cidv1`.
 
-def ipfs_cidv1(fp, wrap=False):
-    # type: (str|Path, bool) -> str
+    Data can be pushed in pieces of any size. It is split into fixed-size leaves like Kubo's
+    default chunker, so the hasher can share a single read of a file with other hashers (see
+    the `add_cid` option of `code_sum`). The balanced DAG is built while leaves arrive: full
+    batches of `MAX_LINKS` children are collapsed into their parent node right away, so memory
+    use is bounded by the tree depth instead of the number of leaves.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self._levels = [[]]  # type: list[list[tuple[bytes, int, int]]]
+        self._buffer = bytearray()
+
+    def update(self, data):
+        # type: (bytes|bytearray|memoryview) -> None
+        """Push data into the hasher."""
+        view = memoryview(data)
+        if self._buffer:
+            missing = CHUNK_SIZE - len(self._buffer)
+            self._buffer += view[:missing]
+            view = view[missing:]
+            if len(self._buffer) < CHUNK_SIZE:
+                return
+            self._add(_leaf_tuple(self._buffer))
+            self._buffer = bytearray()
+        end = len(view) - len(view) % CHUNK_SIZE
+        for start in range(0, end, CHUNK_SIZE):
+            self._add(_leaf_tuple(view[start : start + CHUNK_SIZE]))
+        self._buffer += view[end:]
+
+    def finalize(self):
+        # type: () -> str
+        """Return IPFS CIDv1 (base32lower) of all pushed data."""
+        return _cid_base32(self._root()[0])
+
+    def _add(self, leaf):
+        # type: (tuple[bytes, int, int]) -> None
+        """Add next leaf and collapse full batches into parent nodes."""
+        self._levels[0].append(leaf)
+        level = 0
+        while len(self._levels[level]) == MAX_LINKS:
+            node = _dag_node(self._levels[level])
+            self._levels[level] = []
+            level += 1
+            if level == len(self._levels):
+                self._levels.append([])
+            self._levels[level].append(node)
+
+    def _root(self):
+        # type: () -> tuple[bytes, int, int]
+        """Return (cid_bytes, tsize, data_size) of the file node."""
+        levels = [list(level) for level in self._levels]
+        if self._buffer:
+            levels[0].append(_leaf_tuple(self._buffer))
+
+        if len(levels) == 1 and not levels[0]:
+            # Empty file: single empty raw leaf
+            return _leaf_tuple(b"")
+
+        # Collapse partial batches bottom-up until a single node remains on the top level
+        level = 0
+        while level < len(levels) - 1 or len(levels[level]) > 1:
+            if level == len(levels) - 1:
+                levels.append([])
+            if levels[level]:
+                levels[level + 1].append(_dag_node(levels[level]))
+            level += 1
+        return levels[level][0]
+
+
+def _process_file(fp, workers=1):
+    # type: (str|Path, int) -> tuple[bytes, int, int]
+    """Process file into CID, returning (cid_bytes, tsize, data_size).
+
+    With multiple workers the leaves of a large file are hashed in segments of a memory-mapped
+    view on the shared worker pool (`hashlib` releases the GIL) and added to the DAG in order.
+    """
+    fp = Path(fp)
+    hasher = IpfsHasher()
+    size = fp.stat().st_size
+    with open(fp, "rb") as f:
+        if workers <= 1 or size <= SEGMENT_SIZE:
+            while chunk := f.read(CHUNK_SIZE):
+                hasher.update(chunk)
+            return hasher._root()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pending = deque()  # type: deque[Future]
+            try:
+                for start in range(0, size, SEGMENT_SIZE):
+                    if len(pending) >= workers:
+                        for leaf in pending.popleft().result():
+                            hasher._add(leaf)
+                    end = min(start + SEGMENT_SIZE, size)
+                    pending.append(idk.executor_submit(_hash_leaves, mm, start, end))
+                while pending:
+                    for leaf in pending.popleft().result():
+                        hasher._add(leaf)
+            finally:
+                # Workers must be done with the memory map before it is closed
+                wait(pending)
+    return hasher._root()
+
+
+def ipfs_cidv1(fp, wrap=False, workers=None):
+    # type: (str|Path, bool, int|None) -> str
     """Compute IPFS CIDv1 for file (Kubo-compatible, pure Python).
 
     :param fp: Filepath to hash.
     :param wrap: Wrap file in a directory and append filename to CID path.
+    :param workers: Parallel leaf hashing tasks (default: `ipfs_workers` option)
     :return: IPFS CIDv1 base32lower string.
     """
     fp = Path(fp)
-    file_cid, file_tsize, _ = _process_file(fp)
+    workers = workers or idk.opts_get().ipfs_workers
+    file_cid, file_tsize, _ = _process_file(fp, workers)
 
     if not wrap:
         return _cid_base32(file_cid)
 
     # Directory wrapping: create dag-pb directory node with one named link
     unixfs = _encode_unixfs_data(UNIXFS_DIRECTORY)
-    link = _encode_pb_link(file_cid, file_tsize, name=fp.name)
-    dir_node = _encode_pb_node([link], unixfs)
+    dir_node = _encode_pb_node([(file_cid, file_tsize, fp.name.encode("utf-8"))], unixfs)
     dir_cid = _cid_bytes(CODEC_DAG_PB, dir_node)
     return _cid_base32(dir_cid) + f"/{fp.name}"
 
 
-def ipfs_cidv1_base16(fp):
-    # type: (str|Path) -> str
+def ipfs_cidv1_base16(fp, workers=None):
+    # type: (str|Path, int|None) -> str
     """Compute IPFS CIDv1 with base16 encoding (Kubo-compatible, pure Python).
 
     :param fp: Filepath to hash.
+    :param workers: Parallel leaf hashing tasks (default: `ipfs_workers` option)
     :return: IPFS CIDv1 base16 (hex) string.
     """
-    file_cid, _, _ = _process_file(fp)
+    workers = workers or idk.opts_get().ipfs_workers
+    file_cid, _, _ = _process_file(fp, workers)
     return _cid_base16(file_cid)
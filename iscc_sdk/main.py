@@ -1,23 +1,31 @@
 """*SDK main top-level functions*."""
 
-from concurrent.futures import ThreadPoolExecutor
+import functools
+import io
+import subprocess
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
 from pathlib import Path
 from typing import Any
 
 import iscc_lib as il
+import numpy as np
 from loguru import logger as log
 from PIL import Image
 
 import iscc_sdk as idk
+from iscc_sdk._thumbnail import thumbnail
 
 __all__ = [
     "code_audio",
     "code_content",
     "code_data",
     "code_image",
+    "code_image_batch",
     "code_image_semantic",
     "code_instance",
     "code_iscc",
+    "code_iscc_batch",
     "code_meta",
     "code_sum",
     "code_text",
@@ -26,6 +34,25 @@ __all__ = [
 ]
 
 
+def _timings_added(func):
+    # type: (Callable) -> Callable
+    """Attach per-stage processing times to the result with the `add_timings` option."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # type: (Any, Any) -> idk.IsccMeta
+        if not idk.opts_get().add_timings:
+            return func(*args, **kwargs)
+        with idk.stage_timings() as timings:
+            result = func(*args, **kwargs)
+        result.timings = timings
+        return result
+
+    return wrapper
+
+
+@idk.opts_scoped
+@_timings_added
 def code_iscc(fp, name=None, description=None, meta=None, **options):
     # type: (str | Path, str | None, str | None, str | dict | None, Any) -> idk.IsccMeta
     """
@@ -56,8 +83,9 @@ def code_iscc(fp, name=None, description=None, meta=None, **options):
       fallback mode instead of raising an exception.
     - For processing container files (like EPUB with embedded files), set `process_container`
       to True to extract and process contained files.
+    - Set `cache` to True to reuse results for unchanged files from a persistent local cache.
 
-    :param fp: Path object or str representing the filepath of the file to process.
+    :param fp: Path object, str or `Asset` processing context of the file to process.
     :param name: Optional name to override extracted metadata.
     :param description: Optional description to override extracted metadata.
     :param meta: Optional metadata (dict or Data-URL as string) to override extracted metadata.
@@ -67,6 +95,8 @@ def code_iscc(fp, name=None, description=None, meta=None, **options):
         **create_thumb** - Whether to create a thumbnail. Default: True;
         **fallback** - Process unsupported media types. Default: False;
         **add_units** - Include ISCC-UNITS in metadata. Default: False;
+        **add_cid** - Add IPFS CIDv1 as ``content`` URI (same file read as ISCC-SUM). Default: False;
+        **add_timings** - Attach per-stage processing times (``IsccMeta.timings``). Default: False;
         **wide** - Enable wide mode for ISCC-SUM with Data & Instance codes only. Default: False;
         **experimental** - Enable experimental semantic codes. Default: False;
         **process_container** - Process container files and extract contained files. Default: False;
@@ -79,16 +109,23 @@ def code_iscc(fp, name=None, description=None, meta=None, **options):
         If the media type is not supported. By default, the function will raise this exception for
         unsupported media types, as sdk_opts.fallback is False by default.
     """
-    fp = Path(fp)
-    opts = idk.sdk_opts.override(options)
+    asset = idk.asset_open(fp)
+    fp = asset.path
+    opts = idk.opts_get()
+
+    # Reuse cached result for unchanged file, options and arguments
+    cache_key = idk.cache_key(asset, opts, name, description, meta) if opts.cache else None
+    if cache_key:
+        with idk.stage("cache"):
+            cached = idk.cache_get(cache_key, opts)
+        if cached is not None:
+            return cached
 
     # Initialize collectors
     iscc_meta: dict[str, Any] = dict(filename=fp.name)
 
-    with open(fp, "rb") as infile:
-        data = infile.read(4096)
-
-    mediatype = idk.mediatype_guess(data, file_name=fp.name)
+    with idk.stage("sniff"):
+        mediatype = asset.mediatype
     iscc_meta["mediatype"] = mediatype
 
     try:
@@ -112,12 +149,19 @@ def code_iscc(fp, name=None, description=None, meta=None, **options):
             iscc_meta["@type"] = type_
         iscc_meta["mode"] = mode
 
+    # Decode video once for thumbnail, metadata and signature (signature from feature store)
+    if mode == "video":
+        with idk.stage("video_decode", asset.stat.st_size):
+            _video_features(asset, opts)
+            _video_single_pass(asset, opts, signature=False)
+
     # Generate thumbnail early (before heavy processing)
     if opts.create_thumb and mode:
         try:
-            thumbnail_img = idk.thumbnail(fp)  # type: ignore[operator]
-            if thumbnail_img:
-                iscc_meta["thumbnail"] = idk.image_to_data_url(thumbnail_img)
+            with idk.stage("thumbnail"):
+                thumbnail_img = thumbnail(asset)
+                if thumbnail_img:
+                    iscc_meta["thumbnail"] = idk.image_to_data_url(thumbnail_img)
         except Exception as e:
             # Thumbnail is optional: recover from missing-cover and thumbnailer errors, but let
             # fatal extraction errors (corrupt/invalid source files) propagate.
@@ -128,29 +172,35 @@ def code_iscc(fp, name=None, description=None, meta=None, **options):
             log.warning(f"Thumbnail extraction failed for {fp.name}")
 
     # Generate Data & Instance Codes
-    iscc_sum = code_sum(fp, **options)
+    with idk.stage("sum", asset.stat.st_size):
+        iscc_sum = code_sum(asset, **options)
 
     # Generate Content & optional Semantic Codes
     cc = None
     cs = None
     content_options = {**options, "create_thumb": False}
-    if mode == "image":
-        cc = code_image(fp, **content_options)
-        if idk.is_installed("iscc_sci") and opts.experimental:  # pragma: nocover
-            cs = code_image_semantic(fp)
-    elif mode == "audio":
-        cc = code_audio(fp, **content_options)
-    elif mode == "video":
-        cc = code_video(fp, **content_options)
-    elif mode == "text":
-        text = idk.text_extract(fp)
-        text = il.text_clean(text)
-        cc = code_text(fp, text, **content_options)
-        if idk.is_installed("iscc_sct") and opts.experimental:  # pragma: nocover
-            cs = code_text_semantic(fp, text)  # Don´t pass incopatible options here!
+    with idk.stage("content", asset.stat.st_size):
+        if mode == "image":
+            cc = code_image(asset, **content_options)
+            if idk.is_installed("iscc_sci") and opts.experimental:  # pragma: nocover
+                cs = code_image_semantic(fp)
+            asset.release("image")
+        elif mode == "audio":
+            cc = code_audio(asset, **content_options)
+        elif mode == "video":
+            cc = code_video(asset, **content_options)
+        elif mode == "text":
+            text = _text_cleaned(asset, opts)
+            cc = code_text(asset, text, **content_options)
+            if idk.is_installed("iscc_sct") and opts.experimental:  # pragma: nocover
+                cs = code_text_semantic(fp, text)  # Don´t pass incopatible options here!
 
     # Generate Meta-Code
-    meta = code_meta(fp, name, description, meta, **options) if opts.create_meta and mode else None
+    if opts.create_meta and mode:
+        with idk.stage("meta"):
+            meta = code_meta(asset, name, description, meta, **options)
+    else:
+        meta = None
 
     # Collect Metadata
     iscc_meta.update(iscc_sum.dict())
@@ -195,13 +245,19 @@ def code_iscc(fp, name=None, description=None, meta=None, **options):
     result = idk.IsccMeta.model_construct(**iscc_meta)
 
     if opts.process_container:
-        parts = idk.process_container(fp, **options)
+        with idk.stage("container"):
+            parts = idk.process_container(asset, **options)
         if parts:
             result.parts = parts
 
+    if cache_key:
+        idk.cache_put(cache_key, result, opts)
+
     return result
 
 
+@idk.opts_scoped
+@_timings_added
 def code_iscc_mt(fp, name=None, description=None, meta=None, **options):  # pragma: no cover
     # type: (str|Path, str|None, str|None, str|dict|None, Any) -> idk.IsccMeta
     """
@@ -219,12 +275,13 @@ def code_iscc_mt(fp, name=None, description=None, meta=None, **options):  # prag
 
     Note:
 
-    - This function uses multithreading to improve performance.
+    - This function uses multithreading to improve performance. Tasks are scheduled on the
+      shared worker pool (see `executor_get`), sized with the `pool_workers` option.
     - The behavior can be customized through the `sdk_opts` settings. For example, setting
       `fallback` to True will allow processing of unsupported media types in a
       fallback mode instead of raising an exception.
 
-    :param fp: str or Path object representing the filepath of the file to process.
+    :param fp: str, Path object or `Asset` processing context of the file to process.
     :param name: Optional name to override extracted metadata.
     :param description: Optional description to override extracted metadata.
     :param meta: Optional metadata (dict or Data-URL as string) to override extracted metadata.
@@ -234,6 +291,8 @@ def code_iscc_mt(fp, name=None, description=None, meta=None, **options):  # prag
         **create_thumb** - Whether to create a thumbnail. Default: True;
         **fallback** - Process unsupported media types. Default: False;
         **add_units** - Include ISCC-UNITS in metadata. Default: False;
+        **add_cid** - Add IPFS CIDv1 as ``content`` URI (same file read as ISCC-SUM). Default: False;
+        **add_timings** - Attach per-stage processing times (``IsccMeta.timings``). Default: False;
         **wide** - Enable wide mode for ISCC-SUM with Data & Instance codes only. Default: False;
         **experimental** - Enable experimental semantic codes. Default: False;
         **process_container** - Process container files and extract contained files. Default: False;
@@ -246,16 +305,23 @@ def code_iscc_mt(fp, name=None, description=None, meta=None, **options):  # prag
         If the media type is not supported. By default, the function will raise this exception for
         unsupported media types, as sdk_opts.fallback is False by default.
     """
-    fp = Path(fp)
-    opts = idk.sdk_opts.override(options)
+    asset = idk.asset_open(fp)
+    fp = asset.path
+    opts = idk.opts_get()
+
+    # Reuse cached result for unchanged file, options and arguments
+    cache_key = idk.cache_key(asset, opts, name, description, meta) if opts.cache else None
+    if cache_key:
+        with idk.stage("cache"):
+            cached = idk.cache_get(cache_key, opts)
+        if cached is not None:
+            return cached
 
     # Initialize collectors
     iscc_meta: dict[str, Any] = dict(filename=fp.name)
 
-    with open(fp, "rb") as infile:
-        data = infile.read(4096)
-
-    mediatype = idk.mediatype_guess(data, file_name=fp.name)
+    with idk.stage("sniff"):
+        mediatype = asset.mediatype
     iscc_meta["mediatype"] = mediatype
 
     try:
@@ -281,57 +347,74 @@ def code_iscc_mt(fp, name=None, description=None, meta=None, **options):  # prag
 
     content_options = {**options, "create_thumb": False}
 
-    with ThreadPoolExecutor() as executor:
-        # Submit independent futures first (run while we do sequential prep)
-        sum_future = executor.submit(code_sum, fp, **options)
-        meta_future = None
-        if opts.create_meta and mode:
-            meta_future = executor.submit(code_meta, fp, name, description, meta, **options)
+    # Submit independent futures first (run while we do sequential prep)
+    size = asset.stat.st_size
+    sum_future = idk.executor_submit(_staged, "sum", size, code_sum, asset, **options)
 
-        # Generate thumbnail early (overlaps with sum/meta futures)
-        if opts.create_thumb and mode:
-            try:
-                from iscc_sdk.thumbnail import thumbnail as _thumbnail
+    # Decode video once for thumbnail, metadata and signature (overlaps with sum future)
+    if mode == "video":
+        with idk.stage("video_decode", asset.stat.st_size):
+            _video_features(asset, opts)
+            _video_single_pass(asset, opts, signature=False)
 
-                thumbnail_img = _thumbnail(fp)
+    meta_future = None
+    if opts.create_meta and mode:
+        meta_future = idk.executor_submit(
+            _staged, "meta", None, code_meta, asset, name, description, meta, **options
+        )
+
+    # Generate thumbnail early (overlaps with sum/meta futures)
+    if opts.create_thumb and mode:
+        try:
+            with idk.stage("thumbnail"):
+                thumbnail_img = thumbnail(asset)
                 if thumbnail_img:
                     iscc_meta["thumbnail"] = idk.image_to_data_url(thumbnail_img)
-            except Exception as e:
-                # Thumbnail is optional: recover from missing-cover and thumbnailer errors, but
-                # let fatal extraction errors (corrupt/invalid source files) propagate.
-                if isinstance(e, idk.IsccExtractionError) and not isinstance(
-                    e, idk.IsccThumbExtractionError
-                ):
-                    raise
-                log.warning(f"Thumbnail extraction failed for {fp.name}")
-
-        # For text mode, extract text once (shared between code_text and code_text_semantic)
-        text = None
-        if mode == "text":
-            text = idk.text_extract(fp)
-            text = il.text_clean(text)
+        except Exception as e:
+            # Thumbnail is optional: recover from missing-cover and thumbnailer errors, but
+            # let fatal extraction errors (corrupt/invalid source files) propagate.
+            if isinstance(e, idk.IsccExtractionError) and not isinstance(
+                e, idk.IsccThumbExtractionError
+            ):
+                raise
+            log.warning(f"Thumbnail extraction failed for {fp.name}")
 
-        # Submit content & optional semantic futures (after sequential prep)
-        cc_future = None
-        cs_future = None
-        if mode == "image":
-            cc_future = executor.submit(code_image, fp, **content_options)
-            if idk.is_installed("iscc_sci") and opts.experimental:
-                cs_future = executor.submit(code_image_semantic, fp)
-        elif mode == "audio":
-            cc_future = executor.submit(code_audio, fp, **content_options)
-        elif mode == "video":
-            cc_future = executor.submit(code_video, fp, **content_options)
-        elif mode == "text":
-            cc_future = executor.submit(code_text, fp, text, **content_options)
-            if idk.is_installed("iscc_sct") and opts.experimental:
-                cs_future = executor.submit(code_text_semantic, fp, text)
+    # For text mode, extract text once (shared between code_text and code_text_semantic)
+    text = None
+    if mode == "text":
+        with idk.stage("content", size):
+            text = _text_cleaned(asset, opts)
+
+    # Submit content & optional semantic futures (after sequential prep)
+    cc_future = None
+    cs_future = None
+    if mode == "image":
+        cc_future = idk.executor_submit(
+            _staged, "content", size, code_image, asset, **content_options
+        )
+        if idk.is_installed("iscc_sci") and opts.experimental:
+            cs_future = idk.executor_submit(code_image_semantic, fp)
+    elif mode == "audio":
+        cc_future = idk.executor_submit(
+            _staged, "content", size, code_audio, asset, **content_options
+        )
+    elif mode == "video":
+        cc_future = idk.executor_submit(
+            _staged, "content", size, code_video, asset, **content_options
+        )
+    elif mode == "text":
+        cc_future = idk.executor_submit(
+            _staged, "content", size, code_text, asset, text, **content_options
+        )
+        if idk.is_installed("iscc_sct") and opts.experimental:
+            cs_future = idk.executor_submit(code_text_semantic, fp, text)
 
-        # Collect results
-        iscc_sum = sum_future.result()
-        cc = cc_future.result() if cc_future else None
-        cs = cs_future.result() if cs_future else None
-        meta_result = meta_future.result() if meta_future else None
+    # Collect results
+    iscc_sum = sum_future.result()
+    cc = cc_future.result() if cc_future else None
+    asset.release("image")
+    cs = cs_future.result() if cs_future else None
+    meta_result = meta_future.result() if meta_future else None
 
     # Collect Metadata (same merge order as code_iscc)
     iscc_meta.update(iscc_sum.dict())
@@ -376,13 +459,99 @@ def code_iscc_mt(fp, name=None, description=None, meta=None, **options):  # prag
     result = idk.IsccMeta.model_construct(**iscc_meta)
 
     if opts.process_container:
-        parts = idk.process_container(fp, **options)
+        with idk.stage("container"):
+            parts = idk.process_container(asset, **options)
         if parts:
             result.parts = parts
 
+    if cache_key:
+        idk.cache_put(cache_key, result, opts)
+
     return result
 
 
+def code_iscc_batch(paths, workers=None, ordered=False, max_inflight=None, **options):
+    # type: (Iterable[str|Path], int|None, bool, int|None, Any) -> Iterator[tuple[str|Path, idk.IsccMeta|Exception]]
+    """
+    Generate ISCC-CODEs for many files in parallel worker processes.
+
+    Results are yielded as they complete (or in input order with `ordered=True`). The `paths`
+    iterable is consumed lazily and at most `max_inflight` files are queued or processing at any
+    time, so arbitrarily large (or endless) inputs can be streamed with bounded memory. Failures
+    do not stop the batch but are yielded as the result of the failing file.
+
+    Worker processes are kept warm and reused across calls (see `batch_executor_get`). They
+    process files with a snapshot of the current `sdk_opts` updated with `options`.
+
+    !!! example
+        ```python
+        import iscc_sdk as idk
+
+        for fp, result in idk.code_iscc_batch(["a.jpg", "b.mp3"], workers=2):
+            if isinstance(result, Exception):
+                print(f"Failed {fp}: {result}")
+            else:
+                print(fp, result.iscc)
+        ```
+
+    :param paths: Iterable of filepaths to process.
+    :param workers: Number of worker processes (default: CPU count).
+    :param ordered: Yield results in input order instead of completion order.
+    :param max_inflight: Maximum number of submitted but unconsumed files (default: 2 * workers).
+    :param options: Keyword arguments forwarded to ``sdk_opts`` (see `code_iscc`).
+    :return: Iterator of (filepath, IsccMeta or Exception) tuples.
+    """
+    opts = idk.opts_get().override(options).model_dump()
+    executor = idk.batch_executor_get(workers)
+    max_inflight = max_inflight or 2 * executor.workers
+    pending = deque()  # type: deque[tuple[str|Path, Future]]
+    paths = iter(paths)
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and len(pending) < max_inflight:
+                fp = next(paths, None)
+                if fp is None:
+                    exhausted = True
+                else:
+                    pending.append((fp, executor.submit(_batch_process, fp, opts)))
+            if not pending:
+                return
+            if ordered:
+                done = {pending[0][1]}
+                wait(done)
+            else:
+                done, _ = wait([future for _, future in pending], return_when=FIRST_COMPLETED)
+            for item in [item for item in pending if item[1] in done]:
+                pending.remove(item)
+                fp, future = item
+                try:
+                    yield fp, future.result()
+                except Exception as e:
+                    yield fp, e
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+
+def _staged(name, nbytes, func, *args, **kwargs):
+    # type: (str, int|None, Callable, Any, Any) -> Any
+    """Call function as processing stage `name` (see `stage`)."""
+    with idk.stage(name, nbytes):
+        return func(*args, **kwargs)
+
+
+def _batch_process(fp, opts):
+    # type: (str|Path, dict) -> idk.IsccMeta|Exception
+    """Generate ISCC-CODE in batch worker process and return exceptions as result."""
+    try:
+        return code_iscc(fp, **opts)
+    except Exception as e:
+        return e
+
+
+@idk.opts_scoped
 def code_meta(fp, name=None, description=None, meta=None, **options):
     # type: (str|Path, str|None, str|None, str|dict|None, Any) -> idk.IsccMeta
     """
@@ -391,7 +560,7 @@ def code_meta(fp, name=None, description=None, meta=None, **options):
     Creates an ISCC Meta-Code based on normalized metadata extracted from the file.
     If no name is found in metadata, the filename will be used instead.
 
-    :param fp: Filepath used for Meta-Code creation.
+    :param fp: Filepath or `Asset` processing context used for Meta-Code creation.
     :param name: Optional name to override extracted metadata.
     :param description: Optional description to override extracted metadata.
     :param meta: Optional metadata (Data-URL as string or dict) to override extracted metadata.
@@ -400,13 +569,14 @@ def code_meta(fp, name=None, description=None, meta=None, **options):
         **bits** - Bit-length of the generated Meta-Code UNIT. Default: 64
     :return: ISCC metadata including Meta-Code and extracted metadata fields.
     """
-    fp = Path(fp)
-    opts = idk.sdk_opts.override(options)
+    asset = idk.asset_open(fp)
+    fp = asset.path
+    opts = idk.opts_get()
 
     meta_dict = dict()
 
     if opts.extract_meta:
-        meta_dict = idk.extract_metadata(fp).dict()
+        meta_dict = idk.extract_metadata(asset).dict()
 
     # Override with provided parameters if they exist
     if name is not None:
@@ -437,6 +607,7 @@ def code_meta(fp, name=None, description=None, meta=None, **options):
     return idk.IsccMeta.model_construct(**meta_dict)
 
 
+@idk.opts_scoped
 def code_content(fp, **options):
     # type: (str|Path, Any) -> idk.IsccMeta
     """
@@ -445,7 +616,7 @@ def code_content(fp, **options):
     Analyzes the file to determine its media type and routes the processing to the
     appropriate specialized function (code_text, code_image, code_audio, or code_video).
 
-    :param fp: Filepath
+    :param fp: Filepath or `Asset` processing context
     :param options: Keyword arguments forwarded to ``sdk_opts``:
         **extract_meta** - Whether to extract metadata. Default: True;
         **create_thumb** - Whether to create a thumbnail. Default: True;
@@ -456,7 +627,7 @@ def code_content(fp, **options):
     :return: Content-Code wrapped in ISCC metadata.
     :raises idk.IsccUnsupportedMediatype: If the media type is not supported.
     """
-    fp = Path(fp)
+    asset = idk.asset_open(fp)
     schema_org_map = {
         "text": "TextDigitalDocument",
         "image": "ImageObject",
@@ -464,16 +635,16 @@ def code_content(fp, **options):
         "video": "VideoObject",
     }
 
-    mediatype, mode = idk.mediatype_and_mode(fp)
+    mediatype, mode = idk.mediatype_and_mode(asset)
 
     if mode == "image":
-        cc = code_image(fp, **options)
+        cc = code_image(asset, **options)
     elif mode == "audio":
-        cc = code_audio(fp, **options)
+        cc = code_audio(asset, **options)
     elif mode == "video":
-        cc = code_video(fp, **options)
+        cc = code_video(asset, **options)
     elif mode == "text":
-        cc = code_text(fp, **options)
+        cc = code_text(asset, **options)
     else:  # pragma nocover
         raise idk.IsccUnsupportedMediatype(mediatype)
 
@@ -484,6 +655,7 @@ def code_content(fp, **options):
     return cc
 
 
+@idk.opts_scoped
 def code_text(fp, text=None, **options):
     # type: (str|Path, str|None, Any) -> idk.IsccMeta
     """
@@ -492,7 +664,7 @@ def code_text(fp, text=None, **options):
     Creates a Text-Code by extracting and processing text content from document files.
     Can optionally extract metadata and create a thumbnail representation of the text.
 
-    :param fp: Filepath used for Text-Code creation.
+    :param fp: Filepath or `Asset` processing context used for Text-Code creation.
     :param text: Optional cleaned text. If provided, the function will skip text extraction.
     :param options: Keyword arguments forwarded to ``sdk_opts``:
         **extract_meta** - Whether to extract metadata. Default: True;
@@ -502,22 +674,21 @@ def code_text(fp, text=None, **options):
         **text_keep** - Keep extracted plaintext on ``IsccMeta.text``. Default: False
     :return: ISCC metadata including Text-Code.
     """
-    fp = Path(fp)
-    opts = idk.sdk_opts.override(options)
+    asset = idk.asset_open(fp)
+    opts = idk.opts_get()
     meta: dict[str, Any] = dict()
 
     if opts.extract_meta:
-        meta = idk.text_meta_extract(fp)
+        meta = idk.text_meta_extract(asset)
 
     if opts.create_thumb:
-        thumbnail_img = idk.text_thumbnail(fp)
+        thumbnail_img = idk.text_thumbnail(asset)
         if thumbnail_img:
             thumbnail_durl = idk.image_to_data_url(thumbnail_img)
             meta["thumbnail"] = thumbnail_durl
 
     if text is None:
-        text = idk.text_extract(fp)
-        text = il.text_clean(text)
+        text = _text_cleaned(asset, opts)
 
     code = il.gen_text_code_v0(text, bits=opts.bits)
     meta.update(code)
@@ -529,6 +700,14 @@ def code_text(fp, text=None, **options):
     return idk.IsccMeta.model_construct(**meta)
 
 
+def _text_cleaned(asset, opts):
+    # type: (idk.Asset, idk.SdkOptions) -> str
+    """Extract and clean text (or load it from the feature store)."""
+    return idk.feature_memo(
+        asset, "text", lambda: il.text_clean(idk.text_extract(asset)), opts=opts
+    )
+
+
 def code_text_semantic(fp, text=None, **options):
     # type: (str|Path, Any) -> idk.IsccMeta
     """
@@ -553,6 +732,7 @@ def code_text_semantic(fp, text=None, **options):
         return idk.IsccMeta.model_construct(**result)
 
 
+@idk.opts_scoped
 def code_image(fp, **options):
     # type: (str|Path, Any) -> idk.IsccMeta
     """
@@ -561,37 +741,127 @@ def code_image(fp, **options):
     Creates an Image-Code by normalizing and processing the visual content of image files.
     The image is normalized according to SDK options (transparency handling, border trimming, ...).
 
-    :param fp: Filepath used for Image-Code creation.
+    :param fp: Filepath or `Asset` processing context used for Image-Code creation.
     :param options: Keyword arguments forwarded to ``sdk_opts``:
         **extract_meta** - Whether to extract metadata. Default: True;
         **create_thumb** - Whether to create a thumbnail. Default: True;
         **bits** - Bit-length of the generated Image-Code UNIT. Default: 64
     :return: ISCC metadata including Image-Code.
     """
-    fp = Path(fp)
-    opts = idk.sdk_opts.override(options)
+    asset = idk.asset_open(fp)
+    fp = asset.path
+    opts = idk.opts_get()
     meta: dict[str, Any] = dict()
-    mt, _ = idk.mediatype_and_mode(fp)
-    is_svg = mt == "image/svg+xml"
+    is_svg = asset.mediatype == "image/svg+xml"
 
     if opts.extract_meta:
-        meta = idk.image_meta_extract(fp)
+        meta = idk.image_meta_extract(asset)
 
     # Rasterize SVG once, reuse for both thumbnail and content code
-    img = idk.svg_rasterize(fp) if is_svg else Image.open(fp)
-
+    img = None
     if opts.create_thumb:
-        thumbnail_img = idk.svg_thumbnail(fp, img=img) if is_svg else idk.image_thumbnail(fp)
+        if is_svg:
+            img = idk.svg_rasterize(fp)
+            thumbnail_img = idk.svg_thumbnail(fp, img=img)
+        else:
+            thumbnail_img = idk.image_thumbnail(asset)
         thumbnail_durl = idk.image_to_data_url(thumbnail_img)
         meta["thumbnail"] = thumbnail_durl
 
-    pixels = idk.image_normalize(img)
-    code_obj = il.gen_image_code_v0(pixels, bits=opts.bits)  # type: ignore[arg-type]
+    pixels = _image_pixels(asset, opts, img)
+    code_obj = il.gen_image_code_v0(pixels, bits=opts.bits)
     meta.update(code_obj)
 
     return idk.IsccMeta.model_construct(**meta)
 
 
+@idk.opts_scoped
+def code_image_batch(items, **options):
+    # type: (Iterable[str|Path|idk.Asset|Image.Image], Any) -> list[idk.IsccMeta]
+    """
+    Generate Content-Codes Image for many images.
+
+    Images are decoded and normalized in parallel on the shared worker pool (see `executor_get`).
+    The normalized 32x32 grayscale pixels of all images are stacked into one matrix that is hashed
+    in a single vectorized step. Codes are identical to `code_image`. Metadata and thumbnails are
+    not processed.
+
+    :param items: Filepaths, `Asset` processing contexts or Pillow Image objects.
+    :param options: Keyword arguments forwarded to ``sdk_opts``:
+        **bits** - Bit-length of the generated Image-Code UNITs. Default: 64
+    :return: ISCC metadata with Image-Code for each item (in input order).
+    """
+    opts = idk.opts_get()
+    futures = [idk.executor_submit(_image_row, item, opts) for item in items]
+    rows = b"".join(future.result() for future in futures)
+    pixels = np.frombuffer(rows, dtype=np.uint8).reshape(-1, 1024)
+    return [idk.IsccMeta.model_construct(iscc=code) for code in _image_codes(pixels, opts.bits)]
+
+
+def _image_pixels(asset, opts, img=None):
+    # type: (idk.Asset, idk.SdkOptions, Image.Image|None) -> bytes|list[int]
+    """Normalized Image-Code pixels of an asset (from `img` if it is already decoded)."""
+
+    def normalize():
+        # type: () -> bytes
+        if img is not None:
+            return idk.image_normalize_bytes(img)
+        if asset.mediatype == "image/svg+xml":
+            return idk.image_normalize_bytes(idk.svg_rasterize(asset.path))
+        return idk.image_normalize_bytes(idk.image_decode(asset))
+
+    settings = [opts.image_exif_transpose, opts.image_fill_transparency, opts.image_trim_border]
+    if opts.image_fast_decode:  # Decode size depends on the thumbnail size
+        settings += [opts.image_fast_decode, opts.image_thumbnail_size]
+    return idk.feature_memo(asset, "image", normalize, settings, opts)
+
+
+def _image_row(item, opts):
+    # type: (str|Path|idk.Asset|Image.Image, idk.SdkOptions) -> bytes
+    """Normalized pixels of an image for `code_image_batch` (decoded image is released)."""
+    if isinstance(item, Image.Image):
+        return idk.image_normalize_bytes(item)
+    asset = idk.asset_open(item)
+    pixels = _image_pixels(asset, opts)
+    asset.release("image")
+    return bytes(pixels)
+
+
+#: Unnormalized DCT-II basis of the 32x32 Image-Code transform
+_DCT_BASIS = np.cos(np.pi / 32 * (np.arange(32) + 0.5) * np.arange(32).reshape(-1, 1))
+
+#: Offsets of the 8x8 low frequency DCT blocks for each 64 bits of an Image-Code
+_DCT_BLOCKS = ((0, 0), (0, 1), (1, 0), (1, 1))
+
+
+def _image_codes(pixels, bits):
+    # type: (np.ndarray, int) -> list[str]
+    """
+    Compute Image-Codes for a matrix of normalized pixels (one image per row).
+
+    Bits are set for DCT coefficients above the median of their block. Images with a coefficient
+    within rounding error of its block median (like flat images) are hashed with
+    `gen_image_code_v0` to stay bit-exact.
+    """
+    if bits > 256 or not len(pixels):
+        return [il.gen_image_code_v0(row.tobytes(), bits=bits)["iscc"] for row in pixels]
+    dct = _DCT_BASIS @ pixels.reshape(-1, 32, 32).astype(np.float64) @ _DCT_BASIS.T
+    blocks = [dct[:, r : r + 8, c : c + 8].reshape(-1, 64) for r, c in _DCT_BLOCKS]
+    blocks = np.stack(blocks[: -(-bits // 64)], axis=1)
+    medians = np.median(blocks, axis=2, keepdims=True)
+    tolerance = 1e-6 * (1 + np.abs(dct).max(axis=(1, 2)))
+    ambiguous = (np.abs(blocks - medians) <= tolerance[:, None, None]).any(axis=(1, 2))
+    digests = np.packbits((blocks > medians).reshape(len(pixels), -1)[:, :bits], axis=1)
+    codes = []
+    for row, digest, fallback in zip(pixels, digests, ambiguous):
+        if fallback:
+            codes.append(il.gen_image_code_v0(row.tobytes(), bits=bits)["iscc"])
+        else:
+            unit = il.encode_component(il.MT.CONTENT, il.ST.IMAGE, il.VS.V0, bits, digest.tobytes())
+            codes.append(f"ISCC:{unit}")
+    return codes
+
+
 def code_image_semantic(fp, **options):
     # type: (str|Path, Any) -> idk.IsccMeta
     """
@@ -611,6 +881,7 @@ def code_image_semantic(fp, **options):
         return idk.IsccMeta.model_construct(**meta)
 
 
+@idk.opts_scoped
 def code_audio(fp, **options):
     # type: (str|Path, Any) -> idk.IsccMeta
     """
@@ -619,32 +890,35 @@ def code_audio(fp, **options):
     Creates an Audio-Code by extracting acoustic fingerprints from audio files.
     Uses chromaprint/fpcalc to generate audio features for similarity matching.
 
-    :param fp: Filepath used for Audio-Code creation.
+    :param fp: Filepath or `Asset` processing context used for Audio-Code creation.
     :param options: Keyword arguments forwarded to ``sdk_opts``:
         **extract_meta** - Whether to extract metadata. Default: True;
         **create_thumb** - Whether to create a thumbnail. Default: True;
         **bits** - Bit-length of the generated Audio-Code UNIT. Default: 64
     :return: ISCC metadata including Audio-Code.
     """
-    fp = Path(fp)
-    opts = idk.sdk_opts.override(options)
+    asset = idk.asset_open(fp)
+    opts = idk.opts_get()
     meta = dict()
 
     if opts.extract_meta:
-        meta = idk.audio_meta_extract(fp)
+        meta = idk.audio_meta_extract(asset)
     if opts.create_thumb:
-        thumbnail_img = idk.audio_thumbnail(fp)
+        thumbnail_img = idk.audio_thumbnail(asset)
         if thumbnail_img:
             thumbnail_durl = idk.image_to_data_url(thumbnail_img)
             meta["thumbnail"] = thumbnail_durl
 
-    features = idk.audio_features_extract(fp)
+    features = idk.feature_memo(
+        asset, "audio", lambda: idk.audio_features_extract(asset), opts=opts
+    )
     code_obj = il.gen_audio_code_v0(features["fingerprint"], bits=opts.bits)
     meta.update(code_obj)
 
     return idk.IsccMeta.model_construct(**meta)
 
 
+@idk.opts_scoped
 def code_video(fp, **options):
     # type: (str|Path, Any) -> idk.IsccMeta
     """
@@ -653,52 +927,155 @@ def code_video(fp, **options):
     Creates a Video-Code by extracting and processing visual features from video frames.
     Uses MPEG-7 signature tools to extract frame-based features and optionally detect scene changes.
 
-    :param fp: Filepath used for Video-Code creation.
+    :param fp: Filepath or `Asset` processing context used for Video-Code creation.
     :param options: Keyword arguments forwarded to ``sdk_opts``:
         **extract_meta** - Whether to extract metadata. Default: True;
         **create_thumb** - Whether to create a thumbnail. Default: True;
         **granular** - Generate additional fingerprints based on scenes. Default: False;
         **video_store_mp7sig** - Whether to store extracted MP7 Video signature file. Default: False;
+        **video_single_pass** - Extract all video features with a single decode. Default: True;
+        **video_workers** - Parallel ffmpeg workers for signature extraction. Default: 1;
         **bits** - Bit-length of the generated Video-Code UNIT. Default: 64
     :return: ISCC metadata including Video-Code.
     """
-    fp = Path(fp)
-    opts = idk.sdk_opts.override(options)
+    asset = idk.asset_open(fp)
+    fp = asset.path
+    opts = idk.opts_get()
     meta: dict[str, Any] = dict()
 
+    # Frame signatures and scenes (the video is only decoded on a feature store miss)
+    signatures, scenes = _video_features_load(_video_features(asset, opts))
+
+    # Thumbnail and metadata (from the single pass or a pass without signature extraction)
+    _video_single_pass(asset, opts, signature=False)
+
     if opts.extract_meta:
-        meta = idk.video_meta_extract(fp)
+        meta = idk.video_meta_extract(asset)
 
     if opts.create_thumb:
-        thumbnail_image = idk.video_thumbnail(fp)
+        thumbnail_image = idk.video_thumbnail(asset)
         if thumbnail_image is not None:
             thumbnail_durl = idk.image_to_data_url(thumbnail_image)
             meta["thumbnail"] = thumbnail_durl
 
-    sig, scenes = None, []
+    code_obj = il.gen_video_code_v0(signatures.vectors.tolist(), bits=opts.bits)
+    meta.update(code_obj)
+
     if opts.granular:
-        sig, scenes = idk.video_mp7sig_extract_scenes(fp)
+        granular = idk.video_compute_granular(signatures, scenes)
+        meta["features"] = [granular]
+
+    return idk.IsccMeta.model_construct(**meta)
+
+
+def _video_features(asset, opts):
+    # type: (idk.Asset, idk.SdkOptions) -> bytes
+    """
+    Get MP7 frame signatures and scene cutpoints of a video serialized as NPZ data.
+
+    The features are computed once per asset and looked up in the feature store (if enabled)
+    before the video is decoded. Only on a miss the video is decoded with a single pass that also
+    extracts thumbnail and metadata.
+    """
+    # Parallel extraction only matches sequential extraction within tolerance (range boundaries)
+    settings = [opts.video_fps, opts.video_fast_decode, opts.granular and opts.video_scene_limit]
+    if _video_parallel(opts):
+        settings.append(opts.video_workers)
+
+    def extract():
+        # type: () -> bytes
+        _video_single_pass(asset, opts)
+        return _video_features_dump(asset, opts)
+
+    key = f"video_features:{settings}"
+    return asset.memo(key, idk.feature_memo, asset, "video", extract, settings, opts)
+
+
+def _video_features_dump(asset, opts):
+    # type: (idk.Asset, idk.SdkOptions) -> bytes
+    """Extract MP7 frame signatures and scene cutpoints (if granular) serialized as NPZ data."""
+    if _video_parallel(opts):
+        signatures, scenes = idk.video_frames_extract_parallel(
+            asset, scenes=opts.granular, workers=opts.video_workers
+        )
     else:
-        sig = idk.video_mp7sig_extract(fp)
+        sig, scenes = None, []
+        if opts.granular:
+            sig, scenes = idk.video_mp7sig_extract_scenes(asset)
+        else:
+            sig = idk.video_mp7sig_extract(asset)
+
+        if opts.video_store_mp7sig:
+            outp = asset.path.with_suffix(".iscc.mp7sig")
+            with open(outp, "wb") as outf:
+                outf.write(sig)
+
+        signatures = idk.decode_mp7_signature(sig)
+
+    buffer = io.BytesIO()
+    np.savez(
+        buffer,
+        vectors=signatures.vectors,
+        media_time=signatures.media_time,
+        confidence=signatures.confidence,
+        media_time_unit=np.array(signatures.media_time_unit),
+        scenes=np.array(scenes, dtype=np.float64),
+    )
+    return buffer.getvalue()
+
+
+def _video_features_load(data):
+    # type: (bytes) -> tuple[idk.FrameSignatures, list[float]]
+    """Load MP7 frame signatures and scene cutpoints from NPZ data."""
+    arrays = np.load(io.BytesIO(data), allow_pickle=False)
+    signatures = idk.FrameSignatures(
+        vectors=arrays["vectors"],
+        media_time=arrays["media_time"],
+        confidence=arrays["confidence"],
+        media_time_unit=int(arrays["media_time_unit"]),
+    )
+    return signatures, arrays["scenes"].tolist()
 
-    if opts.video_store_mp7sig:
-        outp = fp.with_suffix(".iscc.mp7sig")
-        with open(outp, "wb") as outf:
-            outf.write(sig)
 
-    frames = idk.read_mp7_signature(sig)
-    features = [tuple(frame.vector.tolist()) for frame in frames]
+def _video_single_pass(asset, opts, signature=True):
+    # type: (idk.Asset, idk.SdkOptions, bool) -> None
+    """
+    Run single-pass video extraction for all outputs requested by `opts`.
 
-    code_obj = il.gen_video_code_v0(features, bits=opts.bits)
-    meta.update(code_obj)
+    The results are cached on the `Asset` and picked up by the individual video extraction
+    functions. If ffmpeg fails the individual functions fall back to separate ffmpeg runs.
 
-    if opts.granular:
-        granular = idk.video_compute_granular(frames, scenes)
-        meta["features"] = [granular]
+    :param asset: Processing context of the video
+    :param opts: Effective SDK options
+    :param signature: Extract MP7 signature (and scenes if granular)
+    """
+    if not opts.video_single_pass or "video" in asset.cache:
+        return
+    # Signature and scenes are extracted by parallel workers if enabled
+    signature = signature and not _video_parallel(opts)
+    # Keyframe thumbnails are extracted separately as they require a keyframe-only decode
+    thumbnail = opts.create_thumb and not opts.video_keyframe_thumbnail
+    if not (signature or thumbnail or opts.extract_meta):
+        return
+    try:
+        idk.video_extract(
+            asset,
+            scenes=opts.granular and signature,
+            thumbnail=thumbnail,
+            metadata=opts.extract_meta,
+            signature=signature,
+        )
+    except (subprocess.CalledProcessError, OSError) as e:
+        log.warning(f"Single pass video extraction failed for {asset.path.name}: {e}")
 
-    return idk.IsccMeta.model_construct(**meta)
+
+def _video_parallel(opts):
+    # type: (idk.SdkOptions) -> bool
+    """Check if MP7 signatures should be extracted with parallel workers (no raw signature)."""
+    return opts.video_workers > 1 and not opts.video_store_mp7sig
 
 
+@idk.opts_scoped
 def code_data(fp, **options):
     # type: (str|Path, Any) -> idk.IsccMeta
     """
@@ -713,7 +1090,7 @@ def code_data(fp, **options):
     :return: ISCC metadata including Data-Code.
     """
     fp = Path(fp)
-    opts = idk.sdk_opts.override(options)
+    opts = idk.opts_get()
 
     with open(fp, "rb") as stream:
         result = il.gen_data_code_v0(stream, bits=opts.bits)
@@ -721,6 +1098,7 @@ def code_data(fp, **options):
     return idk.IsccMeta.model_construct(**result)
 
 
+@idk.opts_scoped
 def code_instance(fp, **options):
     # type: (str|Path, Any) -> idk.IsccMeta
     """
@@ -737,7 +1115,7 @@ def code_instance(fp, **options):
     :return: ISCC metadata including Instance-Code, datahash, and filesize.
     """
     fp = Path(fp)
-    opts = idk.sdk_opts.override(options)
+    opts = idk.opts_get()
 
     with open(fp, "rb") as stream:
         result = il.gen_instance_code_v0(stream, bits=opts.bits)
@@ -745,22 +1123,27 @@ def code_instance(fp, **options):
     return idk.IsccMeta.model_construct(**result)
 
 
+@idk.opts_scoped
 def code_sum(fp, **options):
     # type: (str|Path, Any) -> idk.IsccMeta
     """
     Create an ISCC-CODE with Data- and Instance-Code UNITs in a single pass.
 
-    :param fp: Filepath used for ISCC-CODE Sum creation.
+    :param fp: Filepath or `Asset` processing context used for ISCC-CODE Sum creation.
     :param options: Keyword arguments forwarded to ``sdk_opts``:
         **bits** - Bit-length for Data-Code body. Default: 64;
         **wide** - Whether to use wide or narrow ISCC-CODE (64-bit or 128-bit UNITs);
-        **add_units** - Include individual ISCC-UNITs in result. Default: False
+        **add_units** - Include individual ISCC-UNITs in result. Default: False;
+        **add_cid** - Add IPFS CIDv1 as ``content`` URI (same file read). Default: False
     :return: ISCC metadata.
     """
-    fp = Path(fp)
-    opts = idk.sdk_opts.override(options)
+    asset = idk.asset_open(fp)
+    opts = idk.opts_get()
 
-    result = il.gen_sum_code_v0(fp, bits=opts.bits, wide=opts.wide, add_units=opts.add_units)
+    # Read and hash the file once per asset (the datahash also keys the feature store)
+    key = f"sum:{opts.bits}:{opts.wide}:{opts.add_units}:{opts.add_cid}"
+    result, cid = asset.memo(key, _sum_hash, asset.path, opts)
+    asset.cache.setdefault("datahash", result["datahash"])
     meta = {
         "iscc": result["iscc"],
         "datahash": result["datahash"],
@@ -768,5 +1151,37 @@ def code_sum(fp, **options):
     }
     if result.get("units"):
         meta["units"] = result["units"]
+    if cid:
+        meta["content"] = f"ipfs://{cid}"
 
     return idk.IsccMeta.model_construct(**meta)
+
+
+def _sum_hash(fp, opts):
+    # type: (Path, idk.SdkOptions) -> tuple[il.SumCodeResult, str|None]
+    """Compute ISCC-CODE Sum and (with the `add_cid` option) IPFS CIDv1 of a file."""
+    if opts.add_cid:
+        return _sum_cid(fp, opts)
+    return il.gen_sum_code_v0(fp, bits=opts.bits, wide=opts.wide, add_units=opts.add_units), None
+
+
+def _sum_cid(fp, opts):
+    # type: (Path, idk.SdkOptions) -> tuple[il.SumCodeResult, str]
+    """
+    Compute ISCC-SUM and IPFS CIDv1 with a single read of the file.
+
+    Chunks are hashed for the IPFS CID on the shared worker pool while the next Data- and
+    Instance-Code update runs (both hashers release the GIL).
+    """
+    sum_hasher, cid_hasher = il.SumHasher(), idk.IpfsHasher()
+    pending = None
+    with open(fp, "rb") as infile:
+        while chunk := infile.read(il.IO_READ_SIZE):
+            if pending is not None:
+                pending.result()
+            pending = idk.executor_submit(cid_hasher.update, chunk)
+            sum_hasher.update(chunk)
+    if pending is not None:
+        pending.result()
+    result = sum_hasher.finalize(bits=opts.bits, wide=opts.wide, add_units=opts.add_units)
+    return result, cid_hasher.finalize()
@@ -2,7 +2,6 @@
 
 import mimetypes
 import re
-from pathlib import Path
 
 import magic
 from loguru import logger as log
@@ -24,7 +23,7 @@ __all__ = [
 
 
 def mediatype_and_mode(fp, file_name=None):
-    # type: (str|Path, Optional[str]) -> tuple[str, str]
+    # type: (str|Path|idk.Asset, Optional[str]) -> tuple[str, str]
     """
     Detect mediatype and processing mode for a file.
 
@@ -36,20 +35,14 @@ def mediatype_and_mode(fp, file_name=None):
 
         ```
 
-    :param fp: Filepath
+    Results are cached when `fp` is an `Asset` processing context.
+
+    :param fp: Filepath or `Asset`
     :param file_name: Custom filename for MIME type guessing (overrides actual filename).
     :return: A tuple of `mediatype` and `mode`
     """
-    fp = Path(fp)
-    with open(fp, "rb") as infile:
-        data = infile.read(4096)
-
-    mediatype = mediatype_guess(data, file_name=file_name or fp.name)
-    try:
-        mode = mediatype_to_mode(mediatype)
-    except idk.IsccUnsupportedMediatype:
-        raise idk.IsccUnsupportedMediatype(f"Unsupported mediatype {mediatype} for {fp.name}")
-    return mediatype, mode
+    asset = idk.asset_open(fp, file_name=file_name)
+    return asset.mediatype, asset.mode
 
 
 def mediatype_guess(data, file_name=None):
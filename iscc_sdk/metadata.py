@@ -6,7 +6,7 @@ from typing import Any
 
 import iscc_lib as il
 import iscc_schema as iss
-from pydantic import field_validator
+from pydantic import Field, field_validator
 
 import iscc_sdk as idk
 
@@ -32,22 +32,18 @@ EMBEDDERS = {
 
 
 def extract_metadata(fp, file_name=None):
-    # type: (str|Path, Optional[str]) -> idk.IsccMeta
+    # type: (str|Path|idk.Asset, Optional[str]) -> idk.IsccMeta
     """
     Extract metadata from file.
 
-    :param fp: Filepath to media file.
+    :param fp: Filepath to media file or `Asset` processing context.
     :param file_name: Custom filename for MIME type guessing (overrides actual filename).
     :return: Metadata mapped to IsccMeta schema
     """
-    fp = Path(fp)
-    mime, mode = idk.mediatype_and_mode(fp, file_name=file_name)
-    extractor = EXTRACTORS.get(str(mode))
+    asset = idk.asset_open(fp, file_name=file_name)
+    extractor = EXTRACTORS.get(str(asset.mode))
     if extractor:
-        if mode == "image":
-            metadata: dict[str, Any] = idk.image_meta_extract(fp, file_name=file_name)
-        else:
-            metadata: dict[str, Any] = extractor(fp)
+        metadata: dict[str, Any] = extractor(asset)
         return idk.IsccMeta.model_construct(**metadata)
 
 
@@ -64,10 +60,10 @@ def embed_metadata(fp, meta, outpath=None):
     """
     if isinstance(meta, dict):
         meta = idk.IsccMeta.model_construct(**meta)
-    mime, mode = idk.mediatype_and_mode(fp)
-    embedder = EMBEDDERS.get(str(mode))
+    asset = idk.asset_open(fp)
+    embedder = EMBEDDERS.get(str(asset.mode))
     if embedder:
-        new_file_path = embedder(fp, meta)
+        new_file_path = embedder(asset, meta)
         if new_file_path and outpath:
             outpath = Path(outpath)
             outpath.parent.mkdir(parents=True, exist_ok=True)
@@ -89,6 +85,7 @@ class IsccMeta(iss.IsccMeta):  # type: ignore[misc]
     """
 
     parts: list[str | dict[str, Any]] | None = None
+    timings: dict[str, float] | None = Field(default=None, exclude=True)
 
     @field_validator("name", mode="before")
     @classmethod
@@ -1,3 +1,4 @@
+import math
 from dataclasses import dataclass
 from fractions import Fraction
 from functools import lru_cache
@@ -8,12 +9,17 @@ from bitarray.util import ba2int
 
 __all__ = [
     "Frame",
+    "FrameSignatures",
+    "decode_mp7_signature",
     "read_mp7_signature",
 ]
 
 
 SIGELEM_SIZE = 380
 
+# Frame record: 1 bit reserved, 32 bit media time, 8 bit confidence, 5*8 bit words, 76*8 bit vector
+FRAME_BITS = 1 + 32 + 8 + 5 * 8 + SIGELEM_SIZE // 5 * 8
+
 
 @dataclass
 class Frame:
@@ -24,6 +30,58 @@ class Frame:
     confidence: int  # signature confidence, range: 0..255
 
 
+@dataclass
+class FrameSignatures:
+    """Decoded MP7 Frame Signatures as contiguous arrays."""
+
+    vectors: np.ndarray  # (n_frames, 380) uint8 matrix, range: 0..2
+    media_time: np.ndarray  # (n_frames,) uint32 raw media time in media time units
+    confidence: np.ndarray  # (n_frames,) uint8 signature confidence, range: 0..255
+    media_time_unit: int  # media time units per second
+
+    def __len__(self):
+        # type: () -> int
+        return len(self.vectors)
+
+    @classmethod
+    def from_frames(cls, frames):
+        # type: (List[Frame]) -> FrameSignatures
+        """Build from a list of `Frame` objects (with exact media times)."""
+        tu = math.lcm(*(Fraction(f.elapsed).denominator for f in frames))
+        return cls(
+            vectors=np.array([f.vector for f in frames], dtype=np.uint8).reshape(-1, SIGELEM_SIZE),
+            media_time=np.array([int(f.elapsed * tu) for f in frames], dtype=np.uint32),
+            confidence=np.array([f.confidence for f in frames], dtype=np.uint8),
+            media_time_unit=tu,
+        )
+
+    @classmethod
+    def concat(cls, parts):
+        # type: (List[FrameSignatures]) -> FrameSignatures
+        """Concatenate consecutive frame signatures (with the same media time unit)."""
+        return cls(
+            vectors=np.concatenate([p.vectors for p in parts]),
+            media_time=np.concatenate([p.media_time for p in parts]),
+            confidence=np.concatenate([p.confidence for p in parts]),
+            media_time_unit=parts[0].media_time_unit,
+        )
+
+    @property
+    def elapsed(self):
+        # type: () -> np.ndarray
+        """Time elapsed since start of video in seconds (float64 array)."""
+        return self.media_time / self.media_time_unit
+
+    def frames(self):
+        # type: () -> List[Frame]
+        """Convert to a list of `Frame` objects."""
+        tu = self.media_time_unit
+        return [
+            Frame(vector=v, elapsed=Fraction(int(e), tu), confidence=int(c))
+            for v, e, c in zip(self.vectors, self.media_time, self.confidence)
+        ]
+
+
 @lru_cache
 def calc_byte_to_bit3():
     # type: () -> np.ndarray
@@ -59,16 +117,18 @@ def pop_bits(data_bits, pos, bits=32):
     return value, pos
 
 
-def read_mp7_signature(byte_data):
-    # type: (bytes) -> List[Frame]
+def decode_mp7_signature(byte_data):
+    # type: (bytes) -> FrameSignatures
     """
-    Decode binary MP7 video signature.
+    Decode binary MP7 video signature into contiguous arrays.
+
+    The frame records have a fixed bit stride, so all frames are unpacked at once and the
+    signature bytes are expanded to three-bit values with `calc_byte_to_bit3` as gather table.
 
     :param bytes byte_data: Raw MP7 video signature (as extracted by ffmpeg)
-    :return: List of Frame Signatures
-    :rtype: List[Frame]
+    :return: Frame signature vectors, media times and confidences
+    :rtype: FrameSignatures
     """
-    table_3_bit = calc_byte_to_bit3()
     data_bits = bitarray()
     data_bits.frombytes(byte_data)
     pos = 0
@@ -79,28 +139,28 @@ def read_mp7_signature(byte_data):
     num_of_segments, pos = pop_bits(data_bits, pos)
     pos += num_of_segments * (4 * 32 + 1 + 5 * 243)
     pos += 1
-    frame_sigs_v = []
-    frame_sigs_c = []
-    frame_sigs_e = []
-    frame_sigs_tu = []
-    for i in range(num_of_frames):
-        pos += 1
-        raw_media_time, pos = pop_bits(data_bits, pos)
-        frame_confidence, pos = pop_bits(data_bits, pos, 8)
-        pos += 5 * 8
-        vec = np.zeros((SIGELEM_SIZE,), dtype=np.uint8)
-        p = 0
-        for ii in range(SIGELEM_SIZE // 5):
-            dat, pos = pop_bits(data_bits, pos, 8)
-            vec[p : p + 5] = table_3_bit[dat]
-            p += 5
-        frame_sigs_v.append(vec)
-        frame_sigs_e.append(raw_media_time)
-        frame_sigs_c.append(frame_confidence)
-        frame_sigs_tu.append(media_time_unit)
-
-    fsigs = []
-    r = (frame_sigs_v, frame_sigs_e, frame_sigs_c, frame_sigs_tu)
-    for v, e, c, tu in zip(*r):
-        fsigs.append(Frame(vector=v, elapsed=Fraction(e, tu), confidence=c))
-    return fsigs
+
+    bits = np.unpackbits(np.frombuffer(byte_data, dtype=np.uint8))
+    records = bits[pos : pos + num_of_frames * FRAME_BITS].reshape(num_of_frames, FRAME_BITS)
+    media_time = np.packbits(records[:, 1:33], axis=1).view(">u4")[:, 0].astype(np.uint32)
+    confidence = np.packbits(records[:, 33:41], axis=1)[:, 0]
+    words = np.packbits(records[:, 81:], axis=1)
+    vectors = calc_byte_to_bit3()[words].reshape(num_of_frames, SIGELEM_SIZE)
+    return FrameSignatures(
+        vectors=vectors,
+        media_time=media_time,
+        confidence=confidence,
+        media_time_unit=media_time_unit,
+    )
+
+
+def read_mp7_signature(byte_data):
+    # type: (bytes) -> List[Frame]
+    """
+    Decode binary MP7 video signature.
+
+    :param bytes byte_data: Raw MP7 video signature (as extracted by ffmpeg)
+    :return: List of Frame Signatures
+    :rtype: List[Frame]
+    """
+    return decode_mp7_signature(byte_data).frames()
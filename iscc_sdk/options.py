@@ -12,7 +12,10 @@ class-atributes on the `SdkOptions` instance.
 
 """
 
-import copy
+import functools
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Literal
 
 import iscc_lib
@@ -22,7 +25,11 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 __all__ = [
     "SdkOptions",
+    "SdkOptionsSnapshot",
     "core_opts",
+    "opts_get",
+    "opts_scope",
+    "opts_scoped",
     "sdk_opts",
 ]
 
@@ -67,6 +74,16 @@ class SdkOptions(BaseSettings):
         description="ISCC_SDK_ADD_UNITS - Add ISCC-UNITS to ISCC metadata (in 'units' property)",
     )
 
+    add_cid: bool = Field(
+        default=False,
+        description="ISCC_SDK_ADD_CID - Add IPFS CIDv1 of the file as 'content' URI (hashed in the same pass as Data- and Instance-Code)",
+    )
+
+    add_timings: bool = Field(
+        default=False,
+        description="ISCC_SDK_ADD_TIMINGS - Attach per-stage processing times to results (in 'timings' attribute)",
+    )
+
     bits: int = Field(
         default=64,
         description="ISCC_SDK_BITS - Bit size of ISCC-UNITS in ISCC metadata (in 'units' property)",
@@ -106,6 +123,11 @@ class SdkOptions(BaseSettings):
         default=True, description="ISCC_SDK_IMAGE_TRIM_BORDER - Crop empty borders of images"
     )
 
+    image_fast_decode: bool = Field(
+        default=False,
+        description="ISCC_SDK_IMAGE_FAST_DECODE - Decode images at reduced resolution close to the Image-Code and thumbnail sizes (faster, approximate)",
+    )
+
     image_thumbnail_size: int = Field(
         default=128,
         description="ISCC_SDK_IMAGE_THUMBNAIL_SIZE - Size of larger side of thumbnail in number of pixels",
@@ -151,6 +173,71 @@ class SdkOptions(BaseSettings):
         description="ISCC_SDK_VIDEO_STORE_MP7SIG - Store extracted MP7 Video as <videofile>.iscc.mp7sig",
     )
 
+    video_fast_decode: bool = Field(
+        default=False,
+        description="ISCC_SDK_VIDEO_FAST_DECODE - Skip non-reference frames and loop filtering and downscale frames for faster (approximate) video signatures",
+    )
+
+    video_keyframe_thumbnail: bool = Field(
+        default=False,
+        description="ISCC_SDK_VIDEO_KEYFRAME_THUMBNAIL - Select video thumbnail from keyframes only (faster)",
+    )
+
+    video_workers: int = Field(
+        default=1,
+        description="ISCC_SDK_VIDEO_WORKERS - Parallel ffmpeg workers for MP7 signature extraction of long videos (1 = sequential)",
+    )
+
+    video_single_pass: bool = Field(
+        default=True,
+        description="ISCC_SDK_VIDEO_SINGLE_PASS - Extract signature, scenes, thumbnail and metadata with a single video decode",
+    )
+
+    ipfs_workers: int = Field(
+        default=1,
+        description="ISCC_SDK_IPFS_WORKERS - Parallel leaf hashing tasks for IPFS CIDv1 of large files (1 = sequential)",
+    )
+
+    pool_workers: int | None = Field(
+        default=None,
+        description="ISCC_SDK_POOL_WORKERS - Threads in the shared worker pool (None = min(32, CPU count + 4))",
+    )
+
+    cache: bool = Field(
+        default=False,
+        description="ISCC_SDK_CACHE - Cache code_iscc results in a local database and reuse them for unchanged files",
+    )
+
+    cache_path: str | None = Field(
+        default=None,
+        description="ISCC_SDK_CACHE_PATH - Path of the result cache database (None = cache.sqlite in user data dir)",
+    )
+
+    cache_max_size: int = Field(
+        default=1024**3,
+        description="ISCC_SDK_CACHE_MAX_SIZE - Maximum size of cached results in bytes (least recently used are evicted)",
+    )
+
+    cache_datahash: bool = Field(
+        default=False,
+        description="ISCC_SDK_CACHE_DATAHASH - Also verify file identity by a full content hash for cache lookups",
+    )
+
+    feature_store: bool = Field(
+        default=False,
+        description="ISCC_SDK_FEATURE_STORE - Store intermediate content features in a local database and reuse them for identical files",
+    )
+
+    feature_store_path: str | None = Field(
+        default=None,
+        description="ISCC_SDK_FEATURE_STORE_PATH - Path of the feature store database (None = features.sqlite in user data dir)",
+    )
+
+    feature_store_max_size: int = Field(
+        default=4 * 1024**3,
+        description="ISCC_SDK_FEATURE_STORE_MAX_SIZE - Maximum size of stored features in bytes (least recently used are evicted)",
+    )
+
     fallback: bool = Field(
         default=False,
         description="ISCC_SDK_FALLBACK - Create 2-UNIT ISCC-SUM for unsupported media types",
@@ -163,20 +250,94 @@ class SdkOptions(BaseSettings):
         return v
 
     def override(self, update=None):
-        # type: (dict|None) -> SdkOptions
-        """Returns an updated and validated deep copy of the current settings instance."""
+        # type: (dict|None) -> SdkOptionsSnapshot
+        """
+        Returns an updated and validated snapshot of the current settings instance.
+
+        Snapshots are immutable and hashable. Overriding a snapshot with values it already has
+        returns the snapshot itself.
+        """
 
         update = update or {}  # sets {} if update is None
 
-        opts = copy.deepcopy(self)
+        for field in update:
+            if field not in SdkOptions.model_fields:
+                raise ValueError(f"Invalid field: {field}")
+        if isinstance(self, SdkOptionsSnapshot):
+            if all(getattr(self, field) == value for field, value in update.items()):
+                return self
+
+        # Shallow copy without reading the environment (all option values are immutable)
+        opts = SdkOptions.model_construct(_fields_set=self.model_fields_set, **self.__dict__)
         # We need update fields individually so validation gets triggered
         for field, value in update.items():
-            if hasattr(self, field):
-                setattr(opts, field, value)
-            else:
-                raise ValueError(f"Invalid field: {field}")
-        return opts
+            setattr(opts, field, value)
+        return SdkOptionsSnapshot.model_construct(
+            _fields_set=opts.model_fields_set, **opts.__dict__
+        )
+
+
+class SdkOptionsSnapshot(SdkOptions):
+    """Immutable and hashable snapshot of SDK Configuration Options (see `SdkOptions.override`)"""
+
+    model_config = SettingsConfigDict(frozen=True)
+
+
+def opts_get():
+    # type: () -> SdkOptions
+    """
+    Get the effective SDK options of the current context.
+
+    Returns the options of the innermost active `opts_scope` or the global `sdk_opts`.
+    """
+    opts = _scope.get()
+    return sdk_opts if opts is None else opts
+
+
+@contextmanager
+def opts_scope(**options):
+    # type: (Any) -> Iterator[SdkOptionsSnapshot]
+    """
+    Override SDK options for all processing within the context.
+
+    Overrides are context-local (thread-safe and asyncio-task-safe) and nest. All `code_*`
+    functions run with their keyword options applied as scope.
+
+    !!! example
+        ```python
+        import iscc_sdk as idk
+
+        with idk.opts_scope(bits=128, image_thumbnail_size=256):
+            meta = idk.code_iscc("image.jpg")
+        ```
+
+    :param options: SDK options to override
+    :return: Effective options snapshot
+    """
+    opts = opts_get().override(options)
+    token = _scope.set(opts)
+    try:
+        yield opts
+    finally:
+        _scope.reset(token)
+
+
+def opts_scoped(func):
+    # type: (Callable) -> Callable
+    """Decorator that runs `func` with its extra keyword arguments applied as `opts_scope`."""
+    params = set(inspect.signature(func).parameters)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # type: (Any, Any) -> Any
+        options = {k: v for k, v in kwargs.items() if k not in params}
+        with opts_scope(**options):
+            return func(*args, **kwargs)
+
+    return wrapper
 
 
 sdk_opts = SdkOptions()  # type: ignore[call-arg]
+Image.MAX_IMAGE_PIXELS = sdk_opts.image_max_pixels
 core_opts = iscc_lib.core_opts
+_scope = ContextVar("sdk_opts_scope", default=None)  # type: ContextVar[SdkOptionsSnapshot|None]
@@ -53,7 +53,7 @@ def pdf_thumbnail(fp):
         img = doc[0].render().to_pil()
     finally:
         doc.close()
-    size = idk.sdk_opts.image_thumbnail_size
+    size = idk.opts_get().image_thumbnail_size
     img.thumbnail((size, size), resample=idk.LANCZOS)
     return ImageEnhance.Sharpness(img.convert("RGB")).enhance(1.4)
 
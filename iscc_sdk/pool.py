@@ -0,0 +1,184 @@
+"""*Shared worker pool for concurrent processing*."""
+
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextvars import copy_context
+
+import iscc_sdk as idk
+
+__all__ = [
+    "batch_executor_get",
+    "executor_get",
+    "executor_set",
+    "executor_shutdown",
+    "executor_submit",
+]
+
+_executor = None  # type: Executor|None
+_executor_owned = False
+_batch_executor = None  # type: _BatchExecutor|None
+_lock = threading.Lock()
+_local = threading.local()
+
+
+class _InlineExecutor(Executor):
+    """Executor that runs submitted calls immediately in the calling thread."""
+
+    def submit(self, fn, *args, **kwargs):
+        # type: (Callable, Any, Any) -> Future
+        future = Future()  # type: Future
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+_inline = _InlineExecutor()
+
+
+class _BatchExecutor(ProcessPoolExecutor):
+    """Process pool that keeps its number of workers and records when it broke."""
+
+    def __init__(self, workers):
+        # type: (int) -> None
+        super().__init__(max_workers=workers)
+        self.workers = workers
+        self.broken = False
+
+    def submit(self, fn, /, *args, **kwargs):
+        # type: (Callable, Any, Any) -> Future
+        try:
+            future = super().submit(fn, *args, **kwargs)
+        except BrokenProcessPool:
+            self.broken = True
+            raise
+        future.add_done_callback(self._check_broken)
+        return future
+
+    def _check_broken(self, future):
+        # type: (Future) -> None
+        if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+            self.broken = True
+
+
+def _mark_worker():
+    # type: () -> None
+    """Mark threads of the shared pool (initializer)."""
+    _local.worker = True
+
+
+def executor_get():
+    # type: () -> Executor
+    """
+    Get the shared executor used for concurrent processing (e.g. by `code_iscc_mt`).
+
+    The executor is created on first use and reused by all subsequent calls. Its size is
+    configured with the `pool_workers` option (read when the executor is created). Calls from
+    threads of the shared pool itself get an executor that runs tasks inline, so nested
+    processing can never deadlock the pool by waiting on tasks queued behind itself.
+
+    :return: Shared executor instance.
+    """
+    global _executor, _executor_owned
+    if getattr(_local, "worker", False):
+        return _inline
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=idk.opts_get().pool_workers,
+                thread_name_prefix="iscc-sdk",
+                initializer=_mark_worker,
+            )
+            _executor_owned = True
+        return _executor
+
+
+def executor_submit(fn, *args, **kwargs):
+    # type: (Callable, Any, Any) -> Future
+    """
+    Submit a call to the shared executor.
+
+    The call runs in a copy of the current context, so options scopes (see `opts_scope`) and
+    tool process tracking of the caller apply to it.
+
+    :param fn: Callable to run
+    :param args: Positional arguments for `fn`
+    :param kwargs: Keyword arguments for `fn`
+    :return: Future of the call
+    """
+    return executor_get().submit(copy_context().run, fn, *args, **kwargs)
+
+
+def executor_set(executor):
+    # type: (ThreadPoolExecutor|None) -> None
+    """
+    Use a custom thread pool executor for concurrent processing.
+
+    Only thread pools are supported: tasks share the options context and tool process tracking
+    of the caller, which cannot be passed to other processes.
+
+    A previously created SDK-owned executor is shut down (without waiting). Executors passed in
+    are never shut down by the SDK. Pass `None` to revert to an SDK-owned executor on next use.
+
+    !!! note
+        Tasks running on a custom executor must not wait on tasks submitted to the same
+        executor if its workers can be exhausted (use a separate or unbounded executor).
+
+    :param executor: ThreadPoolExecutor instance or None.
+    :raises TypeError: If `executor` is not a ThreadPoolExecutor.
+    """
+    global _executor, _executor_owned
+    if executor is not None and not isinstance(executor, ThreadPoolExecutor):
+        raise TypeError(f"Expected ThreadPoolExecutor or None, got {type(executor).__name__}")
+    with _lock:
+        if _executor is not None and _executor_owned:
+            _executor.shutdown(wait=False)
+        _executor = executor
+        _executor_owned = False
+
+
+def batch_executor_get(workers=None):
+    # type: (int|None) -> ProcessPoolExecutor
+    """
+    Get the shared worker process pool used by `code_iscc_batch`.
+
+    Worker processes stay warm and are reused across calls. The pool is recreated if a different
+    number of workers is requested or if it broke (e.g. a worker process crashed).
+
+    :param workers: Number of worker processes (default: CPU count).
+    :return: Shared process pool (with its number of worker processes as `workers` attribute).
+    """
+    global _batch_executor
+    workers = workers or os.cpu_count() or 1
+    with _lock:
+        executor = _batch_executor
+        if executor is not None and (executor.workers != workers or executor.broken):
+            executor.shutdown(wait=False, cancel_futures=True)
+            executor = None
+        if executor is None:
+            executor = _batch_executor = _BatchExecutor(workers)
+        return executor
+
+
+def executor_shutdown(wait=True):
+    # type: (bool) -> None
+    """
+    Shut down the shared executor and worker process pool and release their resources.
+
+    New executors are created on next use. Custom executors set with `executor_set` are detached
+    but not shut down.
+
+    :param wait: Wait for pending tasks to finish.
+    """
+    global _executor, _executor_owned, _batch_executor
+    with _lock:
+        executor, owned = _executor, _executor_owned
+        _executor, _executor_owned = None, False
+        batch_executor, _batch_executor = _batch_executor, None
+    if executor is not None and owned:
+        executor.shutdown(wait=wait)
+    if batch_executor is not None:
+        batch_executor.shutdown(wait=wait)
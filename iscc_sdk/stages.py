@@ -0,0 +1,134 @@
+"""
+*Processing stage instrumentation*
+
+Processing stages of `code_iscc` (`cache`, `sniff`, `video_decode`, `thumbnail`, `sum`,
+`content`, `meta` and `container`) and external tool runs (`ffmpeg`, `ffprobe` and `fpcalc`)
+report their wall time to registered stage hooks. Stages nest: tool runs are also included in
+the time of the stage that started them. Without hooks and timing collectors stages are not
+timed at all.
+
+!!! example
+    ```python
+    import iscc_sdk as idk
+
+
+    def on_stage(name, duration, nbytes):
+        print(f"{name}: {duration:.3f}s")
+
+
+    idk.stage_hook_add(on_stage)
+    idk.code_iscc("video.mp4")
+    ```
+
+Per-stage totals of a single call are attached to the result with the `add_timings` option
+(`IsccMeta.timings`) or collected for any block of code with `stage_timings`.
+"""
+
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+from loguru import logger as log
+
+__all__ = [
+    "stage",
+    "stage_hook_add",
+    "stage_hook_remove",
+    "stage_timings",
+]
+
+_hooks = []  # type: list[Callable[[str, float, int|None], Any]]
+_collectors = ContextVar("stage_collectors", default=())  # type: ContextVar[tuple[dict, ...]]
+_lock = threading.Lock()
+_disabled = nullcontext()
+
+
+class _Stage:
+    """Times a processing stage and reports it to hooks and active timing collectors."""
+
+    __slots__ = ("name", "nbytes", "start")
+
+    def __init__(self, name, nbytes):
+        # type: (str, int|None) -> None
+        self.name = name
+        self.nbytes = nbytes
+
+    def __enter__(self):
+        # type: () -> None
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        # type: (Any) -> None
+        duration = time.perf_counter() - self.start
+        collectors = _collectors.get()
+        if collectors:
+            with _lock:
+                for timings in collectors:
+                    timings[self.name] = timings.get(self.name, 0.0) + duration
+        for hook in tuple(_hooks):
+            try:
+                hook(self.name, duration, self.nbytes)
+            except Exception as e:
+                log.warning(f"Stage hook {hook!r} failed for stage {self.name}: {e}")
+
+
+def stage(name, nbytes=None):
+    # type: (str, int|None) -> ContextManager
+    """
+    Context manager that reports the wall time of a processing stage.
+
+    :param name: Stage name
+    :param nbytes: Number of bytes processed by the stage (if known)
+    :return: Context manager (a shared no-op if no hooks or timing collectors are active)
+    """
+    if not _hooks and not _collectors.get():
+        return _disabled
+    return _Stage(name, nbytes)
+
+
+def stage_hook_add(hook):
+    # type: (Callable[[str, float, int|None], Any]) -> None
+    """
+    Register a hook that is called as `hook(name, duration, nbytes)` after each stage.
+
+    Hooks are called in the thread that ran the stage (possibly concurrently). Exceptions raised
+    by hooks are logged and ignored. Hooks can be used to export stages as metrics or, for
+    example, as OpenTelemetry spans (start time is the current time minus `duration`).
+
+    :param hook: Callable with stage name, duration in seconds and processed bytes (or None)
+    """
+    with _lock:
+        if hook not in _hooks:
+            _hooks.append(hook)
+
+
+def stage_hook_remove(hook):
+    # type: (Callable[[str, float, int|None], Any]) -> None
+    """
+    Unregister a stage hook (no-op if not registered).
+
+    :param hook: Previously registered hook
+    """
+    with _lock:
+        if hook in _hooks:
+            _hooks.remove(hook)
+
+
+@contextmanager
+def stage_timings():
+    # type: () -> Iterator[dict[str, float]]
+    """
+    Collect total wall time per stage for all stages run within the context.
+
+    Collection is context-local, includes stages run on the shared worker pool on behalf of the
+    context (see `executor_submit`) and nests (stages are also collected by outer contexts).
+
+    :return: Dict that is filled with stage names and durations in seconds
+    """
+    timings = {}  # type: dict[str, float]
+    token = _collectors.set(_collectors.get() + (timings,))
+    try:
+        yield timings
+    finally:
+        _collectors.reset(token)
@@ -237,7 +237,7 @@ def svg_thumbnail(fp, img=None):
     else:
         img = img.copy()
 
-    size = idk.sdk_opts.image_thumbnail_size
+    size = idk.opts_get().image_thumbnail_size
     img = img.convert("RGB")
     img.thumbnail((size, size), resample=idk.LANCZOS)
     return ImageEnhance.Sharpness(img).enhance(1.4)
@@ -21,6 +21,7 @@ __all__ = [
     "text_meta_embed",
     "text_meta_extract",
     "text_name_from_uri",
+    "text_parse",
     "text_sanitize",
     "text_thumbnail",
 ]
@@ -58,22 +59,30 @@ SINGLE_VALUE_FIELDS = frozenset(
 )
 
 
+def text_parse(fp):
+    # type: (str|Path|idk.Asset) -> tuple[str, dict]
+    """
+    Extract plaintext and metadata from a text document with a single Tika parse.
+
+    :param fp: Filepath to text document file or `Asset` processing context.
+    :return: Tuple of extracted plaintext and metadata mapped to IsccMeta schema
+    :raises IsccExtractionError: If Tika fails to parse the document or no text could be extracted.
+    """
+    asset = idk.asset_open(fp)
+    return text_extract(asset), text_meta_extract(asset)
+
+
 def text_meta_extract(fp):
-    # type: (str|Path) -> dict
+    # type: (str|Path|idk.Asset) -> dict
     """
     Extract metadata from text document file.
 
-    :param fp: Filepath to text document file.
+    :param fp: Filepath to text document file or `Asset` processing context.
     :return: Metadata mapped to IsccMeta schema
     :raises IsccExtractionError: If Tika fails to parse the document.
     """
-    fp = Path(fp)
-    extractor = Extractor()
-    # extractor = extractor.set_extract_string_max_length()
-    try:
-        result, meta = extractor.extract_file_to_string(fp.as_posix())
-    except TypeError as e:
-        raise idk.IsccExtractionError(f"Tika failed to parse {fp.name}: {e}") from e
+    asset = idk.asset_open(fp)
+    result, meta = asset.memo("tika", _tika_extract, asset.path)
     mapped = dict()
     done = set()
     for tag, mapped_field in TEXT_META_MAP.items():
@@ -92,16 +101,17 @@ def text_meta_extract(fp):
 
 
 def text_meta_embed(fp, meta):
-    # type: (str|Path, IsccMeta) -> Path|None
+    # type: (str|Path|idk.Asset, IsccMeta) -> Path|None
     """
     Embed metadata into a copy of the text document.
 
-    :param fp: Filepath to source text document file
+    :param fp: Filepath to source text document file or `Asset` processing context
     :param meta: Metadata to embed into text document
     :return: Filepath to the new file with updated metadata (None if no embedding supported)
     """
-    fp = Path(fp)
-    mt, _ = idk.mediatype_and_mode(fp)
+    asset = idk.asset_open(fp)
+    fp = asset.path
+    mt = asset.mediatype
     if mt == "application/pdf":
         return idk.pdf_meta_embed(fp, meta)
     if mt == "application/epub+zip":
@@ -112,28 +122,41 @@ def text_meta_embed(fp, meta):
 
 
 def text_extract(fp):
-    # type: (str|Path) -> str
+    # type: (str|Path|idk.Asset) -> str
     """
     Extract plaintext from a text document.
 
-    :param fp: Filepath to text document file.
+    :param fp: Filepath to text document file or `Asset` processing context.
     :return: Extracted plaintext
     :raises IsccExtractionError: If Tika fails to parse the document or no text could be extracted.
     """
-    fp = Path(fp)
+    asset = idk.asset_open(fp)
+    fp = asset.path
     if fp.suffix.lower() == ".pdf":
         return idk.pdf_text_extract(fp)
-    extractor = Extractor()
-    try:
-        result, metadata = extractor.extract_file_to_string(fp.as_posix())
-    except TypeError as e:
-        raise idk.IsccExtractionError(f"Tika failed to parse {fp.name}: {e}") from e
+    result, metadata = asset.memo("tika", _tika_extract, fp)
     text = result.strip()
     if not text:
         raise idk.IsccExtractionError(f"No text extracted from {fp.name}")
     return result
 
 
+def _tika_extract(fp):
+    # type: (Path) -> tuple[str, dict]
+    """
+    Parse a document with Tika.
+
+    :param fp: Filepath to text document file.
+    :return: Tuple of raw plaintext and raw Tika metadata
+    :raises IsccExtractionError: If Tika fails to parse the document.
+    """
+    extractor = Extractor()
+    try:
+        return extractor.extract_file_to_string(fp.as_posix())
+    except TypeError as e:
+        raise idk.IsccExtractionError(f"Tika failed to parse {fp.name}: {e}") from e
+
+
 def text_features(text, **options):
     # type: (str) -> dict
     """
@@ -145,12 +168,12 @@ def text_features(text, **options):
         **byte_offsets** - Calculate offsets and sizes in UTF-8 bytes instead of chars. Default: False
     :returns dict: Dictionary with 'sizes', 'features', 'offsets', and 'contents'.
     """
-    opts = idk.sdk_opts.override(options)
+    opts = idk.opts_get().override(options)
     sizes = []
     simprints = []
     offsets = []
     current_offset = 0
-    for chunk in text_chunks(text, avg_size=idk.sdk_opts.text_avg_chunk_size):
+    for chunk in text_chunks(text, avg_size=opts.text_avg_chunk_size):
         offsets.append(current_offset)
         ngrams = (
             "".join(chars)
@@ -173,15 +196,16 @@ def text_features(text, **options):
     )
 
 
-def text_chunks(text, avg_size=idk.sdk_opts.text_avg_chunk_size):
-    # type: (str, int) -> Generator[str, None, None]
+def text_chunks(text, avg_size=None):
+    # type: (str, int|None) -> Generator[str, None, None]
     """
     Generates variable-sized text chunks (without leading BOM).
 
     :param text: Normalized plaintext
-    :param avg_size: Targeted average size of text chunks in characters.
+    :param avg_size: Targeted average size of text chunks in characters (default: `text_avg_chunk_size`).
     :yields: Text chunks.
     """
+    avg_size = avg_size or idk.opts_get().text_avg_chunk_size
     data = text.encode("utf-32-be")
     avg_size_bytes = avg_size * 4  # 4 bytes per character in utf-32-be
     for chunk_bytes in il.alg_cdc_chunks(data, utf32=True, avg_chunk_size=avg_size_bytes):
@@ -210,14 +234,16 @@ def text_name_from_uri(uri):
 
 
 def text_thumbnail(fp):
-    # type: (str|Path) -> Image.Image|None
+    # type: (str|Path|idk.Asset) -> Image.Image|None
     """
     Create a thumbnail for a text document.
 
-    :param fp: Filepath to a text document.
+    :param fp: Filepath to a text document or `Asset` processing context.
     :return: Thumbnail image as a PIL Image object
     """
-    mt, _ = idk.mediatype_and_mode(fp)
+    asset = idk.asset_open(fp)
+    fp = asset.path
+    mt = asset.mediatype
     if mt == "application/pdf":
         return idk.pdf_thumbnail(fp)
     if mt == "application/epub+zip":
@@ -5,8 +5,12 @@ import shutil
 import stat
 import subprocess  # nosec B404 - running external tools (ffmpeg, fpcalc, ipfs) is core SDK scope
 import tarfile
+import tempfile
+import threading
 import zipfile
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
 from platform import architecture, system
 from urllib.parse import urlparse
@@ -18,8 +22,10 @@ from loguru import logger as log
 import iscc_sdk as idk
 
 __all__ = [
+    "ProcessGroup",
     "install",
     "run_ffmpeg",
+    "run_ffmpeg_pipes",
     "run_ffprobe",
     "run_fpcalc",
 ]
@@ -51,6 +57,12 @@ FFMPEG_CHECKSUMS = {
     "windows-64": "d84c72395b9f52cf34c516fdfab83edfa631165b32ab1674ed0f4686989e1126",
 }
 
+#: Deliver extra ffmpeg outputs over anonymous pipes (not supported on Windows)
+FFMPEG_PIPES = os.name != "nt"
+
+#: Process group that tracks the tool processes started in the current context
+_process_group = ContextVar("process_group", default=None)  # type: ContextVar[ProcessGroup|None]
+
 FPCALC_VERSION = "1.6.0"
 FPCALC_URLS = {
     "windows-64": f"{BASE_URL}/chromaprint-fpcalc-{FPCALC_VERSION}-windows-x86_64.zip",
@@ -64,6 +76,85 @@ FPCALC_CHECKSUMS = {
 }
 
 
+class ProcessGroup:
+    """
+    Track external tool processes started by a (threaded) call so they can be killed together.
+
+    Used by the asyncio API to kill the child processes of cancelled calls.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self.processes = set()  # type: set[subprocess.Popen]
+        self.killed = False
+        self._lock = threading.Lock()
+
+    def run(self, func, *args, **kwargs):
+        # type: (Callable, Any, Any) -> Any
+        """Call function with all tool processes it starts tracked by this group."""
+        token = _process_group.set(self)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _process_group.reset(token)
+
+    def kill(self):
+        # type: () -> None
+        """Kill running processes of the group and any processes started after this call."""
+        with self._lock:
+            self.killed = True
+            processes = list(self.processes)
+        for proc in processes:
+            proc.kill()
+
+    @contextmanager
+    def track(self, proc):
+        # type: (subprocess.Popen) -> Iterator[subprocess.Popen]
+        """Track process while in context."""
+        with self._lock:
+            self.processes.add(proc)
+            killed = self.killed
+        if killed:
+            proc.kill()
+        try:
+            yield proc
+        finally:
+            with self._lock:
+                self.processes.discard(proc)
+
+
+@contextmanager
+def _tracked(proc):
+    # type: (subprocess.Popen) -> Iterator[subprocess.Popen]
+    """Track process in the current process group (if any) and kill it on errors."""
+    group = _process_group.get()
+    try:
+        if group is None:
+            yield proc
+        else:
+            with group.track(proc):
+                yield proc
+    except BaseException:
+        proc.kill()
+        raise
+
+
+def _run(cmd, name):
+    # type: (list[str], str) -> subprocess.CompletedProcess
+    """
+    Run command like `subprocess.run(cmd, capture_output=True, check=True)`.
+
+    The process is killable (see `ProcessGroup`) and its run time is reported as stage `name`.
+    """
+    with idk.stage(name):
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as proc:
+            with _tracked(proc):
+                stdout, stderr = proc.communicate()
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stdout, stderr)
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+
 def install():
     """Install binary tools for content extraction and metadata handling."""
     with ThreadPoolExecutor(max_workers=6) as p:
@@ -191,11 +282,11 @@ def run_fpcalc(args: list[str | Path]):
     """Run fpcalc command with `args`. Installs fpcalc if not found."""
     cmd = [fpcalc_bin()] + [str(a) for a in args]
     try:
-        result = subprocess.run(cmd, capture_output=True, check=True)
+        result = _run(cmd, "fpcalc")
     except FileNotFoundError:  # pragma: no cover
         print("FPCALC not found - installing ...")
         fpcalc_install()
-        result = subprocess.run(cmd, capture_output=True, check=True)
+        result = _run(cmd, "fpcalc")
     return result
 
 
@@ -266,11 +357,11 @@ def run_ffprobe(args: list[str | Path]):  # pragma: no cover
     """Run ffprobe command with `args`. Install ffprobe if not found."""
     cmd = [ffprobe_bin()] + [str(a) for a in args]
     try:
-        result = subprocess.run(cmd, capture_output=True, check=True)
+        result = _run(cmd, "ffprobe")
     except FileNotFoundError:  # pragma: no cover
         print("FFPROBE not found - installing ...")
         ffprobe_install()
-        result = subprocess.run(cmd, capture_output=True, check=True)
+        result = _run(cmd, "ffprobe")
     return result
 
 
@@ -340,14 +431,112 @@ def run_ffmpeg(args: list[str | Path]):
     """Run ffmpeg command with `args`. Install ffmpeg if not found."""
     cmd = [ffmpeg_bin()] + [str(a) for a in args]
     try:
-        result = subprocess.run(cmd, capture_output=True, check=True)
+        result = _run(cmd, "ffmpeg")
     except FileNotFoundError:  # pragma: no cover
         print("FFMPEG not found - installing ...")
         ffmpeg_install()
-        result = subprocess.run(cmd, capture_output=True, check=True)
+        result = _run(cmd, "ffmpeg")
     return result
 
 
+def run_ffmpeg_pipes(args, readers):
+    # type: (list[str|Path], dict[str, Callable[[BinaryIO], Any]]) -> tuple[subprocess.CompletedProcess, dict[str, Any]]
+    """
+    Run ffmpeg command with `args` and extra named outputs delivered over pipes.
+
+    Each `{name}` placeholder in a string argument is replaced with the path of the write end
+    of a pipe (`/dev/fd/N`) and `readers[name]` is called with the binary read end in a
+    background thread while ffmpeg is running, so outputs are consumed as they are written.
+    Where pipes cannot be passed to ffmpeg (see `FFMPEG_PIPES`) the outputs are written to a
+    temporary directory and the readers are called after ffmpeg has finished.
+
+    Placeholders that are a complete argument are replaced with a plain output path, placeholders
+    embedded in a filter graph are escaped for use as filter option value.
+
+    :param args: ffmpeg arguments with `{name}` placeholders for the extra outputs
+    :param readers: Functions that consume the extra outputs, by placeholder name
+    :return: Completed ffmpeg process and the results of the readers by name
+    """
+    if not FFMPEG_PIPES:
+        return _run_ffmpeg_tempfiles(args, readers)
+
+    if not is_installed(ffmpeg_bin()):  # pragma: no cover
+        print("FFMPEG not found - installing ...")
+        ffmpeg_install()
+
+    pipes = {name: os.pipe() for name in readers}
+    paths = {name: f"/dev/fd/{w}" for name, (r, w) in pipes.items()}
+    cmd = [ffmpeg_bin(), "-y"] + [_ffmpeg_arg(arg, paths) for arg in args]
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            pass_fds=[w for r, w in pipes.values()],
+        )
+    except BaseException:  # pragma: no cover
+        for r, w in pipes.values():
+            os.close(r)
+        raise
+    finally:
+        for r, w in pipes.values():
+            os.close(w)
+
+    results, errors = {}, []  # type: dict[str, Any], list[Exception]
+
+    def consume(name, fd):
+        # type: (str, int) -> None
+        with os.fdopen(fd, "rb") as stream:
+            try:
+                results[name] = readers[name](stream)
+            except Exception as e:
+                errors.append(e)
+            # Drain unread output so that ffmpeg never blocks on a full pipe
+            while stream.read(65536):
+                pass
+
+    threads = [threading.Thread(target=consume, args=(n, r)) for n, (r, w) in pipes.items()]
+    for thread in threads:
+        thread.start()
+    with idk.stage("ffmpeg"), proc, _tracked(proc):
+        stdout, stderr = proc.communicate()
+    for thread in threads:
+        thread.join()
+
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stdout, stderr)
+    if errors:
+        raise errors[0]
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr), results
+
+
+def _run_ffmpeg_tempfiles(args, readers):
+    # type: (list[str|Path], dict[str, Callable[[BinaryIO], Any]]) -> tuple[subprocess.CompletedProcess, dict[str, Any]]
+    """Run ffmpeg with extra named outputs written to a temporary directory."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        paths = {name: Path(tempdir, name).as_posix() for name in readers}
+        result = run_ffmpeg(["-y"] + [_ffmpeg_arg(arg, paths) for arg in args])
+        results = {}
+        for name, reader in readers.items():
+            with open(paths[name], "rb") as stream:
+                results[name] = reader(stream)
+    return result, results
+
+
+def _ffmpeg_arg(arg, paths):
+    # type: (str|Path, dict[str, str]) -> str
+    """Replace output placeholders in ffmpeg argument with (escaped) output paths."""
+    if not isinstance(arg, str):
+        return str(arg)
+    for name, path in paths.items():
+        placeholder = "{" + name + "}"
+        if arg == placeholder:
+            return path
+        arg = arg.replace(placeholder, path.replace(":", "\\\\:"))
+    return arg
+
+
 def download_file(url, checksum):  # pragma: no cover
     # type: (str, str) -> str
     """Download file to app directory and return path to downloaded file."""
@@ -2,16 +2,18 @@
 
 import io
 import json
-import os
+import math
 import sys
 import tempfile
+from concurrent.futures import wait
 from fractions import Fraction
+from functools import partial
 from pathlib import Path
-from secrets import token_hex
 from typing import Any
 
 import iscc_lib as il
 import jmespath
+import numpy as np
 from langcodes import standardize_tag
 from loguru import logger as log
 from PIL import Image, ImageEnhance
@@ -20,7 +22,9 @@ import iscc_sdk as idk
 
 __all__ = [
     "video_compute_granular",
+    "video_extract",
     "video_features_extract",
+    "video_frames_extract_parallel",
     "video_meta_embed",
     "video_meta_extract",
     "video_mp7sig_extract",
@@ -29,6 +33,9 @@ __all__ = [
     "video_thumbnail",
 ]
 
+#: Minimum duration in seconds of a time range for parallel MP7 signature extraction
+VIDEO_SEGMENT_MIN = 60
+
 VIDEO_META_MAP = {
     "iscc_name": "name",
     "iscc_description": "description",
@@ -51,14 +58,13 @@ VIDEO_META_MAP = {
 
 
 def video_meta_extract(fp):
-    # type: (str | Path) -> dict
+    # type: (str|Path|idk.Asset) -> dict
     """
     Extract video metadata using FFMPEG and FFPROBE
 
-    :param fp: Filepath to video file
+    :param fp: Filepath to video file or `Asset` processing context
     :return: Metdata mapped to IsccMeta schema
     """
-    fp = Path(fp)
     ffprobe = video_meta_extract_ffprobe(fp)
     ffmpeg = video_meta_extract_ffmpeg(fp)
     ffprobe.update(ffmpeg)
@@ -141,20 +147,19 @@ def video_meta_extract_ffprobe(fp):
 
 
 def video_meta_extract_ffmpeg(fp):
-    # type: (str|Path) -> dict
+    # type: (str|Path|idk.Asset) -> dict
     """
     Extract metadata from video using ffmpeg.
 
-    :param fp: Filepath to video file
+    :param fp: Filepath to video file or `Asset` processing context
     :return: Metdata mapped to IsccMeta schema
     """
-    fp = Path(fp)
-
-    args = ["-i", fp, "-movflags", "use_metadata_tags", "-f", "ffmetadata", "-"]
-
-    result = idk.run_ffmpeg(args)
-    encoding = sys.stdout.encoding or "utf-8"
-    text = result.stdout.decode(encoding, errors="ignore")
+    text = _video_extracted(fp, "ffmetadata")
+    if text is None:
+        args = ["-i", Path(fp), "-movflags", "use_metadata_tags", "-f", "ffmetadata", "-"]
+        result = idk.run_ffmpeg(args)
+        encoding = sys.stdout.encoding or "utf-8"
+        text = result.stdout.decode(encoding, errors="ignore")
 
     # parse metadata
     meta = dict()
@@ -256,18 +261,23 @@ def video_meta_embed(fp, meta):
 
 
 def video_thumbnail(fp):
-    # type: (str|Path) -> Image.Image|None
+    # type: (str|Path|idk.Asset) -> Image.Image|None
     """
     Create a thumbnail for a video.
 
-    :param fp: Filepath to video file.
-    :return: Raw PNG byte data
-    :rtype: bytes
+    :param fp: Filepath to video file or `Asset` processing context.
+    :return: Thumbnail image as PIL Image object
     """
+    png = _video_extracted(fp, "thumbnail")
+    if png is not None:
+        return _video_thumbnail_image(png)
     fp = Path(fp)
-    size = idk.sdk_opts.image_thumbnail_size
+    size = idk.opts_get().image_thumbnail_size
 
-    args = [
+    # Only decode keyframes (much faster, but less choice for representative frame)
+    keyframes = ["-skip_frame", "nokey"] if idk.opts_get().video_keyframe_thumbnail else []
+
+    args = keyframes + [
         "-i",
         fp,
         "-vf",
@@ -285,7 +295,13 @@ def video_thumbnail(fp):
     except Exception as e:
         log.error(f"Failed video thumbnail extraction: {e}")
         return None
-    img_obj = Image.open(io.BytesIO(result.stdout))
+    return _video_thumbnail_image(result.stdout)
+
+
+def _video_thumbnail_image(data):
+    # type: (bytes) -> Image.Image
+    """Convert raw PNG thumbnail frame to sharpened RGB thumbnail image."""
+    img_obj = Image.open(io.BytesIO(data))
     return ImageEnhance.Sharpness(img_obj.convert("RGB")).enhance(1.4)
 
 
@@ -301,62 +317,55 @@ def video_features_extract(fp):
     # TODO use confidence value to improve simililarity hash.
     sig = video_mp7sig_extract(fp)
 
-    if idk.sdk_opts.video_store_mp7sig:
+    if idk.opts_get().video_store_mp7sig:
         outp = fp.as_posix() + ".iscc.mp7sig"
         with open(outp, "wb") as outf:
             outf.write(sig)
 
-    frames = idk.read_mp7_signature(sig)
-    return [tuple(frame.vector.tolist()) for frame in frames]
+    signatures = idk.decode_mp7_signature(sig)
+    return [tuple(vector) for vector in signatures.vectors.tolist()]
 
 
 def video_mp7sig_extract(fp):
-    # type: (str|Path) -> bytes
+    # type: (str|Path|idk.Asset) -> bytes
     """Extract MPEG-7 Video Signature.
 
-    :param fp: Filepath to video file.
+    :param fp: Filepath to video file or `Asset` processing context.
     :return: raw signature data
     """
+    sigdata = _video_extracted(fp, "mp7sig")
+    if sigdata is not None:
+        return sigdata
     fp = Path(fp)
 
-    sigfile_path = Path(tempfile.mkdtemp(), token_hex(16) + ".bin")
-    sigfile_path_escaped = sigfile_path.as_posix().replace(":", "\\\\:")
-
     # Extract MP7 Signature
-    vf = f"signature=format=binary:filename={sigfile_path_escaped}"
-    vf = f"fps=fps={idk.sdk_opts.video_fps}," + vf
-    args = ["-i", fp, "-vf", vf, "-f", "null", "-"]
-    idk.run_ffmpeg(args)
-
-    with open(sigfile_path, "rb") as sig:
-        sigdata = sig.read()
-    os.remove(sigfile_path)
-    return sigdata
+    vf = _video_sig_filter()
+    args = _video_decode_args() + ["-i", fp, "-vf", vf, "-f", "null", "-"]
+    _, outputs = idk.run_ffmpeg_pipes(args, dict(sig=_read_bytes))
+    return outputs["sig"]
 
 
 def video_mp7sig_extract_scenes(fp, scene_limit=None):
-    # type: (str|Path, int|None) -> tuple[bytes, list[float]]
+    # type: (str|Path|idk.Asset, int|None) -> tuple[bytes, list[float]]
     """Extract MPEG-7 Video Signature and Scenes.
 
-    :param fp: Filepath to video file.
+    :param fp: Filepath to video file or `Asset` processing context.
     :param scene_limit: Threshold value above which a scene cut is created (0.4)
     :return: tuple of raw signature data and list of scene cutpoints
     """
-    fp = Path(fp)
-
-    scene_limit = scene_limit or idk.sdk_opts.video_scene_limit
+    scene_limit = scene_limit or idk.opts_get().video_scene_limit
 
-    sigfile_path = Path(tempfile.mkdtemp(), token_hex(16) + ".bin")
-    sigfile_path_escaped = sigfile_path.as_posix().replace(":", "\\\\:")
+    sigdata = _video_extracted(fp, "mp7sig")
+    scene_scores = _video_extracted(fp, "scenes")
+    if sigdata is not None and scene_scores is not None:
+        return sigdata, _video_cutpoints(*scene_scores, scene_limit)
 
-    scene_path = Path(tempfile.mkdtemp(), token_hex(16) + ".cut")
-    scene_path_escaped = scene_path.as_posix().replace(":", "\\\\:")
+    fp = Path(fp)
 
-    sig_cmd = f"signature=format=binary:filename={sigfile_path_escaped}"
-    sig_cmd = f"fps=fps={idk.sdk_opts.video_fps}," + sig_cmd
-    scene_cmd = f"select='gte(scene,0)',metadata=print:file={scene_path_escaped}"
+    sig_cmd = _video_sig_filter()
+    scene_cmd = "select='gte(scene,0)',metadata=print:file={scenes}"
 
-    args = [
+    args = _video_decode_args() + [
         "-i",
         fp,
         "-an",
@@ -375,44 +384,312 @@ def video_mp7sig_extract_scenes(fp, scene_limit=None):
         "-",
     ]
 
-    idk.run_ffmpeg(args)
+    _, outputs = idk.run_ffmpeg_pipes(args, dict(sig=_read_bytes, scenes=_read_scene_scores))
+    scenes = _video_cutpoints(*outputs["scenes"], scene_limit)
+
+    return outputs["sig"], scenes
+
+
+def video_frames_extract_parallel(fp, scenes=False, scene_limit=None, workers=None):
+    # type: (str|Path|idk.Asset, bool, float|None, int|None) -> tuple[idk.FrameSignatures, list[float]]
+    """
+    Extract MP7 frame signatures (and scene cutpoints) with parallel ffmpeg workers.
+
+    Splits the video into time ranges of at least `VIDEO_SEGMENT_MIN` seconds and extracts the
+    frame signatures of all ranges in ffmpeg processes (seeking with `-ss`/`-t`) run on the shared
+    worker pool (see `executor_get`, ranges run one after another if called from the pool). The
+    frames are stitched back together with their media times shifted by the start of their time
+    range. Videos too short for more than one range are processed sequentially.
+
+    The result matches sequential extraction except at range boundaries: the number of sampled
+    frames may differ by one frame per boundary and a scene cut located exactly at a boundary is
+    not detected (the first frame of a range has no predecessor to compare with).
+
+    :param fp: Filepath to video file or `Asset` processing context.
+    :param scenes: Also detect scene cutpoints.
+    :param scene_limit: Threshold value above which a scene cut is created (0.4)
+    :param workers: Number of parallel ffmpeg workers (default: `video_workers` option)
+    :return: Tuple of frame signatures and scene cutpoints
+    """
+    workers = workers or idk.opts_get().video_workers
+    ranges = _video_ranges(_video_duration(fp), workers)
+
+    if len(ranges) == 1:
+        if scenes:
+            sigdata, cutpoints = video_mp7sig_extract_scenes(fp, scene_limit)
+        else:
+            sigdata, cutpoints = video_mp7sig_extract(fp), []
+        return idk.decode_mp7_signature(sigdata), cutpoints
+
+    fp = Path(fp)
+    futures = [idk.executor_submit(_video_range_extract, fp, *r, scenes=scenes) for r in ranges]
+    parts, times, scores = [], [], []  # type: list[idk.FrameSignatures], list[float], list[float]
+    try:
+        for future in futures:
+            range_signatures, range_times, range_scores = future.result()
+            parts.append(range_signatures)
+            times.extend(range_times)
+            scores.extend(range_scores)
+    finally:
+        wait(futures)  # No ffmpeg workers keep running after a failed range
+
+    cutpoints = _video_cutpoints(times, scores, scene_limit) if scenes and times else []
+    return idk.FrameSignatures.concat(parts), cutpoints
+
+
+def _video_duration(fp):
+    # type: (str|Path) -> float
+    """
+    Get duration of video in seconds using FFPROBE.
+
+    :param fp: Filepath to video file
+    :return: Duration in seconds
+    """
+    args = ["-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", Path(fp)]
+    res = idk.run_ffprobe(args)
+    return float(res.stdout.strip())
 
-    with open(sigfile_path, "rb") as sig:
-        sigdata = sig.read()
-    os.remove(sigfile_path)
 
-    with open(scene_path, "rt", encoding="utf-8") as scenein:
-        scenetext = scenein.read()
-    os.remove(scene_path)
+def _video_ranges(duration, workers):
+    # type: (float, int) -> list[tuple[int, int|None]]
+    """
+    Split video duration into time ranges for parallel processing.
+
+    Ranges start at full seconds so that frames sampled at integer fps line up with the frames
+    of a sequential extraction. The last range extends to the end of the video.
+
+    :param duration: Duration of video in seconds
+    :param workers: Number of parallel workers
+    :return: List of (start, length) tuples in seconds (length None = until end)
+    """
+    n = min(workers, int(duration // VIDEO_SEGMENT_MIN))
+    if n < 2:
+        return [(0, None)]
+    length = math.ceil(duration / n)
+    return [(i * length, length) for i in range(n - 1)] + [((n - 1) * length, None)]
+
+
+def _video_range_extract(fp, start, length, scenes=False):
+    # type: (Path, int, int|None, bool) -> tuple[idk.FrameSignatures, list[float], list[float]]
+    """
+    Extract MP7 frame signatures and scene scores for a time range of a video.
 
-    scenes = video_parse_scenes(scenetext, scene_limit)
+    :param fp: Filepath to video file
+    :param start: Start of time range in seconds
+    :param length: Length of time range in seconds (None = until end)
+    :param scenes: Also extract scene scores.
+    :return: Frame signatures, frame timestamps and scene scores (relative to video start)
+    """
+    sig_cmd = _video_sig_filter()
+    readers = dict(sig=_read_bytes)
+
+    args = ["-ss", str(start)]
+    if length:
+        args += ["-t", str(length)]
+    args += _video_decode_args() + ["-i", fp, "-an", "-sn"]
+    if scenes:
+        scene_cmd = "select='gte(scene,0)',metadata=print:file={scenes}"
+        graph = f"[0:v:0]split[in1][in2];[in1]{scene_cmd}[out1];[in2]{sig_cmd}[out2]"
+        args += ["-filter_complex", graph]
+        args += ["-map", "[out1]", "-f", "null", "-", "-map", "[out2]", "-f", "null", "-"]
+        readers["scenes"] = partial(_read_scene_scores, offset=start)
+    else:
+        args += ["-vf", sig_cmd, "-f", "null", "-"]
+    _, outputs = idk.run_ffmpeg_pipes(args, readers)
+
+    signatures = idk.decode_mp7_signature(outputs["sig"])
+    signatures.media_time += start * signatures.media_time_unit
+    times, scores = outputs.get("scenes", ([], []))
+    return signatures, times, scores
+
+
+def video_extract(fp, scenes=False, thumbnail=True, metadata=True, signature=True):
+    # type: (str|Path|idk.Asset, bool, bool, bool, bool) -> dict
+    """
+    Extract MP7 signature, scene scores, thumbnail frame and metadata with a single ffmpeg run.
+
+    The video is decoded once and the frames are fed into one filter graph with separate
+    branches for the MP7 signature, scene detection and thumbnail selection. The results are
+    identical to those of the individual extraction functions. When called with an `Asset`
+    processing context the results are cached on the asset and reused by `video_mp7sig_extract`,
+    `video_mp7sig_extract_scenes`, `video_thumbnail` and `video_meta_extract`.
+
+    :param fp: Filepath to video file or `Asset` processing context.
+    :param scenes: Extract scene scores (for granular features).
+    :param thumbnail: Extract thumbnail frame.
+    :param metadata: Extract ffmetadata.
+    :param signature: Extract MP7 signature.
+    :return: Dict with `mp7sig` (raw signature data), `scenes` (frame timestamps and scene
+        scores), `thumbnail` (PNG data) and `ffmetadata` (metadata output) - None if not extracted.
+    """
+    asset = idk.asset_open(fp)
+    fp = asset.path
+    size = idk.opts_get().image_thumbnail_size
+
+    branches, readers = [], {}  # type: list[str], dict[str, Callable]
+    if signature:
+        branches.append(_video_sig_filter())
+        readers["sig"] = _read_bytes
+    if scenes:
+        branches.append("select='gte(scene,0)',metadata=print:file={scenes}")
+        readers["scenes"] = _read_scene_scores
+    if thumbnail:
+        branches.append(f"thumbnail,scale={size}:-1")
+
+    args = _video_decode_args() + ["-i", fp]
+    if branches:
+        labels = [f"[in{i}]" for i in range(len(branches))]
+        graph = f"[0:v:0]split={len(branches)}{''.join(labels)}"
+        for i, branch in enumerate(branches):
+            graph += f";[in{i}]{branch}[out{i}]"
+        args += ["-an", "-sn", "-filter_complex", graph]
+    for i in range(len(branches)):
+        args += ["-map", f"[out{i}]"]
+        if thumbnail and i == len(branches) - 1:
+            args += ["-frames:v", "1", "-c:v", "png", "-f", "image2pipe", "-"]
+        else:
+            args += ["-f", "null", "-"]
+    if metadata:
+        args += ["-movflags", "use_metadata_tags", "-f", "ffmetadata", "{meta}"]
+        readers["meta"] = _read_text
+
+    result, outputs = idk.run_ffmpeg_pipes(args, readers)
+
+    extracted = dict(
+        settings=_video_settings(),
+        mp7sig=outputs.get("sig"),
+        scenes=outputs.get("scenes"),
+        thumbnail=result.stdout if thumbnail else None,
+        ffmetadata=outputs.get("meta"),
+    )
 
-    return sigdata, scenes
+    asset.cache["video"] = extracted
+    return extracted
+
+
+def _video_extracted(fp, part):
+    # type: (str|Path|idk.Asset, str) -> Any
+    """
+    Get part of a previous single-pass extraction from an `Asset` processing context.
+
+    :param fp: Filepath to video file or `Asset` processing context.
+    :param part: Name of the extracted part (`mp7sig`, `scenes`, `thumbnail`, `ffmetadata`)
+    :return: Extracted data or None if not available
+    """
+    if isinstance(fp, idk.Asset):
+        extracted = fp.cache.get("video")
+        if extracted and extracted["settings"] == _video_settings():
+            return extracted[part]
+    return None
+
+
+def _video_settings():
+    # type: () -> tuple
+    """SDK options that affect the results of video feature extraction (incl. thumbnail)."""
+    opts = idk.opts_get()
+    return (
+        opts.video_fps,
+        opts.video_fast_decode,
+        opts.image_thumbnail_size,
+        opts.image_thumbnail_quality,
+        opts.image_thumbnail_format,
+    )
+
+
+def _video_decode_args():
+    # type: () -> list[str]
+    """
+    Get ffmpeg input options for decoding video for feature extraction.
+
+    In fast decode mode non-reference frames and the in-loop deblocking filter are skipped by
+    the decoder. This roughly halves decoding time for typical long-GOP content.
+    """
+    if idk.opts_get().video_fast_decode:
+        return ["-skip_frame", "noref", "-skip_loop_filter", "all"]
+    return []
+
+
+def _video_sig_filter():
+    # type: () -> str
+    """
+    Get filter chain for MP7 signature extraction (writing to the `{sig}` output).
+
+    In fast decode mode sampled frames are downscaled to at most 360 lines before the
+    signature filter.
+    """
+    opts = idk.opts_get()
+    chain = f"fps=fps={opts.video_fps},"
+    if opts.video_fast_decode:
+        chain += "scale=-2:'min(360,ih)',"
+    return chain + "signature=format=binary:filename={sig}"
+
+
+def _read_bytes(stream):
+    # type: (BinaryIO) -> bytes
+    """Read complete binary ffmpeg output."""
+    return stream.read()
+
+
+def _read_text(stream):
+    # type: (BinaryIO) -> str
+    """Read complete ffmpeg text output."""
+    return stream.read().decode(sys.stdout.encoding or "utf-8", errors="ignore")
+
+
+def _read_scene_scores(stream, offset=0):
+    # type: (BinaryIO, float) -> tuple[list[float], list[float]]
+    """Parse ffmpeg scene score output line by line as it arrives."""
+    lines = (line.decode("utf-8") for line in stream)
+    return _video_scene_scores(lines, offset=offset)
 
 
 def video_parse_scenes(scene_text, scene_limit=None):
-    # type: (str, int|None) -> List[float]
+    # type: (str|Iterable[str], int|None) -> List[float]
     """
     Parse scene score output from ffmpeg
 
-    :param scene_text: Scene score output from ffmpeg
+    :param scene_text: Scene score output from ffmpeg (text or iterable of lines)
     :param scene_limit: Threshold value above which a scene cut is created (0.4)
     :return: Scene cutpoints
     """
+    times, scores = _video_scene_scores(scene_text)
+    return _video_cutpoints(times, scores, scene_limit)
 
-    scene_limit = scene_limit or idk.sdk_opts.video_scene_limit
 
-    if not scene_text.strip():
-        return []
+def _video_scene_scores(scene_text, offset=0):
+    # type: (str|Iterable[str], float) -> tuple[list[float], list[float]]
+    """
+    Parse frame timestamps and scene scores from ffmpeg scene score output.
+
+    The output is parsed incrementally if passed as an iterable of lines.
 
+    :param scene_text: Scene score output from ffmpeg (text or iterable of lines)
+    :param offset: Seconds to add to the frame timestamps
+    :return: Tuple of frame timestamps and scene scores
+    """
+    lines = scene_text.splitlines() if isinstance(scene_text, str) else scene_text
     times = []
     scores = []
-    for line in scene_text.splitlines():
+    for line in lines:
         if line.startswith("frame:"):
-            ts = round(float(line.split()[-1].split(":")[-1]), 3)
+            ts = round(float(line.split()[-1].split(":")[-1]) + offset, 3)
             times.append(ts)
         if line.startswith("lavfi.scene_score"):
             scores.append(float(line.split("=")[-1]))
+    return times, scores
+
+
+def _video_cutpoints(times, scores, scene_limit=None):
+    # type: (list[float], list[float], float|None) -> list[float]
+    """
+    Select scene cutpoints from frame timestamps and scene scores.
+
+    :param times: Frame timestamps
+    :param scores: Scene scores
+    :param scene_limit: Threshold value above which a scene cut is created (0.4)
+    :return: Scene cutpoints
+    """
+    scene_limit = scene_limit or idk.opts_get().video_scene_limit
 
     cutpoints = []
     for ts, score in zip(times, scores):
@@ -427,36 +704,39 @@ def video_parse_scenes(scene_text, scene_limit=None):
 
 
 def video_compute_granular(frames, scenes):
-    # type: (List[idk.Frame], List[float]) -> dict
+    # type: (idk.FrameSignatures|List[idk.Frame], List[float]) -> dict
     """
     Compute video signatures for individual scenes in video.
 
-    :param frames: List of video frames.
-    :param scenes: List of video scene cutpints.
+    A scene ends with the first frame at or after its cutpoint. Scene boundaries are found by
+    binary search over the media times of the frames. Cutpoints after the last frame are ignored.
+
+    :param frames: Frame signatures (or list of video frames).
+    :param scenes: List of video scene cutpoints (ascending).
     :return: A dictionary conforming to `shema.Feature`- objects.
     """
-    features, sizes, segment = [], [], []
-    start_frame = 0
-    for cidx, cutpoint in enumerate(scenes):
-        try:
-            frames = frames[start_frame:]
-        except IndexError:  # pragma: no cover
+    if not isinstance(frames, idk.FrameSignatures):
+        frames = idk.FrameSignatures.from_frames(frames)
+    vectors, tu = frames.vectors, frames.media_time_unit
+
+    # Index of first frame at or after each cutpoint (exact comparison on integer media times)
+    thresholds = [math.ceil(Fraction(cutpoint) * tu) for cutpoint in scenes]
+    ends = np.searchsorted(frames.media_time, thresholds, side="left")
+
+    features, sizes = [], []
+    start = 0
+    for cidx, (cutpoint, end) in enumerate(zip(scenes, ends)):
+        end = max(int(end), start)
+        if end >= len(frames):
             break
-        for fidx, frame in enumerate(frames):
-            frame_t = tuple(frame.vector.tolist())
-            segment.append(frame_t)
-            if frame.elapsed >= cutpoint:
-                features.append(il.encode_base64(il.soft_hash_video_v0(segment, 256)))
-                segment = []
-                prev_cutpoint = 0 if cidx == 0 else scenes[cidx - 1]
-                duration = round(cutpoint - prev_cutpoint, 3)
-                sizes.append(duration)
-                start_frame = fidx + 1
-                break
+        segment = vectors[start : end + 1].tolist()
+        features.append(il.encode_base64(il.soft_hash_video_v0(segment, 256)))
+        prev_cutpoint = 0 if cidx == 0 else scenes[cidx - 1]
+        sizes.append(round(cutpoint - prev_cutpoint, 3))
+        start = end + 1
     if not features:
         log.info("No scenes detected. Use all frames")
-        segment = [tuple(frame.vector.tolist()) for frame in frames]
-        features = [il.encode_base64(il.soft_hash_video_v0(segment, bits=256))]
-        sizes = [round(float(frames[-1].elapsed), 3)]
+        features = [il.encode_base64(il.soft_hash_video_v0(vectors.tolist(), bits=256))]
+        sizes = [round(float(frames.elapsed[-1]), 3)]
 
     return dict(maintype="content", subtype="video", version=0, simprints=features, sizes=sizes)
@@ -1,3 +1,8 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+
 from iscc_sdk import tools
 
 
@@ -43,3 +48,49 @@ def test_ffmpeg_version_info():
 
 def test_fpcalc_version_info():
     assert tools.FPCALC_VERSION in tools.fpcalc_version_info()
+
+
+def test_run_ffmpeg_pipes():
+    args = [
+        "-f",
+        "lavfi",
+        "-i",
+        "testsrc=duration=1:rate=5",
+        "-vf",
+        "select='gte(scene,0)',metadata=print:file={m}",
+    ]
+    args += ["-f", "null", "-"]
+    result, outputs = tools.run_ffmpeg_pipes(args, dict(m=lambda stream: stream.readlines()))
+    assert result.returncode == 0
+    assert len([line for line in outputs["m"] if line.startswith(b"frame:")]) == 5
+
+
+def test_run_ffmpeg_pipes_fails():
+    with pytest.raises(subprocess.CalledProcessError):
+        tools.run_ffmpeg_pipes(["-i", "does-not-exist.mp4", "{m}"], dict(m=lambda s: s.read()))
+
+
+def test_run_ffmpeg_pipes_reader_fails():
+    def reader(stream):
+        raise ValueError("reader failed")
+
+    args = [
+        "-f",
+        "lavfi",
+        "-i",
+        "testsrc=duration=1:rate=5",
+        "-vf",
+        "select='gte(scene,0)',metadata=print:file={m}",
+    ]
+    args += ["-f", "null", "-"]
+    with pytest.raises(ValueError, match="reader failed"):
+        tools.run_ffmpeg_pipes(args, dict(m=reader))
+
+
+def test_ffmpeg_arg():
+    paths = {"sig": "C:/tmp/sig"}
+    assert tools._ffmpeg_arg("{sig}", paths) == "C:/tmp/sig"
+    assert (
+        tools._ffmpeg_arg("signature=filename={sig}", paths) == "signature=filename=C\\\\:/tmp/sig"
+    )
+    assert tools._ffmpeg_arg(Path("{sig}"), paths) == "{sig}"
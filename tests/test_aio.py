@@ -0,0 +1,103 @@
+import asyncio
+import subprocess
+import threading
+import time
+
+import pytest
+
+import iscc_sdk as idk
+from iscc_sdk import aio
+
+LONG_RUN = ["-re", "-f", "lavfi", "-i", "testsrc=duration=60", "-f", "null", "-"]
+
+
+def test_acode_iscc(jpg_file):
+    result = asyncio.run(idk.acode_iscc(jpg_file))
+    assert result.iscc == idk.code_iscc(jpg_file).iscc
+
+
+def test_acode_functions(jpg_file):
+    async def main():
+        return await asyncio.gather(
+            idk.acode_meta(jpg_file),
+            idk.acode_content(jpg_file),
+            idk.acode_image(jpg_file),
+            idk.acode_data(jpg_file),
+            idk.acode_instance(jpg_file),
+            idk.acode_sum(jpg_file),
+        )
+
+    results = asyncio.run(main())
+    expected = [
+        idk.code_meta(jpg_file),
+        idk.code_content(jpg_file),
+        idk.code_image(jpg_file),
+        idk.code_data(jpg_file),
+        idk.code_instance(jpg_file),
+        idk.code_sum(jpg_file),
+    ]
+    assert [r.iscc for r in results] == [e.iscc for e in expected]
+
+
+def test_acode_text(doc_file):
+    assert asyncio.run(idk.acode_text(doc_file)).iscc == idk.code_text(doc_file).iscc
+
+
+def test_acode_audio_video(monkeypatch):
+    monkeypatch.setattr(idk, "code_audio", lambda fp, **options: ("audio", fp, options))
+    monkeypatch.setattr(idk, "code_video", lambda fp, **options: ("video", fp, options))
+    assert asyncio.run(idk.acode_audio("a.mp3", bits=128)) == ("audio", "a.mp3", dict(bits=128))
+    assert asyncio.run(idk.acode_video("v.mp4", bits=128)) == ("video", "v.mp4", dict(bits=128))
+
+
+def test_arun_ffmpeg():
+    result = asyncio.run(idk.arun_ffmpeg(["-version"]))
+    assert result.returncode == 0
+    assert b"ffmpeg version" in result.stdout
+
+
+def test_arun_ffmpeg_error():
+    with pytest.raises(subprocess.CalledProcessError):
+        asyncio.run(idk.arun_ffmpeg(["-i", "does-not-exist.mp4"]))
+
+
+def test_arun_ffmpeg_cancel_kills_process(monkeypatch):
+    procs = []
+    create = asyncio.create_subprocess_exec
+
+    async def spy(*args, **kwargs):
+        proc = await create(*args, **kwargs)
+        procs.append(proc)
+        return proc
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", spy)
+    start = time.perf_counter()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(asyncio.wait_for(idk.arun_ffmpeg(LONG_RUN), 0.5))
+    assert time.perf_counter() - start < 10
+    assert procs[0].returncode is not None
+
+
+def test_acode_cancel_kills_tool_processes():
+    done = threading.Event()
+    errors = []
+
+    def blocking():
+        try:
+            idk.run_ffmpeg(LONG_RUN)
+        except Exception as e:
+            errors.append(e)
+        done.set()
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(asyncio.wait_for(aio._run_sync(blocking), 0.5))
+    assert done.wait(10)
+    assert isinstance(errors[0], subprocess.CalledProcessError)
+
+
+def test_process_group_kill_before_start():
+    group = idk.ProcessGroup()
+    group.kill()
+    with pytest.raises(subprocess.CalledProcessError):
+        group.run(idk.run_ffmpeg, LONG_RUN)
+    assert not group.processes
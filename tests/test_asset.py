@@ -0,0 +1,109 @@
+import os
+from pathlib import Path
+
+import pytest
+from iscc_samples import texts
+
+import iscc_sdk as idk
+
+
+def test_asset_open(jpg_file):
+    asset = idk.asset_open(jpg_file)
+    assert isinstance(asset, idk.Asset)
+    assert asset.path == Path(jpg_file)
+    assert asset.file_name == "img.jpg"
+    assert repr(asset) == f"Asset({Path(jpg_file).as_posix()!r})"
+
+
+def test_asset_open_passthrough(jpg_file):
+    asset = idk.asset_open(jpg_file)
+    assert idk.asset_open(asset) is asset
+    assert idk.asset_open(asset, file_name="img.jpg") is asset
+
+
+def test_asset_open_file_name_override(jpg_file):
+    asset = idk.asset_open(jpg_file)
+    other = idk.asset_open(asset, file_name="other.png")
+    assert other is not asset
+    assert other.path == asset.path
+    assert other.file_name == "other.png"
+
+
+def test_asset_pathlike(jpg_file):
+    asset = idk.asset_open(jpg_file)
+    assert os.fspath(asset) == os.fspath(jpg_file)
+    assert Path(asset) == Path(jpg_file)
+
+
+def test_asset_probe(jpg_file):
+    asset = idk.asset_open(jpg_file)
+    assert len(asset.head) == 4096
+    assert asset.stat.st_size == os.path.getsize(jpg_file)
+    assert asset.mediatype == "image/jpeg"
+    assert asset.mode == "image"
+
+
+def test_asset_probe_once(jpg_file, monkeypatch):
+    calls = []
+    orig = idk.mediatype_guess
+
+    def counting_guess(data, file_name=None):
+        calls.append(file_name)
+        return orig(data, file_name=file_name)
+
+    monkeypatch.setattr(idk, "mediatype_guess", counting_guess)
+    asset = idk.asset_open(jpg_file)
+    assert idk.mediatype_and_mode(asset) == ("image/jpeg", "image")
+    assert idk.mediatype_and_mode(asset) == ("image/jpeg", "image")
+    assert len(calls) == 1
+
+
+def test_asset_unsupported_raises():
+    asset = idk.asset_open(texts("mobi")[0])
+    with pytest.raises(idk.IsccUnsupportedMediatype, match="Unsupported mediatype"):
+        asset.mode
+
+
+def test_code_iscc_probes_once(jpg_file, monkeypatch):
+    calls = []
+    orig = idk.mediatype_guess
+
+    def counting_guess(data, file_name=None):
+        calls.append(file_name)
+        return orig(data, file_name=file_name)
+
+    monkeypatch.setattr(idk, "mediatype_guess", counting_guess)
+    result = idk.code_iscc(jpg_file)
+    assert result.mode == "image"
+    assert len(calls) == 1
+
+
+def test_asset_memo(jpg_file):
+    asset = idk.asset_open(jpg_file)
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        return value * 2
+
+    assert asset.memo("key", compute, 21) == 42
+    assert asset.memo("key", compute, 21) == 42
+    assert calls == [21]
+    assert asset.cache["key"] == 42
+
+
+def test_asset_release(jpg_file):
+    class Resource:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    asset = idk.asset_open(jpg_file)
+    resource = asset.memo("resource", Resource)
+    asset.memo("value", int)
+    asset.release("resource")
+    asset.release("value")
+    asset.release("missing")
+    assert resource.closed
+    assert asset.cache == {}
@@ -0,0 +1,269 @@
+import os
+import shutil
+
+import iscc_lib as il
+import pytest
+
+import iscc_sdk as idk
+from iscc_sdk import cache as cache_module
+from iscc_sdk import video
+from iscc_sdk.cache import _transaction
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(idk.sdk_opts, "cache", True)
+    monkeypatch.setattr(idk.sdk_opts, "cache_path", (tmp_path / "cache.sqlite").as_posix())
+    yield idk.sdk_opts
+
+
+def key(fp, opts=None):
+    # Same key as used by code_iscc without name, description and meta arguments
+    return idk.cache_key(fp, opts, None, None, None)
+
+
+def test_code_iscc_cache_hit(cache, jpg_file, monkeypatch):
+    first = idk.code_iscc(jpg_file)
+    monkeypatch.setattr(idk, "code_sum", None)
+    second = idk.code_iscc(jpg_file)
+    assert second.dict() == first.dict()
+    assert idk.cache_stats() == dict(entries=1, size=idk.cache_stats()["size"], hits=1, misses=1)
+
+
+def test_code_iscc_cache_miss_on_change(cache, jpg_file):
+    first = idk.code_iscc(jpg_file)
+    idk.code_iscc(jpg_file, bits=128)
+    idk.code_iscc(jpg_file, name="Other")
+    stat = os.stat(jpg_file)
+    os.utime(jpg_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert idk.code_iscc(jpg_file).dict() == first.dict()
+    assert idk.cache_stats()["misses"] == 4
+    assert idk.cache_stats()["entries"] == 4
+
+
+def test_code_iscc_cache_renamed(cache, jpg_file, tmp_path):
+    idk.code_iscc(jpg_file)
+    renamed = tmp_path / "renamed.jpg"
+    shutil.move(jpg_file, renamed)
+    second = idk.code_iscc(renamed)
+    assert idk.cache_stats()["hits"] == 0
+    assert second.filename == "renamed.jpg"
+
+
+def test_code_iscc_cache_renamed_name_from_filename(cache, tmp_path):
+    # Without embedded metadata the Meta-Code name is derived from the filename
+    fp = tmp_path / "sunset-beach.txt"
+    fp.write_text("Hello World! " * 20, encoding="utf-8")
+    first = idk.code_iscc(fp)
+    renamed = tmp_path / "invoice-2024.txt"
+    shutil.move(fp, renamed)
+    second = idk.code_iscc(renamed)
+    assert first.name == "sunset beach"
+    assert second.name == "invoice 2024"
+    assert second.iscc != first.iscc
+    assert second.dict() == idk.code_iscc(renamed, cache=False).dict()
+
+
+def test_cache_get_batched_stats(cache, jpg_file, monkeypatch):
+    monkeypatch.setattr(cache_module, "STATS_BATCH_SIZE", 2)
+    idk.code_iscc(jpg_file)
+    idk.cache_get(key(jpg_file))
+    with _transaction(cache.cache_path) as conn:
+        stats = dict(conn.execute("SELECT name, value FROM stats").fetchall())
+    assert stats["hits"] == 0  # Recorded with next batch
+    idk.cache_get(key(jpg_file))
+    with _transaction(cache.cache_path) as conn:
+        stats = dict(conn.execute("SELECT name, value FROM stats").fetchall())
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+
+
+def test_code_iscc_cache_disabled(cache, jpg_file, monkeypatch):
+    monkeypatch.setattr(idk.sdk_opts, "cache", False)
+    idk.code_iscc(jpg_file)
+    assert idk.cache_stats()["entries"] == 0
+
+
+def test_cache_key_datahash(cache, jpg_file):
+    assert key(jpg_file) != key(jpg_file, cache.override(dict(cache_datahash=True)))
+    assert key(jpg_file) == key(jpg_file, cache.override(dict(pool_workers=2)))
+
+
+def test_cache_eviction(cache, jpg_file, png_file, bmp_file, monkeypatch):
+    results = {fp: idk.code_iscc(fp) for fp in (jpg_file, png_file)}
+    size = idk.cache_stats()["size"]
+    idk.cache_get(key(jpg_file))
+    monkeypatch.setattr(idk.sdk_opts, "cache_max_size", size)
+    idk.code_iscc(bmp_file)
+    stats = idk.cache_stats()
+    assert stats["entries"] == 2
+    assert stats["size"] <= size
+    assert idk.cache_get(key(png_file)) is None
+    assert idk.cache_get(key(jpg_file)).dict() == results[jpg_file].dict()
+
+
+def test_cache_eviction_counter_drift(cache, jpg_file, png_file, monkeypatch):
+    idk.code_iscc(jpg_file)
+    with _transaction(idk.sdk_opts.cache_path) as conn:
+        conn.execute("UPDATE stats SET value = value + 1000000000 WHERE name = 'size'")
+    monkeypatch.setattr(idk.sdk_opts, "cache_max_size", 10**6)
+    idk.code_iscc(png_file)
+    stats = idk.cache_stats()
+    assert stats["entries"] == 2
+    assert stats["size"] < 10**6
+
+
+def test_cache_put_replace(cache, jpg_file):
+    result = idk.code_iscc(jpg_file)
+    size = idk.cache_stats()["size"]
+    idk.cache_put(key(jpg_file), result)
+    assert idk.cache_stats()["size"] == size
+
+
+def test_cache_clear(cache, jpg_file):
+    idk.code_iscc(jpg_file)
+    idk.cache_clear()
+    assert idk.cache_stats() == dict(entries=0, size=0, hits=0, misses=0)
+
+
+def test_cache_transaction_rollback(cache):
+    with pytest.raises(ZeroDivisionError):
+        with _transaction(cache.cache_path) as conn:
+            conn.execute("UPDATE stats SET value = 5")
+            1 / 0
+    assert idk.cache_stats()["hits"] == 0
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(idk.sdk_opts, "feature_store", True)
+    monkeypatch.setattr(idk.sdk_opts, "feature_store_path", (tmp_path / "f.sqlite").as_posix())
+    yield idk.sdk_opts
+
+
+def test_feature_memo_disabled(jpg_file):
+    calls = []
+    assert idk.feature_memo(jpg_file, "test", lambda: calls.append(1) or 42) == 42
+    assert idk.feature_memo(jpg_file, "test", lambda: calls.append(1) or 42) == 42
+    assert len(calls) == 2
+
+
+def test_feature_memo_values(store, jpg_file):
+    assert idk.feature_memo(jpg_file, "bytes", lambda: b"\x00data") == b"\x00data"
+    assert idk.feature_memo(jpg_file, "bytes", lambda: None) == b"\x00data"
+    assert idk.feature_memo(jpg_file, "json", lambda: dict(a=[1, 2])) == dict(a=[1, 2])
+    assert idk.feature_memo(jpg_file, "json", lambda: None) == dict(a=[1, 2])
+    assert idk.feature_memo(jpg_file, "json", lambda: 3, settings=[1]) == 3
+    assert idk.feature_stats() == dict(
+        entries=3, size=idk.feature_stats()["size"], hits=2, misses=3
+    )
+    idk.feature_clear()
+    assert idk.feature_stats()["entries"] == 0
+
+
+def test_asset_datahash(jpg_file):
+    asset = idk.asset_open(jpg_file)
+    assert idk.asset_datahash(asset) == idk.code_instance(jpg_file).datahash
+    asset = idk.asset_open(jpg_file)
+    datahash = idk.code_sum(asset).datahash
+    assert asset.cache["datahash"] == datahash
+
+
+def test_asset_datahash_single_read(jpg_file, monkeypatch):
+    reads = []
+    gen_sum_code_v0 = il.gen_sum_code_v0
+    monkeypatch.setattr(
+        il, "gen_sum_code_v0", lambda *a, **kw: reads.append(1) or gen_sum_code_v0(*a, **kw)
+    )
+    asset = idk.asset_open(jpg_file)
+    datahash = idk.asset_datahash(asset)
+    assert idk.code_sum(asset).datahash == datahash
+    assert len(reads) == 1
+
+
+def test_code_image_feature_store(store, jpg_file, monkeypatch):
+    first = idk.code_image(jpg_file)
+    with monkeypatch.context() as m:
+        m.setattr(idk, "image_normalize", None)
+        assert idk.code_image(jpg_file).iscc == first.iscc
+        wide = idk.code_image(jpg_file, bits=256)
+    assert wide.iscc == idk.code_image(jpg_file, bits=256, feature_store=False).iscc
+    assert idk.feature_stats()["hits"] == 2
+
+
+def test_code_image_feature_store_options(store, png_file):
+    idk.code_image(png_file)
+    idk.code_image(png_file, image_fill_transparency=False, create_thumb=False)
+    assert idk.feature_stats()["misses"] == 2
+
+
+def test_code_text_feature_store(store, doc_file, monkeypatch):
+    first = idk.code_text(doc_file, extract_meta=False, create_thumb=False)
+    with monkeypatch.context() as m:
+        m.setattr(idk, "text_extract", None)
+        second = idk.code_text(doc_file, extract_meta=False, create_thumb=False, bits=128)
+    assert (
+        second.iscc
+        == idk.code_text(
+            doc_file, extract_meta=False, create_thumb=False, bits=128, feature_store=False
+        ).iscc
+    )
+    assert second.iscc != first.iscc
+
+
+def test_code_audio_feature_store(store, mp3_file, monkeypatch):
+    calls = []
+
+    def features(fp):
+        calls.append(fp)
+        return dict(duration=1.0, fingerprint=list(range(-100, 100)))
+
+    monkeypatch.setattr(idk, "audio_features_extract", features)
+    first = idk.code_audio(mp3_file, extract_meta=False, create_thumb=False)
+    second = idk.code_audio(mp3_file, extract_meta=False, create_thumb=False, bits=128)
+    assert len(calls) == 1
+    assert first.iscc != second.iscc
+
+
+def test_code_video_feature_store_parallel(store, mp4_file, monkeypatch):
+    monkeypatch.setattr(video, "VIDEO_SEGMENT_MIN", 10)
+    monkeypatch.setattr(video, "_video_duration", lambda fp: 60.04)
+    options = dict(extract_meta=False, create_thumb=False)
+    idk.code_video(mp4_file, video_workers=4, **options)
+    idk.code_video(mp4_file, **options)
+    assert idk.feature_stats()["entries"] == 2
+
+
+def test_code_video_feature_store(store, mp4_file, monkeypatch):
+    options = dict(extract_meta=False, create_thumb=False, granular=True)
+    first = idk.code_video(mp4_file, **options)
+    calls = []
+    run_ffmpeg_pipes = idk.run_ffmpeg_pipes
+
+    def count(*args, **kwargs):
+        calls.append(args)
+        return run_ffmpeg_pipes(*args, **kwargs)
+
+    monkeypatch.setattr(idk, "run_ffmpeg_pipes", count)
+    second = idk.code_video(mp4_file, **options)
+    wide = idk.code_video(mp4_file, bits=256, **options)
+    assert calls == []  # No video decode on feature store hits
+    assert second.dict() == first.dict()
+    assert wide.dict() == idk.code_video(mp4_file, bits=256, feature_store=False, **options).dict()
+    assert len(calls) == 1
+
+
+def test_code_video_feature_store_thumbnail(store, mp4_file, monkeypatch):
+    first = idk.code_video(mp4_file, extract_meta=False)
+    calls = []
+    video_extract = idk.video_extract
+
+    def count(fp, **kwargs):
+        calls.append(kwargs)
+        return video_extract(fp, **kwargs)
+
+    monkeypatch.setattr(idk, "video_extract", count)
+    second = idk.code_video(mp4_file, extract_meta=False, bits=128)
+    # Thumbnail only pass without signature extraction on a feature store hit
+    assert calls == [dict(scenes=False, thumbnail=True, metadata=False, signature=False)]
+    assert second.thumbnail == first.thumbnail
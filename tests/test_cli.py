@@ -1,4 +1,5 @@
 import json
+import shutil
 import sys
 from contextlib import contextmanager
 from pathlib import Path
@@ -8,7 +9,8 @@ import iscc_schema
 import pytest
 from typer.testing import CliRunner
 
-from iscc_sdk.cli import app, iter_unprocessed, process_file
+import iscc_sdk as idk
+from iscc_sdk.cli import app, iter_unprocessed
 
 runner = CliRunner()
 
@@ -24,16 +26,14 @@ def test_iter_unprocessed():
     assert len(files) == 10
 
 
-def test_process_file(jpg_file):
-    fp, iscc_meta = process_file(Path(jpg_file))
-    assert fp == Path(jpg_file)
-    assert iscc_meta.iscc == "ISCC:KECWRY3VY6R5SNV4YNBTBHR4T2HGP3HKVFO7TYUP2BKVFG724W63HVI"
-
-
-def test_process_file_error():
-    fp, iscc_meta = process_file(Path("does-not-exist"))
-    assert fp == Path("does-not-exist")
-    assert isinstance(iscc_meta, Exception)
+def test_cli_batch_results(jpg_file, tmp_path):
+    shutil.copy(jpg_file, tmp_path / "img.jpg")
+    (tmp_path / "broken.jpg").write_bytes(b"no image")
+    result = runner.invoke(app, ["batch", tmp_path.as_posix(), "--workers", "1"])
+    assert result.exit_code == 0
+    data = json.loads((tmp_path / "img.jpg.iscc.json").read_text(encoding="utf-8"))
+    assert data["iscc"] == idk.code_iscc(jpg_file).iscc
+    assert not (tmp_path / "broken.jpg.iscc.json").exists()
 
 
 def test_cli_no_arg():
@@ -1,6 +1,11 @@
+import base64
 import os.path
+import random
+from concurrent.futures import ThreadPoolExecutor
 
 import exiv2
+import iscc_lib as il
+import pytest
 from iscc_samples import images
 from iscc_schema import IsccMeta
 from PIL import Image, ImageDraw
@@ -35,6 +40,12 @@ def test_image_normalize_jpg(jpg_obj):
     assert pixels[-14:] == [67, 65, 71, 59, 65, 65, 66, 65, 61, 66, 54, 62, 50, 52]
 
 
+def test_image_normalize_bytes(png_obj_alpha):
+    pixels = idk.image_normalize(png_obj_alpha)
+    assert not isinstance(pixels, bytes)
+    assert idk.image_normalize_bytes(png_obj_alpha) == bytes(pixels)
+
+
 def test_image_exif_transpose(png_obj):
     result = idk.image_exif_transpose(png_obj)
     assert isinstance(result, Image.Image)
@@ -252,6 +263,17 @@ def test_image_meta_embed_jpg(jpg_file):
     os.remove(new_file)
 
 
+def test_image_meta_concurrent(jpg_file, png_file):
+    # Metadata is read and written without a process-wide lock
+    files = [jpg_file, png_file] * 16
+    expected = [idk.image_meta_extract(idk.image_meta_embed(fp, meta)) for fp in files[:2]] * 16
+    with ThreadPoolExecutor(8) as executor:
+        embedded = list(executor.map(lambda fp: idk.image_meta_embed(fp, meta), files))
+        assert list(executor.map(idk.image_meta_extract, embedded)) == expected
+    for fp in embedded:
+        os.remove(fp)
+
+
 def test_image_meta_embed_png(png_file):
     new_file = idk.image_meta_embed(png_file, meta)
     assert os.path.exists(new_file)
@@ -445,3 +467,148 @@ def test_image_thumbnail_svg(svg_file):
     thumb = idk.image_thumbnail(svg_file)
     assert isinstance(thumb, Image.Image)
     assert thumb.mode == "RGB"
+
+
+def _shapes_image(size, seed):
+    # type: (tuple[int, int], int) -> Image.Image
+    """Deterministic RGB test image with random shapes."""
+    rnd = random.Random(seed)
+    img = Image.new("RGB", size, (rnd.randrange(256), rnd.randrange(256), rnd.randrange(256)))
+    draw = ImageDraw.Draw(img)
+    w, h = size
+    for _ in range(30):
+        x, y = rnd.randrange(w), rnd.randrange(h)
+        box = [x, y, x + rnd.randrange(10, w // 2), y + rnd.randrange(10, h // 2)]
+        fill = (rnd.randrange(256), rnd.randrange(256), rnd.randrange(256))
+        (draw.ellipse if rnd.random() < 0.5 else draw.rectangle)(box, fill=fill)
+    return img
+
+
+def _distance(a, b):
+    # type: (str, str) -> int
+    """Hamming distance of the bodies of two Image-Codes."""
+    body_a, body_b = il.iscc_decode(a)[-1], il.iscc_decode(b)[-1]
+    return (int.from_bytes(body_a, "big") ^ int.from_bytes(body_b, "big")).bit_count()
+
+
+def test_image_open_full_resolution(tmp_path):
+    fp = tmp_path / "large.jpg"
+    _shapes_image((2400, 1800), 0).save(fp)
+    assert idk.image_open(fp, 512).size == (2400, 1800)
+    with idk.opts_scope(image_fast_decode=True):
+        assert idk.image_open(fp).size == (2400, 1800)
+        assert idk.image_open(fp, 1000).size == (2400, 1800)
+
+
+def test_image_open_jpeg_draft(tmp_path):
+    fp = tmp_path / "large.jpg"
+    _shapes_image((2400, 1800), 0).save(fp)
+    with idk.opts_scope(image_fast_decode=True):
+        assert idk.image_open(fp, 512).size == (1200, 900)
+        assert idk.image_open(fp, 200).size == (300, 225)
+
+
+def test_image_open_reduce(tmp_path):
+    fp = tmp_path / "large.png"
+    _shapes_image((2000, 1500), 0).save(fp)
+    with idk.opts_scope(image_fast_decode=True):
+        assert idk.image_open(fp, 512).size == (1000, 750)
+
+
+def test_image_open_reduce_unsupported_mode(tmp_path):
+    fp = tmp_path / "large.png"
+    _shapes_image((1200, 1200), 0).convert("P").save(fp)
+    with idk.opts_scope(image_fast_decode=True):
+        img = idk.image_open(fp, 512)
+    assert img.size == (1200, 1200)
+    assert img.mode == "P"
+
+
+def test_image_open_pyramidal_tiff(tmp_path):
+    fp = tmp_path / "pyramid.tif"
+    img = _shapes_image((2048, 1536), 0)
+    levels = [img.reduce(2), Image.new("RGB", (800, 800)), img.reduce(4), img.reduce(8)]
+    img.save(fp, save_all=True, append_images=levels)
+    with idk.opts_scope(image_fast_decode=True):
+        level = idk.image_open(fp, 300)
+    assert level.size == (512, 384)
+    assert level.tobytes() == img.reduce(4).tobytes()
+
+
+@pytest.mark.parametrize(
+    "fmt,orientation", [("JPEG", 1), ("JPEG", 6), ("PNG", 8), ("TIFF", 3), ("WEBP", 1)]
+)
+def test_image_fast_decode_conformance(tmp_path, fmt, orientation):
+    """Image-Codes from fast decoding stay within 4 bits (64-bit code) of full resolution."""
+    fp = tmp_path / f"image.{fmt.lower()}"
+    exif = Image.Exif()
+    exif[0x0112] = orientation
+    _shapes_image((2600, 1900), orientation).save(fp, fmt, exif=exif.tobytes())
+    options = dict(extract_meta=False, create_thumb=False)
+    full = idk.code_image(fp, **options).iscc
+    fast = idk.code_image(fp, image_fast_decode=True, **options).iscc
+    assert _distance(full, fast) <= 4
+
+
+def test_image_thumbnail_fast_decode(tmp_path):
+    fp = tmp_path / "large.jpg"
+    _shapes_image((2400, 1800), 0).save(fp)
+    full = idk.image_thumbnail(fp)
+    with idk.opts_scope(image_fast_decode=True):
+        fast = idk.image_thumbnail(fp)
+    assert fast.size == full.size == (128, 96)
+
+
+def test_image_decode_shared(jpg_file, monkeypatch):
+    calls = []
+    image_open = idk.image._image_open
+    monkeypatch.setattr(
+        idk.image, "_image_open", lambda *args: calls.append(args) or image_open(*args)
+    )
+    asset = idk.asset_open(jpg_file)
+    result = idk.code_iscc(asset)
+    assert result.thumbnail.startswith("data:image/")
+    assert (result.width, result.height) == (200, 133)
+    assert len(calls) == 1
+    assert "image" not in asset.cache
+    assert asset.cache["image_decoded_size"] == (200, 133)
+
+
+def test_image_decode_fast_size(tmp_path):
+    fp = tmp_path / "large.jpg"
+    _shapes_image((2400, 1800), 0).save(fp)
+    with idk.opts_scope(image_fast_decode=True):
+        asset = idk.asset_open(fp)
+        assert idk.image_decode(asset).size == (1200, 900)
+        assert idk.image_decode(asset) is idk.image_decode(asset)
+        meta = idk.image_meta_extract(asset)
+        assert (meta["width"], meta["height"]) == (2400, 1800)
+        assert asset.cache["image_decoded_size"] == (1200, 900)
+
+
+@pytest.mark.parametrize("format_", ["JPEG", "WEBP", "AVIF"])
+def test_image_to_data_url_omits_metadata(format_):
+    img = _shapes_image((128, 96), 1)
+    exif = Image.Exif()
+    exif[0x010F] = "MAKERTAG"
+    img.info.update(
+        exif=exif.tobytes(), xmp=b"<x:xmpmeta>XMPTAG</x:xmpmeta>", comment=b"COMMENTTAG"
+    )
+    with idk.opts_scope(image_thumbnail_format=format_):
+        durl = idk.image_to_data_url(img)
+        assert durl == idk.image_to_data_url(idk.image_strip_metadata(img))
+    data = base64.b64decode(durl.split(",", 1)[1])
+    assert b"MAKERTAG" not in data
+    assert b"XMPTAG" not in data
+    assert b"COMMENTTAG" not in data
+
+
+def test_image_strip_metadata_modes():
+    img = _shapes_image((40, 30), 2)
+    for mode in ("RGB", "RGBA", "L", "P", "1", "I;16"):
+        converted = img.convert(mode)
+        converted.info["exif"] = b"Exif"
+        stripped = idk.image_strip_metadata(converted)
+        assert stripped.info == {}
+        assert (stripped.mode, stripped.size) == (converted.mode, converted.size)
+        assert stripped.tobytes() == converted.tobytes()
@@ -1,4 +1,6 @@
+import hashlib
 import os
+import random
 
 import pytest
 
@@ -90,3 +92,101 @@ def test_ipfs_cidv1_empty_file(write_test_file):
     fp = write_test_file(b"", "empty.bin")
     cid = idk.ipfs_cidv1(fp)
     assert cid.startswith("bafkrei")
+
+
+def test_ipfs_hasher_incremental(write_test_file):
+    """Uneven update sizes produce the same CID as hashing the file."""
+    data = bytes(range(256)) * 4096 + b"\x01" * 1000
+    fp = write_test_file(data, "iscc_test_incremental.bin")
+    hasher = idk.IpfsHasher()
+    for start, end in [(0, 1), (1, 100_000), (100_000, 800_000), (800_000, len(data))]:
+        hasher.update(data[start:end])
+    assert hasher.finalize() == idk.ipfs_cidv1(fp)
+
+
+def test_ipfs_hasher_empty_and_single_chunk():
+    assert idk.IpfsHasher().finalize().startswith("bafkrei")
+    hasher = idk.IpfsHasher()
+    hasher.update(b"hello")
+    hasher.update(b"")
+    assert hasher.finalize().startswith("bafkrei")
+
+
+def test_ipfs_cidv1_parallel(write_test_file, monkeypatch):
+    """Parallel leaf hashing over a memory map matches sequential hashing."""
+    monkeypatch.setattr(idk.ipfs, "SEGMENT_SIZE", idk.ipfs.CHUNK_SIZE)
+    fp = write_test_file(bytes(range(256)) * 4096, "iscc_test_1048576.bin")
+    assert (
+        idk.ipfs_cidv1(fp, workers=2)
+        == "bafybeiclphklsx6bfzfb5aezogjldbkeicyyvma6wrfnielfg7haplwahy"
+    )
+    assert idk.ipfs_cidv1_base16(fp, workers=3) == idk.ipfs_cidv1_base16(fp, workers=1)
+
+
+def test_ipfs_hasher_multi_level_dag(monkeypatch):
+    """Incremental DAG matches a level by level balanced DAG."""
+    monkeypatch.setattr(idk.ipfs, "MAX_LINKS", 2)
+    chunks = [bytes([i]) * idk.ipfs.CHUNK_SIZE for i in range(4)] + [b"tail"]
+    hasher = idk.IpfsHasher()
+    for chunk in chunks:
+        hasher.update(chunk)
+    level = [idk.ipfs._leaf_tuple(chunk) for chunk in chunks]
+    while len(level) > 1:
+        level = [idk.ipfs._dag_node(level[i : i + 2]) for i in range(0, len(level), 2)]
+    assert hasher._root() == level[0]
+
+
+def _ref_varint(n):
+    """Reference varint encoder (byte string concatenation)."""
+    buf = b""
+    while n > 0x7F:
+        buf += bytes([(n & 0x7F) | 0x80])
+        n >>= 7
+    return buf + bytes([n])
+
+
+def _ref_field(field_num, value):
+    """Reference protobuf field encoder (bytes fields for bytes values, else varint)."""
+    if isinstance(value, bytes):
+        return _ref_varint(field_num << 3 | 2) + _ref_varint(len(value)) + value
+    return _ref_varint(field_num << 3) + _ref_varint(value)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_ipfs_encoding_matches_reference(seed):
+    """Randomized comparison of the protobuf writers with a straightforward reference encoding."""
+    rng = random.Random(seed)
+    numbers = [rng.randrange(1 << rng.randrange(1, 64)) for _ in range(50)] + [0, 127, 128]
+    for n in numbers:
+        assert idk.ipfs._varint_encode(n) == _ref_varint(n)
+        assert idk.ipfs._varint_size(n) == len(_ref_varint(n))
+
+    blocksizes = [rng.choice([idk.ipfs.CHUNK_SIZE, rng.randrange(1 << 40)]) for _ in range(9)]
+    filesize = sum(blocksizes)
+    unixfs = idk.ipfs._encode_unixfs_data(2, filesize=filesize, blocksizes=blocksizes)
+    ref_unixfs = _ref_field(1, 2) + _ref_field(3, filesize)
+    ref_unixfs += b"".join(_ref_field(4, bs) for bs in blocksizes)
+    assert unixfs == ref_unixfs
+    assert idk.ipfs._encode_unixfs_data(1) == _ref_field(1, 1)
+
+    links = [
+        (rng.randbytes(36), rng.randrange(1 << 50), rng.randbytes(rng.randrange(200)))
+        for _ in range(rng.randrange(1, 180))
+    ]
+    ref_links = [
+        _ref_field(1, cid) + _ref_field(2, name) + _ref_field(3, ts) for cid, ts, name in links
+    ]
+    ref_node = b"".join(_ref_field(2, link) for link in ref_links) + _ref_field(1, ref_unixfs)
+    assert idk.ipfs._encode_pb_node(links, unixfs) == ref_node
+
+    batch = [(cid, tsize, rng.randrange(1 << 30)) for cid, tsize, _ in links]
+    ref_unixfs = _ref_field(1, 2) + _ref_field(3, sum(child[2] for child in batch))
+    ref_unixfs += b"".join(_ref_field(4, child[2]) for child in batch)
+    ref_node = b"".join(
+        _ref_field(2, _ref_field(1, cid) + _ref_field(2, b"") + _ref_field(3, ts))
+        for cid, ts, _ in batch
+    )
+    ref_node += _ref_field(1, ref_unixfs)
+    ref_cid = bytes([1, 0x70, 0x12, 0x20]) + hashlib.sha256(ref_node).digest()
+    ref_tsize = len(ref_node) + sum(child[1] for child in batch)
+    assert idk.ipfs._dag_node(batch) == (ref_cid, ref_tsize, sum(child[2] for child in batch))
@@ -1,5 +1,73 @@
+import importlib
+import subprocess  # nosec B404
+import sys
+
+import pytest
+
+import iscc_sdk as idk
 from iscc_sdk import __version__
 
+#: Heavy dependencies that must not be loaded by `import iscc_sdk`
+HEAVY_MODULES = [
+    "exiv2",
+    "pillow_heif",
+    "pillow_avif",
+    "pypdfium2",
+    "pypdf",
+    "lxml",
+    "taglib",
+    "iscc_tika",
+    "bleach",
+    "resvg_py",
+    "ebookmeta",
+    "docx",
+    "numpy",
+    "PIL",
+]
+
 
 def test_version():
     assert __version__ == "0.9.5"
+
+
+def test_lazy_exports_match_submodules():
+    for name, exported in idk._lazy.items():
+        module = importlib.import_module(f"iscc_sdk.{name}")
+        public = getattr(module, "__all__", None)
+        if public is None:
+            public = [k for k, v in vars(module).items() if not k.startswith("_")]
+        assert sorted(exported) == sorted(public), name
+
+
+def test_lazy_getattr():
+    assert idk.code_sum is importlib.import_module("iscc_sdk.main").code_sum
+    assert idk.tools is importlib.import_module("iscc_sdk.tools")
+    assert "code_iscc" in dir(idk)
+    with pytest.raises(AttributeError, match="no attribute 'missing'"):
+        idk.missing
+
+
+@pytest.mark.parametrize("name", sorted(idk._deprecated))
+def test_lazy_getattr_deprecated(name):
+    with pytest.warns(DeprecationWarning, match=name):
+        assert getattr(idk, name) is not None
+    assert name not in idk.__all__
+
+
+def test_import_time():
+    cmd = [sys.executable, "-X", "importtime", "-c", "import iscc_sdk"]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)  # nosec B603
+    imported = {}
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, name = line.split("|")
+        imported[name.strip()] = int(cumulative) / 1e6
+    assert not [m for m in HEAVY_MODULES if m in imported]
+    assert imported["iscc_sdk"] < 0.5
+
+
+def test_process_container_loads_processor(epub_file):
+    # Fresh interpreter: the EPUB processor registers itself when its module is first imported
+    code = "import sys, iscc_sdk as idk; print(len(idk.process_container(sys.argv[1])))"
+    cmd = [sys.executable, "-c", code, epub_file]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)  # nosec B603
+    assert int(result.stdout) > 0
@@ -1,4 +1,8 @@
+import random
+
+import iscc_lib as il
 import pytest
+from PIL import Image
 
 import iscc_sdk as idk
 
@@ -525,6 +529,21 @@ def test_code_sum_default(pdf_file):
     }
 
 
+def test_code_sum_add_cid(pdf_file):
+    result = idk.code_sum(pdf_file, add_cid=True)
+    assert result.iscc == "ISCC:KUAKBNHB6SKFNEVRPLK4PW7WUZJY6"
+    assert result.datahash == "1e207ad5c7dbf6a6538f15fd0439e0dc5ba03a043ea23f072aa4e2ba830811bdb5f0"
+    assert result.content == f"ipfs://{idk.ipfs_cidv1(pdf_file)}"
+
+
+def test_code_sum_add_cid_empty(tmp_path):
+    fp = tmp_path / "empty.bin"
+    fp.write_bytes(b"")
+    result = idk.code_sum(fp, add_cid=True)
+    assert result.iscc == idk.code_sum(fp).iscc
+    assert result.content == f"ipfs://{idk.ipfs_cidv1(fp)}"
+
+
 def test_code_sum_wide_units(pdf_file):
     result = idk.code_sum(pdf_file, wide=True, add_units=True, bits=256)
     assert result.dict(exclude={"generator"}) == {
@@ -544,7 +563,7 @@ def test_code_iscc_thumb_extraction_error(jpg_file, monkeypatch):
     def _raise(fp):
         raise idk.IsccThumbExtractionError("simulated failure")
 
-    monkeypatch.setattr(idk, "thumbnail", _raise)
+    monkeypatch.setattr("iscc_sdk.main.thumbnail", _raise)
     result = idk.code_iscc(jpg_file)
     assert "thumbnail" not in result.dict()
 
@@ -555,7 +574,7 @@ def test_code_iscc_thumb_fatal_extraction_error(jpg_file, monkeypatch):
     def _raise(fp):
         raise idk.IsccExtractionError("corrupt source file")
 
-    monkeypatch.setattr(idk, "thumbnail", _raise)
+    monkeypatch.setattr("iscc_sdk.main.thumbnail", _raise)
     with pytest.raises(idk.IsccExtractionError, match="corrupt source file"):
         idk.code_iscc(jpg_file)
 
@@ -564,3 +583,83 @@ def test_code_iscc_explicit_create_thumb_false(jpg_file):
     """Passing create_thumb=False explicitly must not raise TypeError."""
     result = idk.code_iscc(jpg_file, create_thumb=False)
     assert "thumbnail" not in result.dict()
+
+
+def test_code_iscc_batch(jpg_file, png_file):
+    paths = [jpg_file, "does-not-exist", png_file]
+    results = dict(idk.code_iscc_batch(paths, workers=2, create_thumb=False))
+    assert results[jpg_file].iscc == idk.code_iscc(jpg_file, create_thumb=False).iscc
+    assert results[png_file].iscc == idk.code_iscc(png_file, create_thumb=False).iscc
+    assert "thumbnail" not in results[png_file].dict()
+    assert isinstance(results["does-not-exist"], Exception)
+
+
+def test_code_iscc_batch_ordered_backpressure(jpg_file, png_file, bmp_file):
+    paths = [jpg_file, png_file, bmp_file] * 2
+    consumed = []
+
+    def feed():
+        for fp in paths:
+            consumed.append(fp)
+            yield fp
+
+    results = idk.code_iscc_batch(feed(), workers=1, ordered=True, max_inflight=2)
+    fp, meta = next(results)
+    assert fp == jpg_file
+    assert isinstance(meta, idk.IsccMeta)
+    assert len(consumed) <= 3
+    assert [fp for fp, _ in results] == paths[1:]
+
+
+def test_code_iscc_batch_reuses_workers(jpg_file):
+    list(idk.code_iscc_batch([jpg_file], workers=1))
+    executor = idk.batch_executor_get(1)
+    list(idk.code_iscc_batch([jpg_file], workers=1))
+    assert idk.batch_executor_get(1) is executor
+    assert idk.batch_executor_get(2) is not executor
+    idk.executor_shutdown()
+
+
+def test_code_iscc_add_cid(jpg_file):
+    result = idk.code_iscc(jpg_file, add_cid=True, create_thumb=False)
+    assert result.content == f"ipfs://{idk.ipfs_cidv1(jpg_file)}"
+
+
+@pytest.mark.parametrize("bits", [64, 256])
+def test_code_image_batch(jpg_file, png_file, bmp_file, svg_file, png_obj_alpha, bits):
+    items = [jpg_file, png_file, idk.asset_open(bmp_file), svg_file, png_obj_alpha]
+    results = idk.code_image_batch(items, bits=bits)
+    single = dict(extract_meta=False, create_thumb=False, bits=bits)
+    expected = [
+        idk.code_image(fp, **single).iscc for fp in [jpg_file, png_file, bmp_file, svg_file]
+    ]
+    expected.append(il.gen_image_code_v0(idk.image_normalize(png_obj_alpha), bits=bits)["iscc"])
+    assert [result.iscc for result in results] == expected
+
+
+def test_code_image_batch_empty():
+    assert idk.code_image_batch([]) == []
+
+
+def test_code_image_batch_ambiguous():
+    # Flat and blocky images have DCT coefficients equal to their block median
+    flat = Image.new("L", (32, 32), 128)
+    blocky = Image.new("L", (32, 32), 0)
+    blocky.paste(255, (0, 0, 16, 16))
+    results = idk.code_image_batch([flat, blocky])
+    expected = [il.gen_image_code_v0(idk.image_normalize(img))["iscc"] for img in [flat, blocky]]
+    assert [result.iscc for result in results] == expected
+
+
+def test_code_image_batch_random_pixels():
+    rng = random.Random(42)
+    imgs = [Image.frombytes("L", (32, 32), rng.randbytes(1024)) for _ in range(50)]
+    for bits in [32, 96, 128, 192]:
+        results = idk.code_image_batch(imgs, bits=bits)
+        expected = [il.gen_image_code_v0(img.tobytes(), bits=bits)["iscc"] for img in imgs]
+        assert [result.iscc for result in results] == expected
+
+
+def test_code_image_batch_invalid_bits(jpg_file):
+    with pytest.raises(ValueError):
+        idk.code_image_batch([jpg_file], bits=48)
@@ -1,5 +1,6 @@
 from fractions import Fraction
 
+import numpy as np
 from bitarray import bitarray
 
 import iscc_sdk as idk
@@ -661,3 +662,41 @@ def test_read_mp7_signature(mp4_file):
         2,
         2,
     ]
+
+
+def test_decode_mp7_signature(mp4_file):
+    sig = idk.video_mp7sig_extract(mp4_file)
+    result = idk.decode_mp7_signature(sig)
+    assert isinstance(result, mp7.FrameSignatures)
+    assert len(result) == 300
+    assert result.vectors.shape == (300, 380)
+    assert result.vectors.dtype == np.uint8
+    assert result.vectors.max() == 2
+    assert result.confidence[-1] == 77
+    assert result.media_time_unit == 5
+    assert result.elapsed[-1] == 59.8
+    frames = idk.read_mp7_signature(sig)
+    assert [f.elapsed for f in frames] == [f.elapsed for f in result.frames()]
+    assert [f.confidence for f in frames] == result.confidence.tolist()
+    assert (np.stack([f.vector for f in frames]) == result.vectors).all()
+
+
+def test_decode_mp7_signature_empty_frames():
+    header = bitarray(129 + 32 + 16 + 1 + 32 + 32 + 32 + 1)
+    header.setall(0)
+    header[129 + 32 : 129 + 32 + 16] = bitarray(format(90000, "016b")[-16:])
+    result = idk.decode_mp7_signature(header.tobytes())
+    assert len(result) == 0
+    assert result.vectors.shape == (0, 380)
+    assert result.frames() == []
+
+
+def test_frame_signatures_from_frames_concat(mp4_file):
+    signatures = idk.decode_mp7_signature(idk.video_mp7sig_extract(mp4_file))
+    rebuilt = mp7.FrameSignatures.from_frames(signatures.frames())
+    assert rebuilt.media_time_unit == 5
+    assert (rebuilt.media_time == signatures.media_time).all()
+    assert (rebuilt.vectors == signatures.vectors).all()
+    combined = mp7.FrameSignatures.concat([signatures, rebuilt])
+    assert len(combined) == 600
+    assert combined.vectors.shape == (600, 380)
@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 from iscc_samples import images
 from PIL import Image
@@ -74,3 +76,73 @@ def test_sdk_options_override_multiple_fields():
 
     # Reset Image.MAX_IMAGE_PIXELS
     Image.MAX_IMAGE_PIXELS = idk.sdk_opts.image_max_pixels
+
+
+def test_sdk_options_snapshot_frozen_hashable():
+    opts = idk.sdk_opts.override({"bits": 128})
+    assert isinstance(opts, idk.SdkOptionsSnapshot)
+    assert hash(opts) == hash(idk.sdk_opts.override({"bits": 128}))
+    assert opts == idk.sdk_opts.override({"bits": 128})
+    with pytest.raises(Exception):  # noqa: B017
+        opts.bits = 64
+
+
+def test_sdk_options_snapshot_override_unchanged():
+    opts = idk.sdk_opts.override({"bits": 128})
+    assert opts.override() is opts
+    assert opts.override({"bits": 128}) is opts
+    other = opts.override({"bits": 256})
+    assert other.bits == 256
+    assert opts.bits == 128
+
+
+def test_opts_scope_nested():
+    assert idk.opts_get() is idk.sdk_opts
+    with idk.opts_scope(bits=128) as outer:
+        assert idk.opts_get() is outer
+        with idk.opts_scope(granular=True) as inner:
+            assert inner.bits == 128
+            assert inner.granular is True
+            assert idk.opts_get() is inner
+        assert idk.opts_get() is outer
+    assert idk.opts_get() is idk.sdk_opts
+
+
+def test_opts_scope_invalid_field():
+    with pytest.raises(ValueError, match="Invalid field: invalid_field"):
+        with idk.opts_scope(invalid_field=True):
+            pass  # pragma: no cover
+
+
+def test_opts_scope_thread_isolation():
+    seen = []
+    with idk.opts_scope(bits=128):
+        thread = threading.Thread(target=lambda: seen.append(idk.opts_get().bits))
+        thread.start()
+        thread.join()
+        assert idk.opts_get().bits == 128
+    assert seen == [idk.sdk_opts.bits]
+
+
+def test_opts_scope_executor_submit():
+    with idk.opts_scope(bits=128):
+        assert idk.executor_submit(lambda: idk.opts_get().bits).result() == 128
+
+
+def test_opts_scope_applies_to_helpers():
+    with idk.opts_scope(image_thumbnail_size=32):
+        assert max(idk.image_thumbnail(fp).size) == 32
+    assert max(idk.image_thumbnail(fp).size) == idk.sdk_opts.image_thumbnail_size
+
+
+def test_code_options_apply_to_helpers():
+    small = idk.code_image(fp, image_thumbnail_size=32)
+    large = idk.code_image(fp)
+    assert len(small.thumbnail) < len(large.thumbnail)
+    assert idk.opts_get() is idk.sdk_opts
+
+
+def test_code_options_scope_and_kwargs():
+    with idk.opts_scope(bits=128):
+        assert len(idk.code_image(fp, create_thumb=False).iscc) > 20
+        assert idk.code_image(fp, create_thumb=False, bits=64).iscc == "ISCC:EEA4GQZQTY6J5DTH"
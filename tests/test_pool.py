@@ -0,0 +1,91 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import iscc_sdk as idk
+
+
+@pytest.fixture
+def pool():
+    idk.executor_shutdown()
+    yield
+    idk.executor_shutdown()
+
+
+def test_executor_get_reused(pool):
+    executor = idk.executor_get()
+    assert isinstance(executor, ThreadPoolExecutor)
+    assert idk.executor_get() is executor
+
+
+def test_executor_get_pool_workers(pool, monkeypatch):
+    monkeypatch.setattr(idk.sdk_opts, "pool_workers", 3)
+    assert idk.executor_get()._max_workers == 3
+
+
+def test_executor_shutdown_recreates(pool):
+    executor = idk.executor_get()
+    idk.executor_shutdown()
+    assert executor._shutdown
+    new = idk.executor_get()
+    assert new is not executor
+    assert new.submit(sum, [1, 2]).result() == 3
+
+
+def test_executor_set_custom(pool):
+    owned = idk.executor_get()
+    with ThreadPoolExecutor(max_workers=1) as custom:
+        idk.executor_set(custom)
+        assert owned._shutdown
+        assert idk.executor_get() is custom
+        idk.executor_shutdown()
+        assert not custom._shutdown
+        assert idk.executor_get() is not custom
+    idk.executor_set(None)
+    assert idk.executor_get() is not custom
+
+
+def test_executor_set_process_pool(pool):
+    owned = idk.executor_get()
+    with ProcessPoolExecutor(max_workers=1) as custom:
+        with pytest.raises(TypeError):
+            idk.executor_set(custom)
+    assert idk.executor_get() is owned
+
+
+def test_executor_nested_inline(pool, monkeypatch):
+    monkeypatch.setattr(idk.sdk_opts, "pool_workers", 1)
+
+    def nested():
+        inner = idk.executor_get()
+        return inner.submit(lambda: 42).result(timeout=5)
+
+    assert idk.executor_get().submit(nested).result(timeout=10) == 42
+
+
+def test_executor_inline_exception(pool):
+    def nested():
+        return idk.executor_get().submit(lambda: 1 / 0)
+
+    future = idk.executor_get().submit(nested).result()
+    assert isinstance(future.exception(), ZeroDivisionError)
+
+
+def test_batch_executor_workers(pool):
+    executor = idk.batch_executor_get(2)
+    assert executor.workers == 2
+    assert idk.batch_executor_get(2) is executor
+
+
+def test_batch_executor_recreated_when_broken(pool):
+    executor = idk.batch_executor_get(1)
+    with pytest.raises(BrokenProcessPool):
+        executor.submit(os._exit, 1).result()
+    assert executor.broken
+    with pytest.raises(BrokenProcessPool):
+        executor.submit(sum, [1, 2])
+    new = idk.batch_executor_get(1)
+    assert new is not executor
+    assert new.submit(sum, [1, 2]).result() == 3
@@ -0,0 +1,89 @@
+import pytest
+
+import iscc_sdk as idk
+
+
+@pytest.fixture
+def stages():
+    calls = []
+
+    def hook(name, duration, nbytes):
+        calls.append((name, duration, nbytes))
+
+    idk.stage_hook_add(hook)
+    yield calls
+    idk.stage_hook_remove(hook)
+
+
+def test_stage_disabled_is_shared_noop():
+    assert idk.stage("a") is idk.stage("b")
+
+
+def test_stage_hook(stages):
+    with idk.stage("a", 10):
+        pass
+    assert [(name, nbytes) for name, _, nbytes in stages] == [("a", 10)]
+    assert stages[0][1] >= 0
+
+
+def test_stage_hook_add_remove(stages):
+    hook = stages.append
+    idk.stage_hook_add(hook)
+    idk.stage_hook_add(hook)
+    idk.stage_hook_remove(hook)
+    idk.stage_hook_remove(hook)
+    with idk.stage("a"):
+        pass
+    assert len(stages) == 1
+
+
+def test_stage_hook_failure_ignored(stages):
+    def broken(name, duration, nbytes):
+        raise RuntimeError("broken")
+
+    idk.stage_hook_add(broken)
+    try:
+        with idk.stage("a"):
+            pass
+    finally:
+        idk.stage_hook_remove(broken)
+    assert len(stages) == 1
+
+
+def test_stage_timings_nested():
+    with idk.stage_timings() as outer:
+        with idk.stage("a"):
+            pass
+        with idk.stage_timings() as inner:
+            with idk.stage("b"):
+                pass
+            with idk.stage("b"):
+                pass
+    assert set(outer) == {"a", "b"}
+    assert set(inner) == {"b"}
+    assert outer["b"] == inner["b"]
+    assert idk.stage("c") is idk.stage("d")
+
+
+def test_stage_timings_executor_submit():
+    def work():
+        with idk.stage("work"):
+            pass
+
+    with idk.stage_timings() as timings:
+        idk.executor_submit(work).result()
+    assert "work" in timings
+
+
+def test_code_iscc_stages(stages, jpg_file):
+    result = idk.code_iscc(jpg_file)
+    assert result.timings is None
+    names = [name for name, _, _ in stages]
+    assert names == ["sniff", "thumbnail", "sum", "content", "meta"]
+    assert {name: nbytes for name, _, nbytes in stages}["sum"] == result.filesize
+
+
+def test_code_iscc_add_timings(mp4_file):
+    result = idk.code_iscc(mp4_file, add_timings=True, extract_meta=False, create_meta=False)
+    assert {"sniff", "video_decode", "sum", "content", "ffmpeg"} <= set(result.timings)
+    assert "timings" not in result.dict()
@@ -68,6 +68,45 @@ def test_text_extract_docx(docx_file):
     assert text.strip().startswith("ISCC Test Document")
 
 
+def test_text_parse_docx(docx_file):
+    text, meta = idk.text_parse(docx_file)
+    assert text.strip().startswith("ISCC Test Document")
+    assert meta == {"creator": "titusz", "name": "title from metadata"}
+
+
+def _count_tika_parses(monkeypatch):
+    from iscc_tika import Extractor
+
+    calls = []
+    orig = Extractor.extract_file_to_string
+
+    def counting_extract(self, filename):
+        calls.append(filename)
+        return orig(self, filename)
+
+    monkeypatch.setattr(Extractor, "extract_file_to_string", counting_extract)
+    return calls
+
+
+def test_text_parse_single_tika_pass(docx_file, monkeypatch):
+    calls = _count_tika_parses(monkeypatch)
+    idk.text_parse(docx_file)
+    assert len(calls) == 1
+
+
+def test_code_iscc_single_tika_pass(docx_file, monkeypatch):
+    calls = _count_tika_parses(monkeypatch)
+    result = idk.code_iscc(docx_file)
+    assert result.name == "title from metadata"
+    assert len(calls) == 1
+
+
+def test_code_text_single_tika_pass(docx_file, monkeypatch):
+    calls = _count_tika_parses(monkeypatch)
+    idk.code_text(docx_file)
+    assert len(calls) == 1
+
+
 def test_text_name_from_uri_str(jpg_file):
     assert idk.text_name_from_uri("http://example.com") == "example"
     assert idk.text_name_from_uri("http://example.com/some-file.txt") == "some file"
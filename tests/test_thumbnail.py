@@ -17,3 +17,11 @@ def test_thumbnail_wav(wav_file):
 
 def test_thumbnail_mp4(mp4_file):
     assert isinstance(idk.thumbnail(mp4_file), Image)
+
+
+def test_thumbnail_not_shadowed_by_submodule(jpg_file):
+    from iscc_sdk.main import code_iscc_mt
+
+    assert code_iscc_mt(jpg_file).thumbnail
+    assert callable(idk.thumbnail)
+    assert idk.code_iscc(jpg_file).thumbnail
@@ -1,9 +1,15 @@
+import io
 import os
+import subprocess
+import threading
 from pathlib import Path
 
+import pytest
 from PIL import Image
 
 import iscc_sdk as idk
+from iscc_sdk import tools, video
+from iscc_sdk.video import video_meta_extract_ffmpeg
 
 meta = idk.IsccMeta(
     name="Hello",
@@ -119,10 +125,260 @@ def test_video_mp7sig_extract_scenes_detected(mp4_file):
     assert scenes == [7.625, 10.125, 15.208, 36.0, 38.458, 39.958, 46.625, 60.0]
 
 
+def test_video_extract(mp4_file):
+    extracted = idk.video_extract(mp4_file, scenes=True)
+    assert extracted["mp7sig"] == idk.video_mp7sig_extract(mp4_file)
+    assert video._video_cutpoints(*extracted["scenes"], 0.2) == [
+        7.625, 10.125, 15.208, 36.0, 38.458, 39.958, 46.625, 60.0,
+    ]  # fmt: skip
+    assert Image.open(io.BytesIO(extracted["thumbnail"])).width == 128
+    assert extracted["ffmetadata"].startswith(";FFMETADATA1")
+
+
+def test_video_extract_minimal(mp4_file):
+    extracted = idk.video_extract(mp4_file, thumbnail=False, metadata=False)
+    assert extracted["mp7sig"][-32:].hex() == (
+        "9ef43526febb8d3e674975584ad6812ccc144cba28b3e134cd173888449cf51e"
+    )
+    assert extracted["scenes"] is None
+    assert extracted["thumbnail"] is None
+    assert extracted["ffmetadata"] is None
+
+
+def test_video_extract_reused(mp4_file, monkeypatch):
+    expected_meta = video_meta_extract_ffmpeg(mp4_file)
+    asset = idk.asset_open(mp4_file)
+    idk.video_extract(asset, scenes=True)
+
+    def fail(*args):
+        raise AssertionError("unexpected ffmpeg run")
+
+    monkeypatch.setattr(idk, "run_ffmpeg", fail)
+    monkeypatch.setattr(idk, "run_ffmpeg_pipes", fail)
+    assert isinstance(idk.video_thumbnail(asset), Image.Image)
+    assert video_meta_extract_ffmpeg(asset) == expected_meta
+    sig = idk.video_mp7sig_extract(asset)
+    assert idk.video_mp7sig_extract_scenes(asset, scene_limit=0.2) == (
+        sig, [7.625, 10.125, 15.208, 36.0, 38.458, 39.958, 46.625, 60.0],
+    )  # fmt: skip
+
+
+def test_code_video_single_ffmpeg_run(mp4_file, monkeypatch):
+    monkeypatch.setattr(idk.sdk_opts, "extract_meta", False)
+    calls = []
+    orig, orig_pipes = idk.run_ffmpeg, idk.run_ffmpeg_pipes
+
+    def counting_run(args):
+        calls.append(args)
+        return orig(args)
+
+    def counting_run_pipes(args, readers):
+        calls.append(args)
+        return orig_pipes(args, readers)
+
+    monkeypatch.setattr(idk, "run_ffmpeg", counting_run)
+    monkeypatch.setattr(idk, "run_ffmpeg_pipes", counting_run_pipes)
+    meta = idk.code_video(mp4_file)
+    assert meta.iscc == "ISCC:EMAV4DUD6QORW4X4"
+    assert meta.thumbnail.startswith("data:image/webp")
+    assert len(calls) == 1
+
+
+def test_code_video_single_pass_fallback(mp4_file, monkeypatch):
+    monkeypatch.setattr(idk.sdk_opts, "extract_meta", False)
+    monkeypatch.setattr(idk.sdk_opts, "create_thumb", False)
+
+    def fail(fp, **kwargs):
+        raise subprocess.CalledProcessError(1, "ffmpeg")
+
+    monkeypatch.setattr(idk, "video_extract", fail)
+    meta = idk.code_video(mp4_file)
+    assert meta.dict() == {"iscc": "ISCC:EMAV4DUD6QORW4X4"}
+
+
+def test_code_video_single_pass_error_raised(mp4_file, monkeypatch):
+    def fail(fp, **kwargs):
+        raise RuntimeError("bug")
+
+    monkeypatch.setattr(idk, "video_extract", fail)
+    with pytest.raises(RuntimeError):
+        idk.code_video(mp4_file)
+
+
+def test_video_extract_metadata_only(mp4_file):
+    extracted = idk.video_extract(mp4_file, thumbnail=False, signature=False)
+    assert extracted["mp7sig"] is None
+    assert extracted["ffmetadata"].startswith(";FFMETADATA1")
+
+
+def test_video_duration(mp4_file, monkeypatch):
+    calls = []
+
+    def ffprobe(args):
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, "60.040000\n", "")
+
+    monkeypatch.setattr(idk, "run_ffprobe", ffprobe)
+    assert video._video_duration(mp4_file) == 60.04
+    assert calls[0][-1] == Path(mp4_file)
+    assert "format=duration" in calls[0]
+
+
+def test_video_ranges():
+    assert video._video_ranges(59.9, 4) == [(0, None)]
+    assert video._video_ranges(150.5, 4) == [(0, 76), (76, None)]
+    assert video._video_ranges(7200.0, 4) == [(0, 1800), (1800, 1800), (3600, 1800), (5400, None)]
+    assert video._video_ranges(7200.0, 1) == [(0, None)]
+
+
+def test_video_frames_extract_parallel(mp4_file, monkeypatch):
+    monkeypatch.setattr(video, "VIDEO_SEGMENT_MIN", 10)
+    monkeypatch.setattr(video, "_video_duration", lambda fp: 60.04)
+    sig, expected = idk.video_mp7sig_extract_scenes(mp4_file, scene_limit=0.2)
+    signatures, scenes = idk.video_frames_extract_parallel(
+        mp4_file, scenes=True, scene_limit=0.2, workers=4
+    )
+    assert scenes == expected
+    seq_signatures = idk.decode_mp7_signature(sig)
+    assert len(signatures) == 300
+    assert (signatures.media_time == seq_signatures.media_time).all()
+    assert (signatures.vectors == seq_signatures.vectors).all()
+
+
+def test_video_frames_extract_parallel_short(mp4_file, monkeypatch):
+    monkeypatch.setattr(video, "_video_duration", lambda fp: 60.04)
+    signatures, scenes = idk.video_frames_extract_parallel(mp4_file, workers=4)
+    assert len(signatures) == 300
+    assert scenes == []
+    signatures, scenes = idk.video_frames_extract_parallel(
+        mp4_file, scenes=True, scene_limit=0.2, workers=4
+    )
+    assert len(signatures) == 300
+    assert scenes == [7.625, 10.125, 15.208, 36.0, 38.458, 39.958, 46.625, 60.0]
+
+
+def test_video_frames_extract_parallel_shared_pool(mp4_file, monkeypatch):
+    monkeypatch.setattr(video, "VIDEO_SEGMENT_MIN", 10)
+    monkeypatch.setattr(video, "_video_duration", lambda fp: 60.04)
+    threads = []
+    range_extract = video._video_range_extract
+
+    def record(*args, **kwargs):
+        threads.append(threading.current_thread().name)
+        return range_extract(*args, **kwargs)
+
+    monkeypatch.setattr(video, "_video_range_extract", record)
+    signatures, _ = idk.video_frames_extract_parallel(mp4_file, workers=4)
+    assert len(signatures) == 300
+    assert len(threads) == 4
+    assert all(name.startswith("iscc-sdk") for name in threads)
+    # Nested in a pool task the ranges run inline (no extra threads)
+    threads.clear()
+    future = idk.executor_submit(idk.video_frames_extract_parallel, mp4_file, workers=4)
+    assert len(future.result()[0]) == 300
+    assert len(set(threads)) == 1
+
+
+def test_code_video_parallel(mp4_file, monkeypatch):
+    monkeypatch.setattr(video, "VIDEO_SEGMENT_MIN", 10)
+    monkeypatch.setattr(video, "_video_duration", lambda fp: 60.04)
+    monkeypatch.setattr(idk.sdk_opts, "extract_meta", False)
+    monkeypatch.setattr(idk.sdk_opts, "create_thumb", False)
+    monkeypatch.setattr(idk.sdk_opts, "video_scene_limit", 0.2)
+    expected = idk.code_video(mp4_file, granular=True)
+    meta = idk.code_video(mp4_file, video_workers=4, granular=True)
+    assert meta.iscc == "ISCC:EMAV4DUD6QORW4X4"
+    assert meta.features == expected.features
+
+
+def test_video_compute_granular_frames(mp4_file):
+    signatures = idk.decode_mp7_signature(idk.video_mp7sig_extract(mp4_file))
+    scenes = [0.2, 15.208, 36.0, 59.8, 60.0]
+    granular = idk.video_compute_granular(signatures, scenes)
+    assert granular == idk.video_compute_granular(signatures.frames(), scenes)
+    assert granular["sizes"] == [0.2, 15.008, 20.792, 23.8]
+
+
+def test_video_compute_granular_no_scenes(mp4_file):
+    signatures = idk.decode_mp7_signature(idk.video_mp7sig_extract(mp4_file))
+    granular = idk.video_compute_granular(signatures, [60.0])
+    assert granular["sizes"] == [59.8]
+    assert len(granular["simprints"]) == 1
+
+
+def test_code_video_fast_decode(mp4_file, monkeypatch):
+    monkeypatch.setattr(idk.sdk_opts, "video_fast_decode", True)
+    meta = idk.code_video(mp4_file, extract_meta=False, create_thumb=False)
+    # 1 bit distance to default Video-Code ISCC:EMAV4DUD6QORW4X4
+    assert meta.iscc == "ISCC:EMAV4DUD6QORW4X5"
+
+
+def test_video_extract_fast_decode_not_reused(mp4_file, monkeypatch):
+    asset = idk.asset_open(mp4_file)
+    idk.video_extract(asset, thumbnail=False, metadata=False)
+    assert video._video_extracted(asset, "mp7sig") is not None
+    monkeypatch.setattr(idk.sdk_opts, "video_fast_decode", True)
+    assert video._video_extracted(asset, "mp7sig") is None
+
+
+@pytest.mark.parametrize(
+    "option, value",
+    [
+        ("image_thumbnail_size", 64),
+        ("image_thumbnail_quality", 10),
+        ("image_thumbnail_format", "JPEG"),
+    ],
+)
+def test_video_extract_thumbnail_options_not_reused(mp4_file, monkeypatch, option, value):
+    asset = idk.asset_open(mp4_file)
+    idk.video_extract(asset, signature=False, metadata=False)
+    assert video._video_extracted(asset, "thumbnail") is not None
+    monkeypatch.setattr(idk.sdk_opts, option, value)
+    assert video._video_extracted(asset, "thumbnail") is None
+    if option == "image_thumbnail_size":
+        assert idk.video_thumbnail(asset).width == 64
+
+
+def test_video_thumbnail_keyframes(mp4_file, monkeypatch):
+    monkeypatch.setattr(idk.sdk_opts, "video_keyframe_thumbnail", True)
+    thumb = idk.video_thumbnail(mp4_file)
+    assert isinstance(thumb, Image.Image)
+    assert thumb.width == 128
+
+
+def test_code_video_keyframe_thumbnail(mp4_file, monkeypatch):
+    monkeypatch.setattr(idk.sdk_opts, "extract_meta", False)
+    monkeypatch.setattr(idk.sdk_opts, "video_keyframe_thumbnail", True)
+    asset = idk.asset_open(mp4_file)
+    meta = idk.code_video(asset)
+    assert asset.cache["video"]["thumbnail"] is None
+    assert meta.thumbnail.startswith("data:image/webp")
+
+
 def test_video_parse_scenes_empty():
     assert idk.video_parse_scenes(" ") == []
 
 
+def test_video_parse_scenes_lines():
+    text = (
+        "frame:0    pts:0       pts_time:0\n"
+        "lavfi.scene_score=0.000000\n"
+        "frame:1    pts:512     pts_time:0.041667\n"
+        "lavfi.scene_score=0.500000\n"
+        "frame:2    pts:1024    pts_time:0.083333\n"
+        "lavfi.scene_score=0.010000\n"
+    )
+    assert idk.video_parse_scenes(text) == [0.083]
+    assert idk.video_parse_scenes(iter(text.splitlines(keepends=True))) == [0.083]
+
+
+def test_video_mp7sig_extract_scenes_tempfiles(mp4_file, monkeypatch):
+    monkeypatch.setattr(tools, "FFMPEG_PIPES", False)
+    sig, scenes = idk.video_mp7sig_extract_scenes(mp4_file, scene_limit=0.2)
+    assert sig[-32:].hex() == "9ef43526febb8d3e674975584ad6812ccc144cba28b3e134cd173888449cf51e"
+    assert scenes == [7.625, 10.125, 15.208, 36.0, 38.458, 39.958, 46.625, 60.0]
+
+
 def test_video_features_extract(mp4_file):
     features = idk.video_features_extract(mp4_file)
     assert features[0][:20] == (0, 0, 1, 0, 0, 0, 1, 1, 1, 1, 0, 0, 1, 1, 0, 0, 0, 0, 0, 0)